@@ -7,8 +7,11 @@ from ravelights import (
     ColorProfiles,
     DeviceLightConfig,
     LightIdentifier,
+    PipeAudioSource,
     RaveLightsApp,
+    RaveLightsMultiProcessApp,
     TransmitterConfig,
+    WavFileAudioSource,
 )
 
 # ─── Logging ──────────────────────────────────────────────────────────────────
@@ -29,12 +32,29 @@ def parse_args():
     parser.add_argument("--artnet-serial-baudrate", type=int, default=3_000_000)
     parser.add_argument("--webui", default=True, action=argparse.BooleanOptionalAction)
     parser.add_argument("--visualizer", default=True, action=argparse.BooleanOptionalAction)
+    parser.add_argument(
+        "--visualizer-fps",
+        type=float,
+        default=None,
+        help="Draw the visualizer at a reduced frame rate in the idle time of the render loop (default: every frame)",
+    )
+    parser.add_argument(
+        "--interface-backend", type=str, default="flask", choices=["flask", "asgi"], help="Server for the web interface"
+    )
+    parser.add_argument(
+        "--multiprocess",
+        default=False,
+        action=argparse.BooleanOptionalAction,
+        help="Run the render loop in its own process, separate from the web interface and the outputs",
+    )
+    audio_group = parser.add_mutually_exclusive_group()
+    audio_group.add_argument("--audio-file", type=str, default=None, help="Beat tracking from a wav file")
+    audio_group.add_argument("--audio-device", type=str, default=None, help="Beat tracking from an audio input")
+    audio_group.add_argument("--audio-pipe", default=False, action=argparse.BooleanOptionalAction)
     args = parser.parse_args()
     return args
 
 
-args = parse_args()
-
 
 # ─── Device Config ────────────────────────────────────────────────────────────
 
@@ -73,74 +93,103 @@ laser_cage_light_mapping: list[list[LightIdentifier]] = [
     [],
 ]
 
-transmitter_recipes: list[TransmitterConfig] = []
-
 
-if args.artnet_wifi:
-    # Ravelights
-    box_hostname = "pixeldriver-box"
-    ravelights_box_recipe = TransmitterConfig(
-        transmitter=ArtnetUdpTransmitter(ip_address=None),
-        light_mapping_config=ravelights_box_light_mapping,
-        hostname=box_hostname,
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+
+def main():
+    args = parse_args()
+
+    transmitter_recipes: list[TransmitterConfig] = []
+
+    if args.artnet_wifi:
+        # Ravelights
+        box_hostname = "pixeldriver-box"
+        ravelights_box_recipe = TransmitterConfig(
+            transmitter=ArtnetUdpTransmitter(ip_address=None),
+            light_mapping_config=ravelights_box_light_mapping,
+            hostname=box_hostname,
+        )
+        transmitter_recipes.append(ravelights_box_recipe)
+
+        # Laser Cage
+        lasercage_hostname = "pixeldriver-lasercage"
+        laser_cage_recipe = TransmitterConfig(
+            transmitter=ArtnetUdpTransmitter(ip_address=None),
+            light_mapping_config=laser_cage_light_mapping,
+            hostname=lasercage_hostname,
+        )
+        transmitter_recipes.append(laser_cage_recipe)
+
+    if args.artnet_serial:
+        # import here because of serial dependency
+        from ravelights import ArtnetSerialTransmitter
+
+        box_hostname = "ravelights-box"
+        transmitter_recipe = TransmitterConfig(
+            transmitter=ArtnetSerialTransmitter(
+                serial_port_address=args.artnet_serial_port, baud_rate=args.artnet_serial_baudrate
+            ),
+            light_mapping_config=ravelights_box_light_mapping,
+            hostname=box_hostname,
+        )
+        transmitter_recipes.append(transmitter_recipe)
+
+    # ─── Audio Beat Tracking ──────────────────────────────────────────────────────
+
+    audio_source = None
+    if args.audio_file:
+        audio_source = WavFileAudioSource(args.audio_file, loop=True)
+    elif args.audio_device:
+        # import here because of sounddevice dependency
+        from ravelights import DeviceAudioSource
+
+        device = int(args.audio_device) if args.audio_device.isdigit() else args.audio_device
+        audio_source = DeviceAudioSource(device=device)
+    elif args.audio_pipe:
+        # raw pcm, 16 bit, mono, 44100 Hz, for example: arecord -f S16_LE -r 44100 -c 1 | python main.py --audio-pipe
+        audio_source = PipeAudioSource()
+
+    # ─── Webui Port ───────────────────────────────────────────────────────────────
+
+    """
+    Case A (default)
+    --webui
+    web static via flask @ port 80
+    rest via flask @ port 80
+
+    Case B
+    --no-webui
+    web dynamic via quasar dev @ port 80
+    rest via flask @ port 5000
+
+    Case C
+    --no-webui
+    web static via nginx @ port 80
+    rest via flask @ port 5000
+    """
+
+    webui_port = 80
+    if not args.webui:
+        webui_port = 5000
+        logger.info(
+            "Running flask on port 5000, such that the web interface can be served by quasar or nginx on port 80"
+        )
+
+    # the render loop runs in its own process with --multiprocess, the process imports this module again
+    app_class = RaveLightsMultiProcessApp if args.multiprocess else RaveLightsApp
+    app_class(
+        device_config=device_config,
+        fps=args.fps,
+        webui_port=webui_port,
+        serve_webui=args.webui,
+        interface_backend=args.interface_backend,
+        transmitter_recipes=transmitter_recipes,
+        use_visualizer=args.visualizer,
+        visualizer_fps=args.visualizer_fps,
+        audio_source=audio_source,
     )
-    transmitter_recipes.append(ravelights_box_recipe)
-
-    # Laser Cage
-    lasercage_hostname = "pixeldriver-lasercage"
-    laser_cage_recipe = TransmitterConfig(
-        transmitter=ArtnetUdpTransmitter(ip_address=None),
-        light_mapping_config=laser_cage_light_mapping,
-        hostname=lasercage_hostname,
-    )
-    transmitter_recipes.append(laser_cage_recipe)
-
 
-if args.artnet_serial:
-    # import here because of serial dependency
-    from ravelights import ArtnetSerialTransmitter
-
-    box_hostname = "ravelights-box"
-    transmitter_recipe = TransmitterConfig(
-        transmitter=ArtnetSerialTransmitter(
-            serial_port_address=args.artnet_serial_port, baud_rate=args.artnet_serial_baudrate
-        ),
-        light_mapping_config=ravelights_box_light_mapping,
-        hostname=box_hostname,
-    )
-    transmitter_recipes.append(transmitter_recipe)
 
-
-# ─── Webui Port ───────────────────────────────────────────────────────────────
-
-"""
-Case A (default)
---webui
-web static via flask @ port 80
-rest via flask @ port 80
-
-Case B
---no-webui
-web dynamic via quasar dev @ port 80
-rest via flask @ port 5000
-
-Case C
---no-webui
-web static via nginx @ port 80
-rest via flask @ port 5000
-"""
-
-webui_port = 80
-if not args.webui:
-    webui_port = 5000
-    logger.info("Running flask on port 5000, such that the web interface can be served by quasar or nginx on port 80")
-
-
-app = RaveLightsApp(
-    device_config=device_config,
-    fps=args.fps,
-    webui_port=webui_port,
-    serve_webui=args.webui,
-    transmitter_recipes=transmitter_recipes,
-    use_visualizer=args.visualizer,
-)
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 from ravelights.core.custom_typing import LightIdentifier, TransmitterConfig
 from ravelights.core.device_shared import DeviceLightConfig
 from ravelights.core.ravelights_app import RaveLightsApp
+from ravelights.core.render_process import RaveLightsMultiProcessApp
 from ravelights.devtools.profiler import Profiler
 from ravelights.interface.artnet.artnet_udp_transmitter import ArtnetUdpTransmitter
+from ravelights.interface.audio.audio_source import PipeAudioSource, RawFileAudioSource, WavFileAudioSource
 from ravelights.interface.color_remap import ColorProfiles
 
 try:
@@ -10,8 +12,14 @@ try:
 except Exception:
     pass
 
+try:
+    from ravelights.interface.audio.audio_device_source import DeviceAudioSource
+except Exception:
+    pass
+
 __all__ = [
     "RaveLightsApp",
+    "RaveLightsMultiProcessApp",
     "DeviceLightConfig",
     "LightIdentifier",
     "Profiler",
@@ -19,4 +27,8 @@ __all__ = [
     "ArtnetUdpTransmitter",
     "ArtnetSerialTransmitter",
     "ColorProfiles",
+    "WavFileAudioSource",
+    "RawFileAudioSource",
+    "PipeAudioSource",
+    "DeviceAudioSource",
 ]
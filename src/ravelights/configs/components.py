@@ -19,66 +19,7 @@ from ravelights.core.generator_super import (
 )
 from ravelights.core.template_objects import EffectSelectorPlacing, GenPlacing, GenSelector
 from ravelights.core.utils import StrEnum
-from ravelights.dimmers.dimmer_decay_fast import DimmerDecayFast
-from ravelights.dimmers.dimmer_decay_medium import DimmerDecayMedium
-from ravelights.dimmers.dimmer_decay_slow import DimmerDecaySlow
-from ravelights.dimmers.dimmer_decay_very_fast import DimmerDecayVeryFast
-from ravelights.dimmers.dimmer_decay_very_slow import DimmerDecayVerySlow
-from ravelights.dimmers.dimmer_peak import DimmerPeak
-from ravelights.dimmers.dimmer_random_remove import DimmerRandomRemove
-from ravelights.dimmers.dimmer_sideswipe import DimmerSideswipe
-from ravelights.dimmers.dimmer_sine import DimmerSine
-from ravelights.effects.effect_color_shift import EffectColorShift
-from ravelights.effects.effect_color_strobe import EffectColorStrobe
-from ravelights.effects.effect_color_strobe_rainbow import EffectColorStrobeRainbow
-from ravelights.effects.effect_color_strobe_rainbow_pixel import EffectColorStrobeRainbowPixel
-from ravelights.effects.effect_color_swap import EffectColorSwap
-from ravelights.effects.effect_colorize import EffectColorize
-from ravelights.effects.effect_flicker import EffectFlicker
-from ravelights.effects.effect_frameskip import EffectFrameskip
 from ravelights.effects.effect_super import Effect
-from ravelights.patterns.pattern_debug_bpm_sync import PatternDebugBPMSync
-from ravelights.patterns.pattern_debug_gradient import PatternDebugGradient
-from ravelights.patterns.pattern_debug_linear_block import PatternDebugLinearBlock
-from ravelights.patterns.pattern_debug_solid_color import PatternDebugSolidColor
-from ravelights.patterns.pattern_double_strobe import PatternDoubleStrobe
-from ravelights.patterns.pattern_gradient import PatternGradient
-from ravelights.patterns.pattern_hor_stripes import PatternHorStripes
-from ravelights.patterns.pattern_inverse_square import PatternInerseSquare
-from ravelights.patterns.pattern_meteor import PatternMeteor
-from ravelights.patterns.pattern_moving_blocks import PatternMovingBlocks
-from ravelights.patterns.pattern_movingstrobe_fast import PatternMovingStrobeFast
-from ravelights.patterns.pattern_movingstrobe_slow import PatternMovingStrobeSlow
-from ravelights.patterns.pattern_pid import PatternPID
-from ravelights.patterns.pattern_pid_inverse import PatternPIDInverse
-from ravelights.patterns.pattern_pid_splash import PatternPidSplash
-from ravelights.patterns.pattern_rain import PatternRain
-from ravelights.patterns.pattern_random_stripes import PatternRandomStripes
-from ravelights.patterns.pattern_shadow import PatternShadow
-from ravelights.patterns.pattern_shadow_big import PatternShadowBig
-from ravelights.patterns.pattern_sin_overlay import PatternSinOverlay
-from ravelights.patterns.pattern_sinwave import PatternSinwave
-from ravelights.patterns.pattern_sinwave_squares import PatternSinwaveSquares
-from ravelights.patterns.pattern_solid_color import PatternSolidColor
-from ravelights.patterns.pattern_strobespawner import PatternStrobeSpawner
-from ravelights.patterns.pattern_swiper import PatternSwiper
-from ravelights.thinners.thinner_equidistant import ThinnerEquidistant
-from ravelights.thinners.thinner_random import ThinnerRandom
-from ravelights.thinners.thinner_random_pattern import ThinnerRandomPattern
-from ravelights.vfilters.vfilter_all_first import VfilterMapAllFirst
-from ravelights.vfilters.vfilter_bw import VfilterBW
-from ravelights.vfilters.vfilter_edgedetect import VfilterEdgedetect
-from ravelights.vfilters.vfilter_flipped_color_fuse import VfilterFlippedColorFuse
-from ravelights.vfilters.vfilter_flipver import VfilterFlipVer
-from ravelights.vfilters.vfilter_map_propagate import VfilterMapPropagate
-from ravelights.vfilters.vfilter_mirror import VfilterMirrorVer
-from ravelights.vfilters.vfilter_mirror_hor import VfilterMirrorHor
-from ravelights.vfilters.vfilter_random_blackout import VfilterRandomBlackout
-from ravelights.vfilters.vfilter_reverb import VfilterReverb
-from ravelights.vfilters.vfilter_rgb_shift import VfilterRgbShift
-from ravelights.vfilters.vfilter_roll_overlay import VfilterRollOverlay
-from ravelights.vfilters.vfilter_some_first import VfilterMapSomeFirst
-from ravelights.vfilters.vfilter_time_delay import VfilterTimeDelay
 
 
 class Keywords(StrEnum):
@@ -95,6 +36,7 @@ class Keywords(StrEnum):
 
 
 # ─── Blueprint Section ────────────────────────────────────────────────────────
+# generators and effects are referenced by their dotted path and only imported when they are first created
 # fmt: off
 
 K = Keywords
@@ -104,82 +46,84 @@ blueprint_generators: list[BlueprintGen] = [
     BlueprintGen(VfilterNone, dict(name="v_none", weight=0)),
     BlueprintGen(ThinnerNone, dict(name="t_none", weight=0)),
     BlueprintGen(DimmerNone, dict(name="d_none", weight=0)),
-    BlueprintGen(PatternDebugGradient, dict(name="p_debug_gradient", weight=0)),
-    BlueprintGen(PatternDebugBPMSync, dict(name="p_debug_bpm_sync", weight=0)),
-    BlueprintGen(PatternDebugSolidColor, dict(name="p_debug_solid_color", weight=0)),
-    BlueprintGen(PatternDebugLinearBlock, dict(name="p_debug_linear_block", weight=0)),
-    BlueprintGen(PatternGradient, dict(name="p_graident", weight=0)),
-    BlueprintGen(PatternRandomStripes, dict(name="p_random_stripes", keywords=[K.SHORT, K.LONG, K.CHORUS, K.BUILDUP, K.DROP], weight=2)),
-    BlueprintGen(PatternSolidColor, dict(name="p_solid_color", keywords=[K.SHORT, K.LONG, K.CHORUS, K.BUILDUP, K.BREAK], weight=0)),
-    BlueprintGen(PatternMeteor, dict(version=0, name="p_meteor_fast05", keywords=[K.SHORT, K.LONG, K.CHORUS], weight=0.2)),
-    BlueprintGen(PatternMeteor, dict(version=1, name="p_meteor_fast10", keywords=[K.LONG, K.CHORUS], weight=0.2)),
-    BlueprintGen(PatternMeteor, dict(version=2, name="p_meteor_fast20", keywords=[K.LONG, K.CHORUS], weight=0.2)),
-    BlueprintGen(PatternMeteor, dict(version=3, name="p_meteor_slow30", keywords=[K.LONG, K.CHORUS], weight=0.2)),
-    BlueprintGen(PatternMovingBlocks, dict(name="p_moving_blocks", keywords=[K.SHORT, K.LONG, K.CHORUS])),
-    BlueprintGen(PatternSwiper, dict(name="p_swiper", keywords=[K.SHORT, K.LONG, K.CHORUS])),
-    BlueprintGen(PatternSinwave, dict(name="s_sinwave", keywords=[K.SHORT, K.LONG, K.CHORUS])),
-    BlueprintGen(PatternSinwaveSquares, dict(name="p_sinwave_square", keywords=[K.SHORT, K.LONG, K.CHORUS])),
-    BlueprintGen(PatternSinOverlay, dict(name="p_sin_overlay", keywords=[K.SHORT, K.LONG, K.CHORUS])),
-    BlueprintGen(PatternRain, dict(name="p_rain", keywords=[K.SHORT, K.LONG, K.AMBIENT, K.CHORUS])),
-    BlueprintGen(PatternInerseSquare, dict(name="p_inverse_square", keywords=[K.SHORT, K.LONG, K.AMBIENT, K.CHORUS])),
-    BlueprintGen(PatternPID, dict(name="p_pid", keywords=[K.SHORT, K.LONG])),
-    BlueprintGen(PatternPIDInverse, dict(name="p_pid_inverse", keywords=[K.SHORT, K.LONG])),
-    BlueprintGen(PatternPidSplash, dict(name="p_pid_splash_WIP", keywords=[K.SHORT, K.LONG])),
-    BlueprintGen(PatternHorStripes, dict(name="p_hor_stripes", keywords=[K.SHORT, K.LONG])),
-    BlueprintGen(PatternShadow, dict(name="p_shadow", keywords=[K.SHORT, K.LONG])),
-    # BlueprintGen(PatternShadowBig, dict(name="p_shadow_big", keywords=[K.SHORT, K.LONG])),  # todo
-    BlueprintGen(PatternDoubleStrobe, dict(name="p_double_strobe", keywords=[K.SHORT, K.LONG, K.STROBE])),
-    BlueprintGen(PatternMovingStrobeSlow, dict(name="p_moving_strobe_slow", keywords=[K.SHORT, K.LONG, K.CHORUS, K.STROBE])),
-    BlueprintGen(PatternMovingStrobeFast, dict(name="p_moving_strobe_fast", keywords=[K.SHORT, K.LONG, K.CHORUS, K.STROBE])),
-    BlueprintGen(PatternStrobeSpawner, dict(name="p_strobe_spawner", keywords=[K.SHORT, K.LONG, K.CHORUS, K.STROBE])),
-    BlueprintGen(VfilterFlipVer, dict(name="v_flip_ver")),
-    BlueprintGen(VfilterMirrorVer, dict(name="v_mirror_ver")),
-    BlueprintGen(VfilterBW, dict(name="v_bw")),
-    BlueprintGen(VfilterRgbShift, dict(name="v_rgb_shift")),
-    BlueprintGen(VfilterFlippedColorFuse, dict(name="v_flipped_color_fuse")),
-    BlueprintGen(VfilterMirrorHor, dict(name="v_mirror_hor")),
-    BlueprintGen(VfilterMapAllFirst, dict(name="v_map_all_first")),
-    BlueprintGen(VfilterMapSomeFirst, dict(name="v_map_some_first")),
-    BlueprintGen(VfilterEdgedetect, dict(name="v_edgedetect_1", version=0)),
-    BlueprintGen(VfilterEdgedetect, dict(name="v_edgedetect_3", version=1)),
-    BlueprintGen(VfilterEdgedetect, dict(name="v_edgedetect_5", version=2)),
-    BlueprintGen(VfilterTimeDelay, dict(name="v_time_delay_random", version=0)),
-    BlueprintGen(VfilterTimeDelay, dict(name="v_time_delay_right", version=1)),
-    BlueprintGen(VfilterTimeDelay, dict(name="v_time_delay_left", version=2)),
-    BlueprintGen(VfilterTimeDelay, dict(name="v_time_delay_double", version=3)),
-    BlueprintGen(VfilterTimeDelay, dict(name="v_time_delay_doubleinv", version=4)),
-    BlueprintGen(VfilterReverb, dict(name="v_reverb")),
-    BlueprintGen(VfilterRollOverlay, dict(name="v_roll_overlay")),
-    BlueprintGen(VfilterRandomBlackout, dict(name="v_random_blackout")),
-    BlueprintGen(VfilterMapPropagate, dict(name="v_map_propagate_random", version=0)),
-    BlueprintGen(VfilterMapPropagate, dict(name="v_map_propagate_left", version=1)),
-    BlueprintGen(VfilterMapPropagate, dict(name="v_map_propagate_right", version=2)),
-    BlueprintGen(VfilterMapPropagate, dict(name="v_map_propagate_mid", version=3)),
-    BlueprintGen(VfilterMapPropagate, dict(name="v_map_propagate_midinv", version=4)),
-    BlueprintGen(ThinnerRandomPattern, dict(name="t_random_pattern")),
-    BlueprintGen(ThinnerRandom, dict(name="t_random")),
-    BlueprintGen(ThinnerEquidistant, dict(name="t_equidistant", weight=1)),
-    BlueprintGen(DimmerRandomRemove, dict(name="d_random_remove")),
-    BlueprintGen(DimmerDecayVeryFast, dict(name="d_decay_veryfast", weight=1)),
-    BlueprintGen(DimmerDecayFast, dict(name="d_decay_fast", weight=1)),
-    BlueprintGen(DimmerDecayMedium, dict(name="d_decay_medium", weight=1)),
-    BlueprintGen(DimmerDecaySlow, dict(name="d_decay_slow", weight=1)),
-    BlueprintGen(DimmerDecayVerySlow, dict(name="d_decay_very_slow", weight=1)),
-    BlueprintGen(DimmerSideswipe, dict(name="d_sideswipe_1", weight=1, version=0)),
-    BlueprintGen(DimmerSideswipe, dict(name="d_sideswipe_2", weight=1, version=1)),
-    BlueprintGen(DimmerSine, dict(name="d_sine", weight=1)),
-    BlueprintGen(DimmerPeak, dict(name="d_peak", weight=1)),
+    BlueprintGen("ravelights.patterns.pattern_debug_gradient.PatternDebugGradient", dict(name="p_debug_gradient", weight=0)),
+    BlueprintGen("ravelights.patterns.pattern_debug_bpm_sync.PatternDebugBPMSync", dict(name="p_debug_bpm_sync", weight=0)),
+    BlueprintGen("ravelights.patterns.pattern_debug_solid_color.PatternDebugSolidColor", dict(name="p_debug_solid_color", weight=0)),
+    BlueprintGen("ravelights.patterns.pattern_debug_linear_block.PatternDebugLinearBlock", dict(name="p_debug_linear_block", weight=0)),
+    BlueprintGen("ravelights.patterns.pattern_gradient.PatternGradient", dict(name="p_graident", weight=0)),
+    BlueprintGen("ravelights.patterns.pattern_random_stripes.PatternRandomStripes", dict(name="p_random_stripes", keywords=[K.SHORT, K.LONG, K.CHORUS, K.BUILDUP, K.DROP], weight=2)),
+    BlueprintGen("ravelights.patterns.pattern_solid_color.PatternSolidColor", dict(name="p_solid_color", keywords=[K.SHORT, K.LONG, K.CHORUS, K.BUILDUP, K.BREAK], weight=0)),
+    BlueprintGen("ravelights.patterns.pattern_meteor.PatternMeteor", dict(version=0, name="p_meteor_fast05", keywords=[K.SHORT, K.LONG, K.CHORUS], weight=0.2)),
+    BlueprintGen("ravelights.patterns.pattern_meteor.PatternMeteor", dict(version=1, name="p_meteor_fast10", keywords=[K.LONG, K.CHORUS], weight=0.2)),
+    BlueprintGen("ravelights.patterns.pattern_meteor.PatternMeteor", dict(version=2, name="p_meteor_fast20", keywords=[K.LONG, K.CHORUS], weight=0.2)),
+    BlueprintGen("ravelights.patterns.pattern_meteor.PatternMeteor", dict(version=3, name="p_meteor_slow30", keywords=[K.LONG, K.CHORUS], weight=0.2)),
+    BlueprintGen("ravelights.patterns.pattern_moving_blocks.PatternMovingBlocks", dict(name="p_moving_blocks", keywords=[K.SHORT, K.LONG, K.CHORUS])),
+    BlueprintGen("ravelights.patterns.pattern_swiper.PatternSwiper", dict(name="p_swiper", keywords=[K.SHORT, K.LONG, K.CHORUS])),
+    BlueprintGen("ravelights.patterns.pattern_sinwave.PatternSinwave", dict(name="s_sinwave", keywords=[K.SHORT, K.LONG, K.CHORUS])),
+    BlueprintGen("ravelights.patterns.pattern_sinwave_squares.PatternSinwaveSquares", dict(name="p_sinwave_square", keywords=[K.SHORT, K.LONG, K.CHORUS])),
+    BlueprintGen("ravelights.patterns.pattern_sin_overlay.PatternSinOverlay", dict(name="p_sin_overlay", keywords=[K.SHORT, K.LONG, K.CHORUS])),
+    BlueprintGen("ravelights.patterns.pattern_rain.PatternRain", dict(name="p_rain", keywords=[K.SHORT, K.LONG, K.AMBIENT, K.CHORUS])),
+    BlueprintGen("ravelights.patterns.pattern_inverse_square.PatternInerseSquare", dict(name="p_inverse_square", keywords=[K.SHORT, K.LONG, K.AMBIENT, K.CHORUS])),
+    BlueprintGen("ravelights.patterns.pattern_pid.PatternPID", dict(name="p_pid", keywords=[K.SHORT, K.LONG])),
+    BlueprintGen("ravelights.patterns.pattern_pid_inverse.PatternPIDInverse", dict(name="p_pid_inverse", keywords=[K.SHORT, K.LONG])),
+    BlueprintGen("ravelights.patterns.pattern_pid_splash.PatternPidSplash", dict(name="p_pid_splash_WIP", keywords=[K.SHORT, K.LONG])),
+    BlueprintGen("ravelights.patterns.pattern_hor_stripes.PatternHorStripes", dict(name="p_hor_stripes", keywords=[K.SHORT, K.LONG])),
+    BlueprintGen("ravelights.patterns.pattern_shadow.PatternShadow", dict(name="p_shadow", keywords=[K.SHORT, K.LONG])),
+    BlueprintGen("ravelights.patterns.pattern_shadow_big.PatternShadowBig", dict(name="p_shadow_big", keywords=[K.SHORT, K.LONG])),
+    BlueprintGen("ravelights.patterns.pattern_double_strobe.PatternDoubleStrobe", dict(name="p_double_strobe", keywords=[K.SHORT, K.LONG, K.STROBE])),
+    BlueprintGen("ravelights.patterns.pattern_movingstrobe_slow.PatternMovingStrobeSlow", dict(name="p_moving_strobe_slow", keywords=[K.SHORT, K.LONG, K.CHORUS, K.STROBE])),
+    BlueprintGen("ravelights.patterns.pattern_movingstrobe_fast.PatternMovingStrobeFast", dict(name="p_moving_strobe_fast", keywords=[K.SHORT, K.LONG, K.CHORUS, K.STROBE])),
+    BlueprintGen("ravelights.patterns.pattern_strobespawner.PatternStrobeSpawner", dict(name="p_strobe_spawner", keywords=[K.SHORT, K.LONG, K.CHORUS, K.STROBE])),
+    BlueprintGen("ravelights.vfilters.vfilter_flipver.VfilterFlipVer", dict(name="v_flip_ver")),
+    BlueprintGen("ravelights.vfilters.vfilter_mirror.VfilterMirrorVer", dict(name="v_mirror_ver")),
+    BlueprintGen("ravelights.vfilters.vfilter_bw.VfilterBW", dict(name="v_bw")),
+    BlueprintGen("ravelights.vfilters.vfilter_rgb_shift.VfilterRgbShift", dict(name="v_rgb_shift")),
+    BlueprintGen("ravelights.vfilters.vfilter_flipped_color_fuse.VfilterFlippedColorFuse", dict(name="v_flipped_color_fuse")),
+    BlueprintGen("ravelights.vfilters.vfilter_mirror_hor.VfilterMirrorHor", dict(name="v_mirror_hor")),
+    BlueprintGen("ravelights.vfilters.vfilter_all_first.VfilterMapAllFirst", dict(name="v_map_all_first")),
+    BlueprintGen("ravelights.vfilters.vfilter_some_first.VfilterMapSomeFirst", dict(name="v_map_some_first")),
+    BlueprintGen("ravelights.vfilters.vfilter_edgedetect.VfilterEdgedetect", dict(name="v_edgedetect_1", version=0)),
+    BlueprintGen("ravelights.vfilters.vfilter_edgedetect.VfilterEdgedetect", dict(name="v_edgedetect_3", version=1)),
+    BlueprintGen("ravelights.vfilters.vfilter_edgedetect.VfilterEdgedetect", dict(name="v_edgedetect_5", version=2)),
+    BlueprintGen("ravelights.vfilters.vfilter_time_delay.VfilterTimeDelay", dict(name="v_time_delay_random", version=0)),
+    BlueprintGen("ravelights.vfilters.vfilter_time_delay.VfilterTimeDelay", dict(name="v_time_delay_right", version=1)),
+    BlueprintGen("ravelights.vfilters.vfilter_time_delay.VfilterTimeDelay", dict(name="v_time_delay_left", version=2)),
+    BlueprintGen("ravelights.vfilters.vfilter_time_delay.VfilterTimeDelay", dict(name="v_time_delay_double", version=3)),
+    BlueprintGen("ravelights.vfilters.vfilter_time_delay.VfilterTimeDelay", dict(name="v_time_delay_doubleinv", version=4)),
+    BlueprintGen("ravelights.vfilters.vfilter_reverb.VfilterReverb", dict(name="v_reverb")),
+    BlueprintGen("ravelights.vfilters.vfilter_roll_overlay.VfilterRollOverlay", dict(name="v_roll_overlay")),
+    BlueprintGen("ravelights.vfilters.vfilter_random_blackout.VfilterRandomBlackout", dict(name="v_random_blackout")),
+    BlueprintGen("ravelights.vfilters.vfilter_map_propagate.VfilterMapPropagate", dict(name="v_map_propagate_random", version=0)),
+    BlueprintGen("ravelights.vfilters.vfilter_map_propagate.VfilterMapPropagate", dict(name="v_map_propagate_left", version=1)),
+    BlueprintGen("ravelights.vfilters.vfilter_map_propagate.VfilterMapPropagate", dict(name="v_map_propagate_right", version=2)),
+    BlueprintGen("ravelights.vfilters.vfilter_map_propagate.VfilterMapPropagate", dict(name="v_map_propagate_mid", version=3)),
+    BlueprintGen("ravelights.vfilters.vfilter_map_propagate.VfilterMapPropagate", dict(name="v_map_propagate_midinv", version=4)),
+    BlueprintGen("ravelights.thinners.thinner_random_pattern.ThinnerRandomPattern", dict(name="t_random_pattern")),
+    BlueprintGen("ravelights.thinners.thinner_random.ThinnerRandom", dict(name="t_random")),
+    BlueprintGen("ravelights.thinners.thinner_equidistant.ThinnerEquidistant", dict(name="t_equidistant", weight=1)),
+    BlueprintGen("ravelights.dimmers.dimmer_random_remove.DimmerRandomRemove", dict(name="d_random_remove")),
+    BlueprintGen("ravelights.dimmers.dimmer_decay_very_fast.DimmerDecayVeryFast", dict(name="d_decay_veryfast", weight=1)),
+    BlueprintGen("ravelights.dimmers.dimmer_decay_fast.DimmerDecayFast", dict(name="d_decay_fast", weight=1)),
+    BlueprintGen("ravelights.dimmers.dimmer_decay_medium.DimmerDecayMedium", dict(name="d_decay_medium", weight=1)),
+    BlueprintGen("ravelights.dimmers.dimmer_decay_slow.DimmerDecaySlow", dict(name="d_decay_slow", weight=1)),
+    BlueprintGen("ravelights.dimmers.dimmer_decay_very_slow.DimmerDecayVerySlow", dict(name="d_decay_very_slow", weight=1)),
+    BlueprintGen("ravelights.dimmers.dimmer_sideswipe.DimmerSideswipe", dict(name="d_sideswipe_1", weight=1, version=0)),
+    BlueprintGen("ravelights.dimmers.dimmer_sideswipe.DimmerSideswipe", dict(name="d_sideswipe_2", weight=1, version=1)),
+    BlueprintGen("ravelights.dimmers.dimmer_sine.DimmerSine", dict(name="d_sine", weight=1)),
+    BlueprintGen("ravelights.dimmers.dimmer_peak.DimmerPeak", dict(name="d_peak", weight=1)),
 ]
 
 blueprint_effects: list[BlueprintEffect] = [
-    BlueprintEffect(EffectColorStrobe, dict(name="e_color_strobe")),
-    BlueprintEffect(EffectColorStrobeRainbow, dict(name="e_color_strobe_rainbow")),
-    BlueprintEffect(EffectColorStrobeRainbowPixel, dict(name="e_color_strobe_rainbow_pixel")),
-    BlueprintEffect(EffectColorShift, dict(name="e_color_shift")),
-    BlueprintEffect(EffectColorSwap, dict(name="e_color_swap")),
-    BlueprintEffect(EffectColorize, dict(name="e_colorize")),
-    BlueprintEffect(EffectFlicker, dict(name="e_flicker")),
-    BlueprintEffect(EffectFrameskip, dict(name="e_frameskip")),
+    BlueprintEffect("ravelights.effects.effect_color_strobe.EffectColorStrobe", dict(name="e_color_strobe")),
+    BlueprintEffect("ravelights.effects.effect_color_strobe_rainbow.EffectColorStrobeRainbow", dict(name="e_color_strobe_rainbow")),
+    BlueprintEffect("ravelights.effects.effect_color_strobe_rainbow_pixel.EffectColorStrobeRainbowPixel", dict(name="e_color_strobe_rainbow_pixel")),
+    BlueprintEffect("ravelights.effects.effect_color_shift.EffectColorShift", dict(name="e_color_shift")),
+    BlueprintEffect("ravelights.effects.effect_color_swap.EffectColorSwap", dict(name="e_color_swap")),
+    BlueprintEffect("ravelights.effects.effect_colorize.EffectColorize", dict(name="e_colorize")),
+    BlueprintEffect("ravelights.effects.effect_flicker.EffectFlicker", dict(name="e_flicker")),
+    BlueprintEffect("ravelights.effects.effect_frameskip.EffectFrameskip", dict(name="e_frameskip")),
+    BlueprintEffect("ravelights.effects.effect_hue_rotate.EffectHueRotate", dict(name="e_hue_rotate")),
+    BlueprintEffect("ravelights.effects.effect_color_grade.EffectColorGrade", dict(name="e_color_grade")),
 ]
 
 
@@ -294,5 +238,5 @@ def create_from_blueprint(blueprints: list[BlueprintPlace], kwargs: Optional[dic
 def create_from_blueprint(blueprints, kwargs: Optional[dict[str, Any]]=None) -> Any:
     if kwargs is None:
         kwargs = dict()
-    items = [cls(**args, **kwargs) for cls, args in blueprints]
+    items = [blueprint.get_cls()(**blueprint.args, **kwargs) for blueprint in blueprints]
     return items
@@ -6,7 +6,7 @@ from loguru import logger
 from ravelights.core.color_handler import Color, ColorHandler
 from ravelights.core.device import Device
 from ravelights.core.settings import Settings
-from ravelights.core.time_handler import BeatStatePattern
+from ravelights.core.time_handler import BeatStatePattern, TimeHandler
 from ravelights.core.utils import p
 
 if TYPE_CHECKING:
@@ -23,7 +23,9 @@ class AutoPilot:
 
     def __post_init__(self) -> None:
         self.settings: Settings = self.root.settings
+        self.timehandler: TimeHandler = self.root.timehandler
         self.devices: list[Device] = self.root.devices
+        self.beat_pattern = BeatStatePattern()
 
         self.settings.settings_autopilot = dict(
             autopilot=False,
@@ -161,8 +163,10 @@ class AutoPilot:
         if not self.settings.settings_autopilot["autopilot"]:
             return None
 
-        beat_pattern = BeatStatePattern(loop_length=self.settings.settings_autopilot["autopilot_loop_length"])
-        if not beat_pattern.is_match(self.timehandler.beat_state):
+        loop_length = self.settings.settings_autopilot["autopilot_loop_length"]
+        if self.beat_pattern.loop_length != loop_length:
+            self.beat_pattern.update_from_dict(dict(loop_length=loop_length))
+        if not self.beat_pattern.is_triggered(self.timehandler.beat_state):
             return None
 
         logger.info("run randomize routine")
@@ -5,8 +5,9 @@ from typing import TYPE_CHECKING, NamedTuple, Optional, Sequence
 
 import numpy as np
 from loguru import logger
+from ravelights.core.colorspace import HUE_WHEEL, HUE_WHEEL_SIZE
 from ravelights.core.custom_typing import ArrayFloat
-from ravelights.core.pid import PIDController, PIDSpeeds
+from ravelights.core.pid import PIDBank, PIDSpeeds
 from ravelights.core.utils import StrEnum
 
 if TYPE_CHECKING:
@@ -14,6 +15,7 @@ if TYPE_CHECKING:
 
 
 COLOR_TRANSITION_SPEEDS = (PIDSpeeds.INSTANT, PIDSpeeds.FAST, PIDSpeeds.MEDIUM, PIDSpeeds.SLOW)
+COLOR_KEYS = "ABC"
 
 
 class SecondaryColorModes(StrEnum):
@@ -52,18 +54,32 @@ class ColorEngine:
         self.settings = settings
         self._internal_color_transition_speed: str = ""
         default_colors = [DefaultColors.RED.value, DefaultColors.BLUE.value, DefaultColors.GREEN.value]
-        self.color_pids: dict[str, ColorPID] = {
-            key: ColorPID(init_color_rgb=color) for key, color in zip("ABC", default_colors)
-        }
-        # todo: make color_overwrite private
-        self.color_overwrite: dict[str, Optional[Color]] = {key: None for key in "ABC"}
+        # one pid controller for each channel of each color key, stepped at once. the arrays of the bank are
+        # in the order of COLOR_KEYS, i.e. channel c of color key k is at index 3 * k + c
+        self.color_pids = PIDBank(n=3 * len(COLOR_KEYS), start_val=np.ravel(default_colors))
+        # colors that replace the pid colors for the current frame, see set_color_override()
+        self._color_overrides: dict[str, Optional[Color]] = dict.fromkeys(COLOR_KEYS)
+        # colors of the current frame, resolved once and shared by all devices, see get_colors_rgb()
+        self._pid_colors: Optional[dict[str, Color]] = None
+        self._colors_rgb: dict[int, list[Color]] = dict()
 
     def before(self):
         self._run_pid_step()
-        self.reset_color_overwrite()
+        self.clear_color_overrides()
 
-    def reset_color_overwrite(self):
-        self.color_overwrite = {key: None for key in "ABC"}
+    def set_color_override(self, color_key: str, color: Color):
+        """replaces the color of color_key until clear_color_overrides(), which is called before each frame"""
+        self._color_overrides[color_key] = color
+        self._colors_rgb.clear()
+
+    def clear_color_overrides(self, color_keys: Sequence[str] = COLOR_KEYS):
+        for color_key in color_keys:
+            self._color_overrides[color_key] = None
+        self._colors_rgb.clear()
+
+    def _invalidate_colors(self):
+        self._pid_colors = None
+        self._colors_rgb.clear()
 
     def _run_pid_step(self):
         # apply color transition speed to pid controller if it has changed
@@ -71,8 +87,10 @@ class ColorEngine:
             self._internal_color_transition_speed = self.settings.color_transition_speed
             self.set_color_speed(self.settings.color_transition_speed)
 
-        for color_pid in self.color_pids.values():
-            color_pid.run_pid_step()
+        self.color_pids.perform_pid_step()
+        # double pid stepping for improved stability. use if stability is a problem
+        # self.color_pids.perform_pid_step()
+        self._invalidate_colors()
 
     def set_color_with_rule(self, color: list[float] | Color, color_key: str):
         assert len(color) == 3
@@ -93,7 +111,9 @@ class ColorEngine:
         color_level_B
         color_level_C
         """
-        self.color_pids[color_key].set_rgb_target(color)
+        index = 3 * COLOR_KEYS.index(color_key)
+        self.color_pids.target[index : index + 3] = color
+        self._invalidate_colors()
         self.settings.root.refresh_ui(sse_event="test")
 
     def get_color_keys(self, timeline_level: int) -> tuple[str, str]:
@@ -105,21 +125,30 @@ class ColorEngine:
         """
         gives the tuple of colors (color_prim, color_sec) in the correct order.
         color_1 and color_2 may be interchanged depending on the level
+        the list is computed once per frame and level and shared by all callers, it must not be modified
         """
-        if timeline_level == 0:
-            return [DefaultColors.BLACK.value, DefaultColors.BLACK.value]
-        color_key_prim, color_key_sec = self.get_color_keys(timeline_level=timeline_level)
-        color_prim = self.color_overwrite[color_key_prim]
-        if color_prim is None:
-            color_prim = self.color_pids[color_key_prim].get_rgb()
-        color_sec = self.color_overwrite[color_key_sec]
-        if color_sec is None:
-            color_sec = self.color_pids[color_key_sec].get_rgb()
-
-        return [color_prim, color_sec]
+        colors = self._colors_rgb.get(timeline_level)
+        if colors is None:
+            if timeline_level == 0:
+                colors = [DefaultColors.BLACK.value, DefaultColors.BLACK.value]
+            else:
+                color_key_prim, color_key_sec = self.get_color_keys(timeline_level=timeline_level)
+                colors = [self.get_color_rgb(color_key_prim), self.get_color_rgb(color_key_sec)]
+            self._colors_rgb[timeline_level] = colors
+        return colors
+
+    def get_color_rgb(self, color_key: str) -> Color:
+        color = self._color_overrides[color_key]
+        if color is not None:
+            return color
+        if self._pid_colors is None:
+            rgb_values = self.color_pids.value.clip(0, 1).reshape(len(COLOR_KEYS), 3).tolist()
+            self._pid_colors = {key: Color(*rgb) for key, rgb in zip(COLOR_KEYS, rgb_values)}
+        return self._pid_colors[color_key]
 
     def get_colors_rgb_target(self) -> dict[str, Color]:
-        return {k: v.get_rgb_target() for k, v in self.color_pids.items()}
+        rgb_values = self.color_pids.target.reshape(len(COLOR_KEYS), 3).tolist()
+        return {key: Color(*rgb) for key, rgb in zip(COLOR_KEYS, rgb_values)}
 
     def get_secondary_color(self, in_color: Color, color_key: str) -> Optional[Color]:
         """returns a color that matches in input color, according to the secondary
@@ -143,44 +172,15 @@ class ColorEngine:
 
     def set_color_speed(self, speed_str: str):
         if speed_str in COLOR_TRANSITION_SPEEDS:
-            for color_pid in self.color_pids.values():
-                for pid in color_pid.pids:
-                    pid.load_parameter_preset(speed_str)
+            self.color_pids.load_parameter_preset(speed_str)
+            self._invalidate_colors()
         else:
             logger.warning("set_color_speed() called with invalid speed")
         self.settings.root.refresh_ui(sse_event="settings")
 
 
-class ColorPID:
-    """
-    this class handles a group of PIDSystem objects to fully model a dynamic color.
-    one pid is used for each channel (r,g,b)
-    """
-
-    def __init__(self, init_color_rgb: Optional[Color] = None):
-        if init_color_rgb is None:
-            init_color_rgb = Color(1.0, 0.0, 0.0)
-        self.pids = [PIDController(start_val=val) for val in init_color_rgb]
-
-    def run_pid_step(self):
-        for pid in self.pids:
-            pid.perform_pid_step()
-            # double pid stepping for improved stability. use if stability is a problem
-            # pid.perform_pid_step()
-
-    def get_rgb(self) -> Color:
-        rgb = np.asarray([pid.value for pid in self.pids])
-        rgb = rgb.clip(0, 1)
-        return Color(*rgb)
-
-    def set_rgb_target(self, color: Color):
-        for val, pid in zip(color, self.pids):
-            pid.target = val
-
-    def get_rgb_target(self):
-        """get target colors for api"""
-        rgb = (pid.target for pid in self.pids)
-        return Color(*rgb)
+# colors of the hue wheel as Color objects, such that single colors are looked up without conversion
+HUE_WHEEL_COLORS: tuple[Color, ...] = tuple(Color(*rgb) for rgb in HUE_WHEEL.tolist())
 
 
 class ColorHandler:
@@ -196,10 +196,13 @@ class ColorHandler:
         return cls.get_color_from_hue(random.uniform(0, 1))
 
     @classmethod
-    def get_color_from_hue(cls, hue: float) -> Color:
-        """returns a color with the given hue and maximum brightness and saturation.
-        hue [0,1]"""
-        return cls.convert_to_color(colorsys.hls_to_rgb(hue, 0.5, 1))
+    def get_color_from_hue(cls, hue: float, exact: bool = False) -> Color:
+        """returns a color with the given hue and maximum brightness and saturation. hue [0,1], wraps around.
+        the color is taken from the hue wheel, which deviates by at most 1 / 512 per channel. with exact, the color is
+        computed, e.g. for slow continuous hue changes"""
+        if exact:
+            return cls.convert_to_color(colorsys.hls_to_rgb(hue % 1.0, 0.5, 1.0))
+        return HUE_WHEEL_COLORS[round(hue * HUE_WHEEL_SIZE) % HUE_WHEEL_SIZE]
 
     @classmethod
     def get_complementary_color(cls, rgb_values: Sequence[float]) -> Color:
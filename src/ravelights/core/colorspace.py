@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from ravelights.core.custom_typing import ArrayFloat
+
+# ─── Conversions ──────────────────────────────────────────────────────────────
+# vectorized versions of colorsys. colors are arrays of shape (..., 3) with values in [0, 1], the channel order is
+# the same as in colorsys: (r, g, b), (h, s, v) and (h, l, s)
+
+
+def _get_channels(rgb: ArrayFloat) -> tuple[ArrayFloat, ArrayFloat, ArrayFloat, ArrayFloat, ArrayFloat]:
+    # reductions over the short last axis are slow, the channels are compared elementwise instead
+    red, green, blue = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    maxc = np.maximum(np.maximum(red, green), blue)
+    minc = np.minimum(np.minimum(red, green), blue)
+    return red, green, blue, maxc, minc
+
+
+def _get_hue(red: ArrayFloat, green: ArrayFloat, blue: ArrayFloat, maxc: ArrayFloat, delta: ArrayFloat) -> ArrayFloat:
+    # for gray pixels (delta == 0), all differences are 0 and so is the hue
+    delta = np.where(delta > 0.0, delta, 1.0)
+    hue = np.where(
+        red == maxc,
+        (green - blue) / delta,
+        np.where(green == maxc, 2.0 + (blue - red) / delta, 4.0 + (red - green) / delta),
+    )
+    return (hue / 6.0) % 1.0
+
+
+def rgb_to_hsv(rgb: ArrayFloat) -> ArrayFloat:
+    red, green, blue, maxc, minc = _get_channels(rgb)
+    delta = maxc - minc
+    saturation = np.divide(delta, maxc, out=np.zeros_like(maxc), where=maxc > 0.0)
+    return np.stack([_get_hue(red, green, blue, maxc, delta), saturation, maxc], axis=-1)
+
+
+def rgb_to_hls(rgb: ArrayFloat) -> ArrayFloat:
+    red, green, blue, maxc, minc = _get_channels(rgb)
+    delta, sumc = maxc - minc, maxc + minc
+    lightness = sumc / 2.0
+    divisor = np.where(lightness <= 0.5, sumc, 2.0 - sumc)
+    saturation = np.divide(delta, divisor, out=np.zeros_like(delta), where=delta > 0.0)
+    return np.stack([_get_hue(red, green, blue, maxc, delta), lightness, saturation], axis=-1)
+
+
+def hsv_to_rgb(hsv: ArrayFloat, out: Optional[ArrayFloat] = None) -> ArrayFloat:
+    """hues wrap around, i.e. 1.25 is 0.25"""
+    hue, saturation, value = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+    if out is None:
+        out = np.empty_like(hsv)
+    hue_6 = (hue % 1.0) * 6.0
+    chroma = value * saturation
+    for channel, offset in enumerate((5.0, 3.0, 1.0)):
+        k = hue_6 + offset
+        k = np.where(k >= 6.0, k - 6.0, k)
+        np.minimum(k, 4.0 - k, out=k)
+        np.clip(k, 0.0, 1.0, out=k)
+        k *= chroma
+        np.subtract(value, k, out=out[..., channel])
+    return out
+
+
+def hls_to_rgb(hls: ArrayFloat, out: Optional[ArrayFloat] = None) -> ArrayFloat:
+    hue, lightness, saturation = (channel[..., None] for channel in np.moveaxis(hls, -1, 0))
+    k = (np.array([0.0, 8.0, 4.0]) + hue * 12.0) % 12.0
+    ramp = np.clip(np.minimum(k - 3.0, 9.0 - k), -1.0, 1.0)
+    return np.subtract(lightness, saturation * np.minimum(lightness, 1.0 - lightness) * ramp, out=out)
+
+
+# ─── Hue Wheel ────────────────────────────────────────────────────────────────
+# fully saturated colors with maximum brightness, i.e. ColorHandler.get_color_from_hue() for arrays of hues
+
+HUE_WHEEL_SIZE = 1536  # 256 steps between each primary and secondary color
+
+_hues = np.arange(HUE_WHEEL_SIZE) / HUE_WHEEL_SIZE
+HUE_WHEEL: ArrayFloat = hsv_to_rgb(np.stack([_hues, np.ones_like(_hues), np.ones_like(_hues)], axis=-1))
+
+
+def hue_to_rgb(hue: float | ArrayFloat, out: Optional[ArrayFloat] = None) -> ArrayFloat:
+    """colors of the hue wheel with shape (..., 3) for hues of any shape. hues wrap around, i.e. 1.25 is 0.25"""
+    index = np.rint(np.multiply(hue, HUE_WHEEL_SIZE)).astype(np.intp) % HUE_WHEEL_SIZE
+    return np.take(HUE_WHEEL, index, axis=0, out=out)
+
+
+# ─── Color Transform ──────────────────────────────────────────────────────────
+
+
+@dataclass
+class ColorTransform:
+    """
+    per pixel color transform of whole matrices (..., 3), see EffectColorTransform. stages without effect are skipped
+    hue_shift: rotation of the hsv hue, 1.0 is a full turn
+    saturation: factor of the hsv saturation
+    gamma: exponent of each channel
+    channel_mix: 3x3 matrix, out channel i is the sum of channel_mix[i, j] * in channel j
+    """
+
+    hue_shift: float = 0.0
+    saturation: float = 1.0
+    gamma: float = 1.0
+    channel_mix: Optional[ArrayFloat] = None
+
+    def apply(self, rgb: ArrayFloat, out: Optional[ArrayFloat] = None) -> ArrayFloat:
+        if out is None:
+            out = np.empty_like(rgb)
+        if self.hue_shift % 1.0 != 0.0 or self.saturation != 1.0:
+            hsv = rgb_to_hsv(rgb)
+            hsv[..., 0] += self.hue_shift
+            hsv[..., 1] *= self.saturation
+            np.clip(hsv[..., 1], 0.0, 1.0, out=hsv[..., 1])
+            hsv_to_rgb(hsv, out=out)
+        else:
+            np.copyto(out, rgb)
+        if self.gamma != 1.0:
+            np.power(out, self.gamma, out=out)
+        if self.channel_mix is not None:
+            np.clip(out @ self.channel_mix.T, 0.0, 1.0, out=out)
+        return out
@@ -0,0 +1,102 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+from loguru import logger
+
+Command = dict[str, Any]
+
+
+def get_coalesce_key(command: Command) -> Optional[Hashable]:
+    """
+    Commands with the same key overwrite the same state, so only the latest one has to be applied.
+    Commands that return None are never coalesced.
+    """
+    match command:
+        case {"action": "set_settings" | "set_settings_autopilot" as action, **other_kwargs}:
+            return (action, *sorted(other_kwargs))
+        case {"action": "set_device_settings", "device_id": device_id, **other_kwargs}:
+            return ("set_device_settings", device_id, *sorted(other_kwargs))
+        case {"action": "set_color", "color_key": color_key}:
+            return ("set_color", color_key)
+        case {"action": "set_beat_tracking"}:
+            return ("set_beat_tracking",)
+    return None
+
+
+@dataclass
+class CommandQueueMetrics:
+    received: int = 0
+    applied: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    pending: int = 0
+    apply_time_ms: float = 0.0
+
+
+class CommandQueue:
+    """
+    Queue for commands from the api and other threads, which are applied in the render thread at the beginning of
+    a frame. push() only appends to a deque, which is thread safe without a lock. Commands are applied in the order
+    they were received (FIFO). Before they are applied, redundant commands (see get_coalesce_key) are merged into
+    the latest one, e.g. a burst of slider updates results in a single set_settings. Commands that do not fit into
+    max_apply_time are kept for the next frame. If more than capacity commands are waiting, new ones are dropped.
+    """
+
+    def __init__(self, capacity: int = 1024, max_apply_time: float = 0.005):
+        self.capacity = capacity
+        self.max_apply_time = max_apply_time
+        self.metrics = CommandQueueMetrics()
+        self._incoming: deque[Command] = deque()  # written by any thread
+        self._pending: dict[int, Command] = dict()  # only used by the render thread, ordered by sequence number
+        self._pending_keys: dict[Hashable, int] = dict()  # coalesce key -> sequence number in _pending
+        self._sequence: int = 0
+
+    def __len__(self) -> int:
+        return len(self._incoming) + len(self._pending)
+
+    def push(self, command: Command) -> bool:
+        """thread safe, returns False if the command was dropped"""
+        if len(self) >= self.capacity:
+            if self.metrics.dropped == 0:
+                logger.warning(f"command queue is full, dropping commands ({self.capacity=})")
+            self.metrics.dropped += 1
+            return False
+        self._incoming.append(command)
+        self.metrics.received += 1
+        return True
+
+    def _collect(self) -> None:
+        """moves incoming commands to pending and coalesces them, only called by the render thread"""
+        while self._incoming:
+            command = self._incoming.popleft()
+            key = get_coalesce_key(command)
+            if key is not None and key in self._pending_keys:
+                del self._pending[self._pending_keys[key]]
+                self.metrics.coalesced += 1
+            self._pending[self._sequence] = command
+            if key is not None:
+                self._pending_keys[key] = self._sequence
+            self._sequence += 1
+
+    def apply(self, apply_command: Callable[[Command], None]) -> int:
+        """applies pending commands until max_apply_time is exceeded, at least one command per call"""
+        self._collect()
+        time_0 = time.perf_counter()
+        n_applied = 0
+        while self._pending:
+            sequence = next(iter(self._pending))
+            command = self._pending.pop(sequence)
+            key = get_coalesce_key(command)
+            if key is not None:
+                del self._pending_keys[key]
+            apply_command(command)
+            n_applied += 1
+            if time.perf_counter() - time_0 > self.max_apply_time:
+                break
+
+        self.metrics.applied += n_applied
+        self.metrics.pending = len(self)
+        self.metrics.apply_time_ms = (time.perf_counter() - time_0) * 1000
+        return n_applied
@@ -1,4 +1,6 @@
 # ruff: noqa: F811
+import importlib
+from functools import cache
 from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Protocol, Type, TypedDict
 
 import numpy as np
@@ -63,12 +65,47 @@ class AvailableGenerators(TypedDict):
     effect: list[GeneratorMeta]
 
 
+# package of a generator or effect module -> identifier of its class, see Generator.get_identifier()
+PACKAGE_IDENTIFIERS = {
+    "patterns": "pattern",
+    "vfilters": "vfilter",
+    "thinners": "thinner",
+    "dimmers": "dimmer",
+    "effects": "effect",
+}
+
+
+@cache
+def import_class(path: str) -> type:
+    """imports a class from its dotted path, e.g. "ravelights.patterns.pattern_rain.PatternRain" """
+    module_name, _, class_name = path.rpartition(".")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 class Blueprint(NamedTuple):
+    """
+    cls is either the class itself or its dotted path. Dotted paths are imported on first use of get_cls(),
+    such that modules of generators that are never selected are never imported.
+    """
+
     cls: Type["Pattern"] | Type["Vfilter"] | Type["Dimmer"] | Type["Thinner"] | Type["Effect"] | Type[
         "EffectSelectorPlacing"
-    ] | Type["GenPlacing"] | Type["GenSelector"]
+    ] | Type["GenPlacing"] | Type["GenSelector"] | str
     args: dict[str, str | float | int | list["Keywords"] | Type["Generator"] | list[int]]
 
+    def get_cls(self) -> Any:
+        if isinstance(self.cls, str):
+            return import_class(self.cls)
+        return self.cls
+
+    def get_identifier(self) -> str:
+        """identifier of the class without importing it, if possible"""
+        if isinstance(self.cls, str):
+            package = self.cls.split(".")[-3]
+            if package in PACKAGE_IDENTIFIERS:
+                return PACKAGE_IDENTIFIERS[package]
+        return self.get_cls().get_identifier()
+
 
 class BlueprintGen(Blueprint):
     ...
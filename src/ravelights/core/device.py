@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING, Any
 
-import numpy as np
 from loguru import logger
 from ravelights.core.custom_typing import ArrayFloat, ArrayUInt8
 from ravelights.core.instruction_handler import InstructionHandler
@@ -8,7 +7,7 @@ from ravelights.core.pixel_matrix import PixelMatrix
 from ravelights.core.render_module import RenderModule
 from ravelights.core.settings import Settings
 from ravelights.core.time_handler import TimeHandler
-from ravelights.interface.color_remap import ColorProfiles, ColorProfilesFunctions
+from ravelights.interface.color_remap import ColorProfiles, ColorProfilesLuts
 
 if TYPE_CHECKING:
     from ravelights.core.ravelights_app import RaveLightsApp
@@ -51,12 +50,8 @@ class Device:
         return self.pixelmatrix.get_matrix_float()
 
     def get_matrix_processed_int(self) -> ArrayUInt8:
-        matrix_float = self.pixelmatrix.get_matrix_float()
         brightness = min(self.settings.global_brightness, self.device_brightness)
-        color_map_function = ColorProfilesFunctions[self.color_profile]
-        matrix_processed_float = color_map_function(matrix_float * brightness)
-        assert np.max(matrix_processed_float <= 255)
-        return (matrix_processed_float * 255).astype(np.uint8)
+        return self.pixelmatrix.get_matrix_int(brightness=brightness, lut=ColorProfilesLuts[self.color_profile])
 
     def get_matrix_int(self) -> ArrayUInt8:
         return self.pixelmatrix.get_matrix_int()
@@ -1,14 +1,13 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from loguru import logger
 from ravelights.configs.components import blueprint_effects, blueprint_generators, create_from_blueprint
-from ravelights.core.generator_super import Vfilter
 from ravelights.core.instruction import InstructionEffect
 from ravelights.core.instruction_queue import InstructionQueue
 from ravelights.core.settings import Settings
 from ravelights.core.time_handler import TimeHandler
-from ravelights.effects.effect_super import Effect, EffectWrapper
+from ravelights.effects.effect_super import Effect, EffectStep, EffectWrapper
 from ravelights.effects.special_effect_vfilter import SpecialEffectVfilter
 
 if TYPE_CHECKING:
@@ -36,6 +35,11 @@ class EffectHandler:
         self.devices: list[Device] = self.root.devices
         self.instruction_queue = InstructionQueue(root=self.root)
         self.effect_wrappers_dict: dict[str, EffectWrapper] = dict()
+        self.effective_effect_queue: list[EffectWrapper] = []
+        self.render_plan: list[EffectStep] = []
+        # incremented whenever effect_queues are changed, such that the effective queue is only assembled on change
+        self.queues_version: int = 0
+        self._effective_effect_queue_key: Optional[tuple[int, tuple[int, ...]]] = None
         self.build_effectwrappers_from_blueprints()
         self.build_effectwrappers_from_vfilters()
 
@@ -51,7 +55,7 @@ class EffectHandler:
 
     def build_effectwrappers_from_vfilters(self) -> None:
         for blueprint in blueprint_generators:
-            if not issubclass(blueprint.cls, Vfilter) or "none" in blueprint.args["name"]:
+            if blueprint.get_identifier() != "vfilter" or "none" in blueprint.args["name"]:
                 continue
             vfilter_name: str = blueprint.args["name"]
             effect_name = "e" + vfilter_name
@@ -67,16 +71,15 @@ class EffectHandler:
 
         # ---------------------------------- remove ---------------------------------- #
         for effect_queue in self.effect_queues:
-            for effect_wrapper in effect_queue:
-                if effect_wrapper.is_finished():
-                    effect_wrapper.on_delete()
-                    effect_queue.remove(effect_wrapper)
+            finished = [effect_wrapper for effect_wrapper in effect_queue if effect_wrapper.is_finished()]
+            for effect_wrapper in finished:
+                effect_wrapper.on_delete()
+            if finished:
+                effect_queue[:] = [effect_wrapper for effect_wrapper in effect_queue if effect_wrapper not in finished]
+                self.queues_version += 1
 
         # ─── Assemble Queues ──────────────────────────────────────────
-        timeline_levels = {device.rendermodule.get_timeline_level() for device in self.devices}
-        self.effective_effect_queue = [*self.effect_queues[0]]
-        for timeline_level in timeline_levels:
-            self.effective_effect_queue += self.effect_queues[timeline_level]
+        self.assemble_effective_effect_queue()
 
         for effect_wrapper in self.effective_effect_queue:
             # ---------------------------------- trigger --------------------------------- #
@@ -84,7 +87,8 @@ class EffectHandler:
                 if effect_wrapper.trigger.is_match(self.timehandler.beat_state):
                     effect_wrapper.on_trigger()
             # ----------------------------------- sync ----------------------------------- #
-            effect_wrapper.sync_effects()
+            if effect_wrapper.has_sync:
+                effect_wrapper.sync_effects()
 
             # ------------------------------ counting before ----------------------------- #
             effect_wrapper.counting_before_check()
@@ -98,6 +102,36 @@ class EffectHandler:
             # -------------------------------- run before -------------------------------- #
             effect_wrapper.run_before()
 
+        # ─── Compile ──────────────────────────────────────────────────
+        self.render_plan = self.compile_render_plan()
+
+    def assemble_effective_effect_queue(self) -> None:
+        """effects of level 0 and of the timeline levels of all devices. only assembled if one of them changed"""
+        timeline_levels = tuple(sorted({device.rendermodule.get_timeline_level() for device in self.devices}))
+        key = (self.queues_version, timeline_levels)
+        if key == self._effective_effect_queue_key:
+            return
+        self._effective_effect_queue_key = key
+        self.effective_effect_queue = [*self.effect_queues[0]]
+        for timeline_level in timeline_levels:
+            self.effective_effect_queue += self.effect_queues[timeline_level]
+
+    def compile_render_plan(self) -> list[EffectStep]:
+        """
+        Effects that are rendered in this frame, in order. Inactive effects and effects that do not change the
+        matrix are left out, and the draw mode is resolved once instead of once per device.
+        """
+        render_plan: list[EffectStep] = []
+        for effect_wrapper in self.effective_effect_queue:
+            if not effect_wrapper.active or effect_wrapper.is_passthrough:
+                continue
+            if effect_wrapper.draw_mode not in ("overlay", "normal"):
+                logger.error("illegal effect_wrapper.draw_mode")
+                continue
+            is_overlay = effect_wrapper.draw_mode == "overlay"
+            render_plan.append(EffectStep(effects=effect_wrapper.effects, is_overlay=is_overlay))
+        return render_plan
+
     def run_after(self) -> None:
         for effect_wrapper in self.effective_effect_queue:
             effect_wrapper.run_after()
@@ -106,6 +140,7 @@ class EffectHandler:
         for queue in self.effect_queues:
             queue.clear()
         self.instruction_queue.clear()
+        self.queues_version += 1
 
     def load_and_apply_instructions(self) -> None:  # before
         instructions_for_frame = self.instruction_queue.get_instructions()
@@ -126,8 +161,11 @@ class EffectHandler:
         effect_wrapper: EffectWrapper = self.find_effect(name=effect_name)
         effect_wrapper.draw_mode = self.settings.effect_draw_mode
         effect_wrapper.reset(**kwargs)  # type: ignore
+        if effect_wrapper.trigger is None:
+            effect_wrapper.renew_trigger()
         logger.debug(self.effect_queues)
         self.effect_queues[timeline_level].append(effect_wrapper)
+        self.queues_version += 1
         logger.debug(self.effect_queues)
         self.root.refresh_ui(sse_event="effect")
 
@@ -159,6 +197,7 @@ class EffectHandler:
         if effect in self.effect_queues[timeline_level]:
             effect.on_delete()
             self.effect_queues[timeline_level].remove(effect)
+            self.queues_version += 1
 
     def find_effect(self, name: str) -> EffectWrapper:
         return self.effect_wrappers_dict[name]
@@ -0,0 +1,174 @@
+import time
+from enum import auto
+from typing import Callable, Optional
+
+from ravelights.core.utils import StrEnum
+
+
+class FrameDropPolicies(StrEnum):
+    """available policies for the FrameScheduler, if a frame deadline was missed by more than one frame"""
+
+    SKIP = auto()  # drop the missed frames and continue on the next deadline of the original grid
+    CATCH_UP = auto()  # render the missed frames without sleep, until max_catch_up_frames is reached
+    RESYNC = auto()  # start a new deadline grid at the current time
+
+
+class JitterHistogram:
+    """
+    Histogram of the deviation between the scheduled frame deadline and the actual wake up time.
+    bins are given in seconds, the last bin collects all values above the highest bin edge.
+    """
+
+    def __init__(self, bin_width: float = 0.0001, n_bins: int = 50):
+        self.bin_width = bin_width
+        self.n_bins = n_bins
+        self.clear()
+
+    def clear(self) -> None:
+        self.counts: list[int] = [0] * (self.n_bins + 1)
+        self.n_samples: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+
+    def add(self, jitter: float) -> None:
+        jitter = abs(jitter)
+        self.counts[min(int(jitter / self.bin_width), self.n_bins)] += 1
+        self.n_samples += 1
+        self.sum += jitter
+        self.max = max(self.max, jitter)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.n_samples if self.n_samples else 0.0
+
+    def percentile(self, q: float) -> float:
+        """returns the upper bin edge below which the fraction q of all samples are"""
+        if not self.n_samples:
+            return 0.0
+        threshold = q * self.n_samples
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return (index + 1) * self.bin_width
+        return self.max
+
+    def to_dict(self) -> dict[str, float | int | list[int]]:
+        return dict(
+            bin_width=self.bin_width,
+            counts=list(self.counts),
+            n_samples=self.n_samples,
+            mean=self.mean,
+            max=self.max,
+            p99=self.percentile(0.99),
+        )
+
+
+class FrameScheduler:
+    """
+    Waits for absolute frame deadlines instead of sleeping for relative durations, so that errors of
+    single sleeps do not accumulate. The wait is split into a coarse time.sleep() and a busy wait for the
+    remaining time. The busy wait covers the typical oversleep of time.sleep(), which is measured
+    continuously. The oversleep margin is capped at max_oversleep_margin, such that a system with large
+    oversleep does not burn several milliseconds of cpu per frame in the busy wait.
+
+    <-------------- frame time -------------->
+    | render |   coarse sleep   | spin wait |
+    ^                                        ^
+    deadline n                               deadline n+1
+    """
+
+    def __init__(
+        self,
+        policy: str = FrameDropPolicies.SKIP.value,
+        spin_time: float = 0.0005,
+        max_oversleep_margin: float = 0.001,
+        max_catch_up_frames: int = 2,
+        get_current_time: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.policy = policy
+        self.spin_time = spin_time
+        self.max_oversleep_margin = max_oversleep_margin
+        self.max_catch_up_frames = max_catch_up_frames
+        self._get_current_time = get_current_time
+        self._sleep = sleep
+
+        self.oversleep_estimate: float = 0.001  # is adjusted with the measured oversleep of time.sleep()
+        self.jitter_histogram = JitterHistogram()
+        self.delayed_frame_counter: int = 0
+        self.dropped_frame_counter: int = 0
+        self.last_sleep_time: float = 0.0
+        self._frame_time: Optional[float] = None
+        self._deadline: Optional[float] = None
+        self._catch_up_counter: int = 0
+
+    def reset(self) -> None:
+        """starts a new deadline grid with the next call of wait_for_next_frame()"""
+        self._deadline = None
+        self._catch_up_counter = 0
+
+    def wait_for_next_frame(self, frame_time: float) -> float:
+        """Blocks until the deadline of the next frame. Returns the time spent waiting in seconds."""
+        now = self._get_current_time()
+        if self._deadline is None or frame_time != self._frame_time:
+            self._frame_time = frame_time
+            self._deadline = now
+        self._deadline += frame_time
+
+        # ─── Behind Schedule ──────────────────────────────────────────
+        if now >= self._deadline:
+            self.delayed_frame_counter += 1
+            self.last_sleep_time = 0.0
+            self._handle_missed_deadline(now, frame_time)
+            return 0.0
+        self._catch_up_counter = 0
+
+        # ─── Coarse Sleep ─────────────────────────────────────────────
+        busy_wait_time = min(self.oversleep_estimate, self.max_oversleep_margin) + self.spin_time
+        coarse_sleep_time = self._deadline - now - busy_wait_time
+        if coarse_sleep_time > 0:
+            sleep_start = self._get_current_time()
+            self._sleep(coarse_sleep_time)
+            oversleep = self._get_current_time() - sleep_start - coarse_sleep_time
+            # follow increasing oversleep quickly and decreasing oversleep slowly
+            weight = 0.5 if oversleep > self.oversleep_estimate else 0.01
+            self.oversleep_estimate += (max(0.0, oversleep) - self.oversleep_estimate) * weight
+
+        # ─── Spin Wait ────────────────────────────────────────────────
+        wake_time = self._get_current_time()
+        while wake_time < self._deadline:
+            wake_time = self._get_current_time()
+
+        self.jitter_histogram.add(wake_time - self._deadline)
+        self.last_sleep_time = wake_time - now
+        return self.last_sleep_time
+
+    def get_next_deadline(self, frame_time: float) -> Optional[float]:
+        """deadline that the next call of wait_for_next_frame() waits for, None if no deadline grid has been started"""
+        if self._deadline is None or frame_time != self._frame_time:
+            return None
+        return self._deadline + frame_time
+
+    def _handle_missed_deadline(self, now: float, frame_time: float) -> None:
+        assert self._deadline is not None
+        self.jitter_histogram.add(now - self._deadline)
+        n_missed = int((now - self._deadline) // frame_time)
+        if n_missed == 0:
+            # late, but within the current frame. start the next frame right away
+            return
+
+        match self.policy:
+            case FrameDropPolicies.CATCH_UP.value if self._catch_up_counter < self.max_catch_up_frames:
+                self._catch_up_counter += 1
+            case FrameDropPolicies.RESYNC.value:
+                self.dropped_frame_counter += n_missed
+                self._deadline = now
+            case _:
+                # skip, or catch up limit reached: continue on the original grid
+                self.dropped_frame_counter += n_missed
+                self._deadline += n_missed * frame_time
+                self._catch_up_counter = 0
+
+    def get_jitter_histogram(self) -> dict[str, float | int | list[int]]:
+        return self.jitter_histogram.to_dict()
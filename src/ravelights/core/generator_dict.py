@@ -0,0 +1,69 @@
+from typing import TYPE_CHECKING, Iterator, Mapping
+
+from ravelights.core.custom_typing import BlueprintGen
+from ravelights.core.generator_super import Dimmer, Pattern, Thinner, Vfilter
+
+if TYPE_CHECKING:
+    from ravelights.core.device import Device
+    from ravelights.core.ravelights_app import RaveLightsApp
+
+SharedGenerators = dict[tuple[str, int, int], Pattern | Vfilter | Thinner | Dimmer]
+
+
+class GeneratorDict(Mapping[str, Pattern | Vfilter | Thinner | Dimmer]):
+    """
+    Maps generator names to the generator objects of one device. Generators are created from their blueprint on
+    first access, so that generators that are never selected do not allocate any memory. Generators with
+    stateless = True are shared between all devices with the same shape via shared_generators.
+    Iterating over items() or values() creates all generators, use names() or get_blueprint() for meta data.
+    """
+
+    def __init__(self, root: "RaveLightsApp", device: "Device", shared_generators: SharedGenerators):
+        self.root = root
+        self.device = device
+        self.shared_generators = shared_generators
+        self._blueprints: dict[str, BlueprintGen] = dict()
+        self._generators: dict[str, Pattern | Vfilter | Thinner | Dimmer] = dict()
+
+    def add_blueprints(self, blueprints: list[BlueprintGen]) -> None:
+        for blueprint in blueprints:
+            self._blueprints[str(blueprint.args["name"])] = blueprint
+
+    def add_generator(self, generator: Pattern | Vfilter | Thinner | Dimmer) -> None:
+        self._generators[generator.name] = generator
+
+    def get_blueprint(self, name: str) -> BlueprintGen:
+        return self._blueprints[name]
+
+    def is_created(self, name: str) -> bool:
+        return name in self._generators
+
+    def names(self) -> list[str]:
+        return list(dict.fromkeys([*self._blueprints, *self._generators]))
+
+    def __getitem__(self, name: str) -> Pattern | Vfilter | Thinner | Dimmer:
+        generator = self._generators.get(name)
+        if generator is None:
+            generator = self._create_generator(name)
+            self._generators[name] = generator
+        return generator
+
+    def _create_generator(self, name: str) -> Pattern | Vfilter | Thinner | Dimmer:
+        blueprint = self._blueprints[name]
+        cls, args = blueprint.get_cls(), blueprint.args
+        if not cls.stateless:  # type: ignore[union-attr]
+            return cls(root=self.root, device=self.device, **args)  # type: ignore[arg-type]
+
+        key = (name, self.device.pixelmatrix.n_leds, self.device.pixelmatrix.n_lights)
+        if key not in self.shared_generators:
+            self.shared_generators[key] = cls(root=self.root, device=self.device, **args)  # type: ignore[arg-type]
+        return self.shared_generators[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names())
+
+    def __len__(self) -> int:
+        return len(self.names())
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._blueprints or name in self._generators
@@ -16,6 +16,9 @@ if TYPE_CHECKING:
 
 
 class Generator(ABC):
+    # stateless generators only depend on the shape of the device and are shared between devices of the same shape
+    stateless: bool = False
+
     def __init__(
         self,
         root: "RaveLightsApp",
@@ -123,6 +126,16 @@ class Generator(ABC):
         matrix = np.full(shape=(self.n_leds, self.n_lights), fill_value=fill_value, dtype=float)
         return matrix
 
+    def get_float_matrix_mask(self, fill_value: float = 0.0) -> ArrayFloat:
+        """
+        shape: (self.n_leds, self.n_lights, 1)
+        Returns 1-channel mask in correct size and dtype float, which broadcasts over the color channels.
+        reshape(-1) of the mask is a view with the same order as get_float_matrix_1d_mono
+        """
+
+        matrix = np.full(shape=(self.n_leds, self.n_lights, 1), fill_value=fill_value, dtype=float)
+        return matrix
+
     def colorize_matrix(self, matrix_mono: ArrayFloat, color: Color) -> ArrayFloat:
         """
         in:  Nx1
@@ -177,15 +190,16 @@ class Generator(ABC):
         return np.where(matrix_2_max_repeated > 5 / 100, major, minor)
 
     @staticmethod
-    def apply_mask(in_matrix: ArrayFloat, mask: ArrayFloat) -> ArrayFloat:
+    def apply_mask(in_matrix: ArrayFloat, mask: ArrayFloat, out: Optional[ArrayFloat] = None) -> ArrayFloat:
         """
-        Applies a mask 1-channel mask array to a 3-channel color matrix by multiplication.
-        in_matrix: Nx3
-        mask: Nx1
-        out: Nx3
+        Applies a 1-channel mask array to a 3-channel color matrix by multiplication.
+        in_matrix: (n_leds, n_lights, 3)
+        mask: (n_leds, n_lights, 1) or (n_leds, n_lights)
+        out: (n_leds, n_lights, 3), the result is written into out if given, which can also be in_matrix
         """
-        mask = np.repeat(mask[:, :, None], 3, axis=2)
-        return np.multiply(in_matrix, mask)
+        if mask.ndim == 2:
+            mask = mask[..., None]
+        return np.multiply(in_matrix, mask, out=out)
 
     def __repr__(self):
         return f"<Generator {self.name}>"
@@ -207,6 +221,8 @@ class Pattern(Generator):
 class PatternNone(Pattern):
     """Default pattern with blank output"""
 
+    stateless = True
+
     def init(self):
         ...
 
@@ -230,6 +246,8 @@ class Vfilter(Generator):
 class VfilterNone(Vfilter):
     """Default vfilter with blank output"""
 
+    stateless = True
+
     def init(self):
         ...
 
@@ -255,6 +273,8 @@ class Thinner(Generator):
 class ThinnerNone(Thinner):
     """"""
 
+    stateless = True
+
     def init(self):
         ...
 
@@ -274,10 +294,20 @@ class ThinnerNone(Thinner):
 class Dimmer(Generator):
     """Default dimmer with blank output"""
 
-    ...
+    def get_gain(self) -> Optional[float]:
+        """
+        Dimmers that multiply the whole matrix with one value return this value here. The RenderModule then
+        skips render() and applies the gain in the output conversion, together with the brightness.
+        """
+        return None
 
 
 class DimmerNone(Dimmer):
+    stateless = True
+
+    def get_gain(self) -> float:
+        return 1.0
+
     def init(self):
         ...
 
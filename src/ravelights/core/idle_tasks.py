@@ -0,0 +1,65 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+@dataclass
+class IdleTask:
+    """deferred work that is run in the slack time of the frames, see IdleTaskScheduler"""
+
+    name: str
+    callback: Callable[[float], Any]  # is called with the deadline
+    repeat: bool = True  # repeating tasks run at most once per frame, others are removed after their first run
+    max_delay_frames: Optional[int] = None  # the task runs regardless of the deadline, if skipped for longer
+    time_estimate: float = 0.0005  # seconds, follows the measured run time
+    frames_since_run: int = 0
+
+
+class IdleTaskScheduler:
+    """
+    Runs deferred work between the end of rendering and the deadline of the next frame, see TimeHandler.after().
+    Before each task, its estimated run time is checked against the deadline. Tasks that do not fit are skipped until
+    a frame with enough slack comes along, unless they have been skipped for more than max_delay_frames frames.
+    Tasks run in the order of registration. The deadline is passed to the callbacks, such that tasks with divisible
+    work can stop early, see PatternScheduler.prewarm_generators().
+    """
+
+    def __init__(self, get_current_time: Callable[[], float] = time.perf_counter):
+        self._get_current_time = get_current_time
+        self.tasks: list[IdleTask] = []
+
+    def register(
+        self,
+        name: str,
+        callback: Callable[[float], Any],
+        repeat: bool = True,
+        max_delay_frames: Optional[int] = None,
+    ) -> IdleTask:
+        """a task with the same name is replaced"""
+        self.unregister(name)
+        task = IdleTask(name=name, callback=callback, repeat=repeat, max_delay_frames=max_delay_frames)
+        self.tasks.append(task)
+        return task
+
+    def unregister(self, name: str) -> None:
+        self.tasks = [task for task in self.tasks if task.name != name]
+
+    def run(self, deadline: float) -> list[str]:
+        """runs the tasks that fit before the deadline, returns the names of the tasks that were run"""
+        names: list[str] = []
+        for task in list(self.tasks):
+            task.frames_since_run += 1
+            start = self._get_current_time()
+            is_overdue = task.max_delay_frames is not None and task.frames_since_run > task.max_delay_frames
+            if start + task.time_estimate > deadline and not is_overdue:
+                continue
+            task.callback(deadline)
+            run_time = self._get_current_time() - start
+            # follow increasing run times quickly and decreasing run times slowly
+            weight = 0.5 if run_time > task.time_estimate else 0.05
+            task.time_estimate += (run_time - task.time_estimate) * weight
+            task.frames_since_run = 0
+            names.append(task.name)
+            if not task.repeat:
+                self.tasks.remove(task)
+        return names
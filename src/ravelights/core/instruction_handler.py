@@ -32,6 +32,6 @@ class InstructionHandler:
         self.rendermodule.device_automatic_timeline_level = instruction.level
 
     def load_and_apply_instructions(self):
-        instructions_for_frame = cast(list[InstructionDevice], self.instruction_queue.get_instructions())
+        instructions_for_frame = cast(tuple[InstructionDevice, ...], self.instruction_queue.get_instructions())
         for ins in instructions_for_frame:
             self.apply_instruction(ins)
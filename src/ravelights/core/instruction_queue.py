@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 from ravelights.core.instruction import Instruction
 
@@ -6,35 +6,60 @@ if TYPE_CHECKING:
     from ravelights import RaveLightsApp
 
 
+class InstructionTable:
+    """
+    Instructions of a timeline, compiled into one tuple per quarter of the queue. till_quarter holds all
+    instructions from quarter 0 up to each quarter. The table is built once per timeline and shared by the
+    InstructionQueue of all devices, such that each lookup is a single index.
+    """
+
+    def __init__(self, instructions: Sequence[Sequence[Instruction]]):
+        self.at_quarter: tuple[tuple[Instruction, ...], ...] = tuple(tuple(ins) for ins in instructions)
+        till_quarter: list[tuple[Instruction, ...]] = []
+        instructions_till: tuple[Instruction, ...] = tuple()
+        for instructions_at in self.at_quarter:
+            instructions_till += instructions_at
+            till_quarter.append(instructions_till)
+        self.till_quarter: tuple[tuple[Instruction, ...], ...] = tuple(till_quarter)
+
+    @classmethod
+    def empty(cls, queue_length: int) -> "InstructionTable":
+        return cls([[] for _ in range(queue_length)])
+
+
 class InstructionQueue:
     def __init__(self, root: "RaveLightsApp"):
         self.root = root
         self.settings = self.root.settings
         self.timehandler = self.root.timehandler
-        self._instruction_queue: list[list[Instruction]]
+        self._empty_table = InstructionTable.empty(self.timehandler.queue_length)
+        self._instruction_table: InstructionTable
         self.just_initialized: bool
         self.clear()
 
     def clear(self):
-        self._instruction_queue = [[] for _ in range(self.timehandler.queue_length)]
-        self.just_initialized = True
+        self.load(self._empty_table)
 
-    def add_instruction(self, instruction: Instruction, n_quarter: int):
-        """will add the instruction into the instruction queue at position n_quarter"""
-        self._instruction_queue[n_quarter].append(instruction)
+    def load(self, instruction_table: InstructionTable):
+        """loads the instructions of a timeline, see PatternScheduler"""
+        self._instruction_table = instruction_table
+        self.just_initialized = True
 
-    def get_instructions(self) -> list[Instruction]:
+    def get_instructions(self) -> tuple[Instruction, ...]:
         """will return all instructions that have not been executed"""
         if self.just_initialized is True:
             self.just_initialized = False
-            return self._get_instructions_till(self.timehandler.n_quarters_long)
+            return self._instruction_table.till_quarter[self.timehandler.n_quarters_long]
         elif self.timehandler.beat_state.is_quarter:
-            return self._instruction_queue[self.timehandler.n_quarters_long]
-        return []
-
-    def _get_instructions_till(self, till_n_quarters: int) -> list[Instruction]:
-        """will return all instructions from timerange [0 to till_n_quarters]"""
-        out: list[Instruction] = []
-        for i in range(till_n_quarters + 1):
-            out += self._instruction_queue[i]
-        return out
+            return self._instruction_table.at_quarter[self.timehandler.n_quarters_long]
+        return tuple()
+
+    def get_upcoming_instructions(self, n_quarters: int) -> tuple[Instruction, ...]:
+        """instructions of the next n_quarters quarters, they are not marked as executed"""
+        at_quarter = self._instruction_table.at_quarter
+        n_quarters_long = self.timehandler.n_quarters_long
+        return tuple(
+            ins
+            for n_quarter in range(n_quarters_long + 1, n_quarters_long + 1 + n_quarters)
+            for ins in at_quarter[n_quarter % len(at_quarter)]
+        )
@@ -1,9 +1,9 @@
-from typing import TYPE_CHECKING, Any, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, cast
 
 from ravelights.configs.components import Keywords, blueprint_effects, blueprint_generators, blueprint_timelines
 from ravelights.core.color_handler import COLOR_TRANSITION_SPEEDS, SecondaryColorModes
 from ravelights.core.custom_typing import AvailableGenerators
-from ravelights.core.template_objects import GenPlacing
+from ravelights.core.template_objects import GeneratorIndex, GenPlacing
 
 if TYPE_CHECKING:
     from ravelights.core.ravelights_app import RaveLightsApp
@@ -29,23 +29,45 @@ class MetaHandler:
     def __init__(self, root: "RaveLightsApp"):
         self.root = root
         self.settings = root.settings
-        self.api_content: dict[str, Any] = dict()
-        self.api_content["available_timelines"] = self.get_meta_available_timelines()
-        self.api_content["available_keywords"] = self.get_meta_available_keywords()
-        self.api_content["available_generators"] = self.get_meta_available_generators()
-        self.api_content["controls_global_sliders"] = self.get_controls_global_sliders()
-        self.api_content["available_timelines_svg"] = self.get_all_timeline_svgs()  # formerly meta / timelines
-        self.api_content["steps_dict"] = self.get_effect_timelines_meta()
-        self.api_content["color_transition_speeds"] = [x.value for x in COLOR_TRANSITION_SPEEDS]
-        self.api_content["controls_autopilot"] = self.root.autopilot.get_autopilot_controls()
-        self.api_content["controls_color_palette"] = self.root.autopilot.get_color_palette()
-        self.api_content["color_sec_mode_names"] = [mode.value for mode in SecondaryColorModes]
+        # each entry is built on first access, such that nothing is built before it is requested
+        self._api_content: dict[str, Any] = dict()
+        self._builders: dict[str, Callable[[], Any]] = {
+            "available_timelines": self.get_meta_available_timelines,
+            "available_keywords": self.get_meta_available_keywords,
+            "available_generators": self.get_meta_available_generators,
+            "controls_global_sliders": self.get_controls_global_sliders,
+            "available_timelines_svg": self.get_all_timeline_svgs,  # formerly meta / timelines
+            "steps_dict": self.get_effect_timelines_meta,
+            "color_transition_speeds": lambda: [x.value for x in COLOR_TRANSITION_SPEEDS],
+            "controls_autopilot": self.root.autopilot.get_autopilot_controls,
+            "controls_color_palette": self.root.autopilot.get_color_palette,
+            "color_sec_mode_names": lambda: [mode.value for mode in SecondaryColorModes],
+        }
+        self._generator_index: Optional[GeneratorIndex] = None
+
+    @property
+    def api_content(self) -> dict[str, Any]:
+        """all entries, builds the ones that have not been requested yet"""
+        for key in self._builders:
+            self[key]
+        return self._api_content
 
     def __getitem__(self, key: str):
-        return self.api_content[key]
+        if key not in self._api_content:
+            self._api_content[key] = self._builders[key]()
+        return self._api_content[key]
 
     def __setitem__(self, key: str, value: Any):
-        self.api_content[key] = value
+        self._api_content[key] = value
+        self.root.snapshots.invalidate("meta")
+
+    @property
+    def generator_index(self) -> GeneratorIndex:
+        """index for the random selection of generators, rebuilt when available_generators is replaced"""
+        available_generators = self["available_generators"]
+        if self._generator_index is None or self._generator_index.available_generators is not available_generators:
+            self._generator_index = GeneratorIndex(available_generators)
+        return self._generator_index
 
     def get_meta_available_timelines(self) -> list[str]:
         timeline_names: list[str] = [blue["meta"]["name"] for blue in blueprint_timelines]
@@ -87,13 +109,19 @@ class MetaHandler:
 
         keys = ["pattern", "vfilter", "thinner", "dimmer", "effect"]
         meta_available_generators: AvailableGenerators = {key: [] for key in keys}
-        generators_and_effects = (
-            self.root.devices[0].rendermodule.generators_dict | self.root.effecthandler.effect_wrappers_dict
-        )
-        for generator_name, gen in generators_and_effects.items():
-            class_identifier = gen.get_identifier()
-            generator_keywords: list[str] = gen.keywords
-            generator_weight: float = gen.weight
+
+        # generators are read from their blueprints, such that they do not have to be created
+        generators_dict = self.root.devices[0].rendermodule.generators_dict
+        for generator_name in generators_dict.names():
+            if generators_dict.is_created(generator_name):
+                gen = generators_dict[generator_name]
+                class_identifier, generator_keywords, generator_weight = gen.get_identifier(), gen.keywords, gen.weight
+            else:
+                blueprint = generators_dict.get_blueprint(generator_name)
+                class_identifier, args = blueprint.get_identifier(), blueprint.args
+                keywords = cast(list[Keywords], args.get("keywords", []))
+                generator_keywords = [k.value for k in keywords]
+                generator_weight = float(cast(float, args.get("weight", 1.0)))
             meta_available_generators[class_identifier].append(
                 {
                     "generator_name": generator_name,
@@ -102,6 +130,15 @@ class MetaHandler:
                 }
             )
 
+        for effect_name, effect_wrapper in self.root.effecthandler.effect_wrappers_dict.items():
+            meta_available_generators["effect"].append(
+                {
+                    "generator_name": effect_name,
+                    "generator_keywords": effect_wrapper.keywords,
+                    "generator_weight": effect_wrapper.weight,
+                }
+            )
+
         return meta_available_generators
 
     def get_controls_global_sliders(self):
@@ -131,7 +168,7 @@ class MetaHandler:
         placements = timeline["placements"]
         items = []
         for placement in placements:
-            if placement.cls != GenPlacing:
+            if placement.get_cls() is not GenPlacing:
                 continue
 
             level: list[int] = placement.args["level"]
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, NamedTuple, cast
 
 from loguru import logger
 from ravelights.configs.components import (
@@ -11,8 +11,10 @@ from ravelights.configs.components import (
 )
 from ravelights.core.device import Device
 from ravelights.core.effect_handler import EffectHandler
+from ravelights.core.generator_dict import SharedGenerators
 from ravelights.core.generator_super import Dimmer, Pattern, Thinner, Vfilter
-from ravelights.core.instruction import InstructionDevice, InstructionEffect
+from ravelights.core.instruction import Instruction, InstructionDevice, InstructionEffect
+from ravelights.core.instruction_queue import InstructionTable
 from ravelights.core.settings import Settings
 from ravelights.core.template_objects import EffectSelectorPlacing, GenPlacing, GenSelector
 from ravelights.core.time_handler import TimeHandler
@@ -22,6 +24,12 @@ if TYPE_CHECKING:
     from ravelights.core.ravelights_app import RaveLightsApp
 
 
+class CompiledTimeline(NamedTuple):
+    placements: list[GenPlacing | EffectSelectorPlacing]
+    device_table: InstructionTable
+    effect_table: InstructionTable
+
+
 class PatternScheduler:
     def __init__(self, root: "RaveLightsApp"):
         self.root = root
@@ -30,14 +38,25 @@ class PatternScheduler:
         self.effecthandler: EffectHandler = self.root.effecthandler
         self.devices: list[Device] = self.root.devices
         self.timeline_selectors: list[GenSelector] = []
-        self.timeline_placements: list[BlueprintPlace] = []
+        self.timeline_placements: list[GenPlacing | EffectSelectorPlacing] = []
+        # placements and instruction tables of timelines without random placements, by timeline name. switching back
+        # to such a timeline does not compile it again
+        self.compiled_timelines: dict[str, CompiledTimeline] = dict()
+        # instructions of the placements by quarter, while the tables are compiled
+        self.device_instructions: list[list[Instruction]] = []
+        self.effect_instructions: list[list[Instruction]] = []
+        # generators of upcoming timeline levels are created in the slack time of the frames, see prewarm_generators
+        self.prewarm_quarters: int = 4
+        self.prewarm_time_estimate: float = 0.005  # seconds, follows the measured creation time of generators
+        self.timehandler.idle_tasks.register("prewarm_generators", self.prewarm_generators)
 
         # ─── GENERATORS ──────────────────────────────────────────────────
         self.blueprint_timelines = blueprint_timelines
+        self.shared_generators: SharedGenerators = dict()
         for device in self.devices:
-            kwargs = dict(root=self.root, device=device)
-            generators = create_from_blueprint(blueprints=blueprint_generators, kwargs=kwargs)
-            device.rendermodule.register_generators(generators=generators)
+            device.rendermodule.register_blueprints(
+                blueprints=blueprint_generators, shared_generators=self.shared_generators
+            )
 
         self.load_timeline_from_index(self.settings.active_timeline_index)
 
@@ -46,8 +65,6 @@ class PatternScheduler:
         self.load_timeline(self.blueprint_timelines[index])
 
     def load_timeline(self, timeline: BlueprintTimeline):
-        self.clear_instruction_queues()
-
         blueprints_selectors: list[BlueprintSel] = cast(list[BlueprintSel], timeline["selectors"])
         kwargs = dict(root=self.root)
         self.timeline_selectors: list[GenSelector] = create_from_blueprint(
@@ -55,10 +72,35 @@ class PatternScheduler:
         )
         self.process_timeline_selectors()
 
+        device_table, effect_table = self.get_instruction_tables(timeline)
+        for device in self.devices:
+            device.instructionhandler.instruction_queue.load(device_table)
+        self.effecthandler.instruction_queue.load(effect_table)
+
+    def get_instruction_tables(self, timeline: BlueprintTimeline) -> tuple[InstructionTable, InstructionTable]:
+        """instruction tables of the devices and of the effecthandler for the placements of the timeline"""
+        name = cast(str, timeline["meta"]["name"])
+        if name in self.compiled_timelines:
+            compiled_timeline = self.compiled_timelines[name]
+            self.timeline_placements = compiled_timeline.placements
+            return compiled_timeline.device_table, compiled_timeline.effect_table
+
         blueprints_placements: list[BlueprintPlace] = cast(list[BlueprintPlace], timeline["placements"])
         kwargs = dict(root=self.root)
         self.timeline_placements = create_from_blueprint(blueprints=blueprints_placements, kwargs=kwargs)
+        self.device_instructions = [[] for _ in range(self.timehandler.queue_length)]
+        self.effect_instructions = [[] for _ in range(self.timehandler.queue_length)]
         self.process_timeline_placements()
+        device_table = InstructionTable(self.device_instructions)
+        effect_table = InstructionTable(self.effect_instructions)
+
+        # effect placements select a random effect on creation
+        is_random = any(
+            placement.p < 1.0 or isinstance(placement, EffectSelectorPlacing) for placement in self.timeline_placements
+        )
+        if not is_random:
+            self.compiled_timelines[name] = CompiledTimeline(self.timeline_placements, device_table, effect_table)
+        return device_table, effect_table
 
     def process_timeline_selectors(self):
         self.settings.clear_selected()  # todo: should this happen?
@@ -76,12 +118,6 @@ class PatternScheduler:
             if isinstance(placement, EffectSelectorPlacing):
                 self.process_effect_placement_object(placement)
 
-    def clear_instruction_queues(self):
-        """Clears queues for global effects, device effects and instructions"""
-        for device in self.devices:
-            device.instructionhandler.instruction_queue.clear()
-        self.effecthandler.instruction_queue.clear()
-
     def process_selector_object(self, obj: GenSelector):
         # load each generator that is defined inside of the GenSelector Object
         renew_trigger = self.settings.renew_trigger_from_timeline
@@ -116,11 +152,45 @@ class PatternScheduler:
             self.send_to_effect(instruction, timing=timing)
 
     def send_to_devices(self, ins: InstructionDevice, timing: int):
-        for device in self.devices:
-            device.instructionhandler.instruction_queue.add_instruction(ins, n_quarter=timing)
+        """the instructions of the devices are shared by all devices"""
+        self.device_instructions[timing].append(ins)
 
     def send_to_effect(self, ins: InstructionEffect, timing: int):
-        self.effecthandler.instruction_queue.add_instruction(ins, n_quarter=timing)
+        self.effect_instructions[timing].append(ins)
 
     def generate_instructions(self):
         pass
+
+    # ─── PRE-WARM ────────────────────────────────────────────────────
+
+    def get_upcoming_levels(self) -> set[int]:
+        """timeline levels that the devices switch to within the next prewarm_quarters quarters"""
+        # the instruction table is shared by all devices, see send_to_devices
+        instruction_queue = self.devices[0].instructionhandler.instruction_queue
+        instructions = instruction_queue.get_upcoming_instructions(self.prewarm_quarters)
+        return {cast(InstructionDevice, ins).level for ins in instructions}
+
+    def prewarm_generators(self, deadline: float):
+        """
+        Creates the selected generators of upcoming timeline levels, such that the first frame after the level
+        switch does not pay for init(), alternate() and reset(), see GeneratorDict. A generator is only created if
+        its estimated creation time fits before the deadline, the remaining ones follow in the next frames.
+        """
+        levels = self.get_upcoming_levels()
+        if not levels:
+            return
+        for device in self.devices:
+            rendermodule = device.rendermodule
+            for level in levels:
+                for gen_type, gen_level in rendermodule.get_generator_levels(level).items():
+                    gen_name = self.settings.selected[gen_type][gen_level]
+                    if rendermodule.generators_dict.is_created(gen_name):
+                        continue
+                    start = self.timehandler.get_current_time()
+                    if start + self.prewarm_time_estimate > deadline:
+                        return
+                    rendermodule.get_generator_by_name(gen_name)
+                    creation_time = self.timehandler.get_current_time() - start
+                    # follow increasing creation times quickly and decreasing creation times slowly
+                    weight = 0.5 if creation_time > self.prewarm_time_estimate else 0.05
+                    self.prewarm_time_estimate += (creation_time - self.prewarm_time_estimate) * weight
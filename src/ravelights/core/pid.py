@@ -1,5 +1,8 @@
 from enum import auto
+from typing import Optional
 
+import numpy as np
+from ravelights.core.custom_typing import ArrayFloat
 from ravelights.core.utils import StrEnum
 
 
@@ -15,6 +18,17 @@ class PIDSpeeds(StrEnum):
     SLOW_BOUNCY = auto()
 
 
+# kp, kd, ki, dt for each speed. PIDSpeeds.INSTANT skips the pid dynamics and has no parameters
+PID_PRESETS: dict[str, tuple[float, float, float, float]] = {
+    PIDSpeeds.FAST.value: (0.2, 0.1, 0.0, 1 / 20),
+    PIDSpeeds.FAST_BOUNCY.value: (0.2, 0.1, 0.0, 1 / 20),  # todo
+    PIDSpeeds.MEDIUM.value: (0.3, 0.05, 0.0, 1 / 20),
+    PIDSpeeds.MEDIUM_BOUNCY.value: (0.5, 0.1, 0.0, 1 / 20),
+    PIDSpeeds.SLOW.value: (0.2, 0.1, 0.0, 1 / 100),
+    PIDSpeeds.SLOW_BOUNCY.value: (0.2, 0.1, 0.0, 1 / 100),
+}
+
+
 class PIDController:
     """
     simple implementation of a PID controller
@@ -55,59 +69,77 @@ class PIDController:
         self._ddx = self.force / self.m
 
     def load_parameter_preset(self, preset: str):
-        match preset:
-            case PIDSpeeds.INSTANT.value:
-                self.instant = True
-
-            case PIDSpeeds.FAST.value:
-                self.instant = False
-                self.kp = 0.2
-                self.kd = 0.1
-                self.ki = 0.0
-                self.dt = 1 / 20
-
-            case PIDSpeeds.FAST.value:
-                self.instant = False
-                self.kp = 0.2
-                self.kd = 0.1
-                self.ki = 0.0
-                self.dt = 1 / 20
-
-            case PIDSpeeds.FAST_BOUNCY.value:
-                self.instant = False
-                # todo
-                self.kp = 0.2
-                self.kd = 0.1
-                self.ki = 0.0
-                self.dt = 1 / 20
-
-            case PIDSpeeds.MEDIUM.value:
-                self.instant = False
-                self.kp = 0.3
-                self.kd = 0.05
-                self.ki = 0.0
-                self.dt = 1 / 20
-
-            case PIDSpeeds.MEDIUM_BOUNCY.value:
-                self.instant = False
-                self.kp = 0.5
-                self.kd = 0.1
-                self.ki = 0.0
-                self.dt = 1 / 20
-
-            case PIDSpeeds.SLOW.value:
-                self.instant = False
-                self.kp = 0.2
-                self.kd = 0.1
-                self.ki = 0.0
-                self.dt = 1 / 100
-
-            case PIDSpeeds.SLOW_BOUNCY.value:
-                self.instant = False
-                self.kp = 0.2
-                self.kd = 0.1
-                self.ki = 0.0
-                self.dt = 1 / 100
-
-            case _:
-                pass
+        if preset == PIDSpeeds.INSTANT.value:
+            self.instant = True
+        elif preset in PID_PRESETS:
+            self.instant = False
+            self.kp, self.kd, self.ki, self.dt = PID_PRESETS[preset]
+
+
+class PIDBank:
+    """
+    n independent PID controllers with the same dynamics as PIDController. The state and the gains of all
+    controllers are stored in numpy arrays, perform_pid_step() advances all controllers at once.
+    set targets with object.target[index] or object.target[:]
+    read current values with object.value
+    """
+
+    def __init__(
+        self,
+        n: int,
+        start_val: float | ArrayFloat = 0.0,
+        kp: float = 0.2,
+        kd: float = 0.1,
+        ki: float = 0.0,
+        dt: float = 1 / 20,
+        instant: bool = False,
+    ) -> None:
+        self.n = n
+        self.target: ArrayFloat = np.zeros(n)
+        self.target[:] = start_val
+        self._x: ArrayFloat = self.target.copy()  # read value property instead
+        self._dx: ArrayFloat = np.zeros(n)
+        self._ddx: ArrayFloat = np.zeros(n)
+        self._previous_error: ArrayFloat = np.zeros(n)
+        self._integral: ArrayFloat = np.zeros(n)
+        self.m: float = 0.01
+
+        self.kp: ArrayFloat = np.full(n, kp, dtype=float)
+        self.kd: ArrayFloat = np.full(n, kd, dtype=float)
+        self.ki: ArrayFloat = np.full(n, ki, dtype=float)
+        self.dt: float = dt
+
+        self.instant: bool = instant
+
+    @property
+    def value(self) -> ArrayFloat:
+        return self.target if self.instant else self._x
+
+    def set_gains(self, kp: Optional[float] = None, kd: Optional[float] = None, ki: Optional[float] = None):
+        """sets the gains of all controllers"""
+        if kp is not None:
+            self.kp.fill(kp)
+        if kd is not None:
+            self.kd.fill(kd)
+        if ki is not None:
+            self.ki.fill(ki)
+
+    def perform_pid_step(self):
+        error = self.target - self._x
+        derivative = (error - self._previous_error) / self.dt
+        self._previous_error = error
+        self._integral += error * self.dt
+        force = self.kp * error + self.ki * self._integral + self.kd * derivative
+
+        self._x += self._dx * self.dt + 0.5 * self._ddx * (self.dt**2)
+        self._dx += self._ddx * self.dt
+        self._dx *= 0.7
+        self._ddx = force / self.m
+
+    def load_parameter_preset(self, preset: str):
+        if preset == PIDSpeeds.INSTANT.value:
+            self.instant = True
+        elif preset in PID_PRESETS:
+            self.instant = False
+            kp, kd, ki, self.dt = PID_PRESETS[preset]
+            self.set_gains(kp=kp, kd=kd, ki=ki)
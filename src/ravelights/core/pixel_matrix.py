@@ -1,5 +1,5 @@
 import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 from numpy.typing import NDArray
@@ -24,24 +24,39 @@ class PixelMatrix:
 
     def reset(self) -> None:
         self.matrix_float: ArrayFloat = np.zeros(shape=(self.n_lights, self.n_leds, 3))
+        self.gain: float = 1.0
 
-    def set_matrix_float(self, matrix: ArrayFloat):
+    def set_matrix_float(self, matrix: ArrayFloat, gain: float = 1.0):
         """
         matrix with:
         shape: (self.n_leds, self.n_lights, 3)
         value range: [0, 1]
         dtype: float
 
+        gain: scalar that is not applied to matrix yet, for example the gain of a dimmer. It is applied in
+        the output conversion, see get_matrix_int()
         """
         assert np.max(matrix) <= 1.0
         assert matrix.shape == (self.n_leds, self.n_lights, 3)
         self.matrix_float = matrix
+        self.gain = gain
 
     def get_matrix_float(self) -> ArrayFloat:
-        return self.matrix_float
+        """matrix with the gain applied"""
+        if self.gain == 1.0:
+            return self.matrix_float
+        return self.matrix_float * self.gain
 
-    def get_matrix_int(self, brightness: float = 1.0) -> ArrayUInt8:
-        return (self.matrix_float * 255 * brightness).astype(np.uint8)
+    def get_matrix_int(self, brightness: float = 1.0, lut: Optional[ArrayUInt8] = None) -> ArrayUInt8:
+        """
+        Converts to the led signal in a single pass over the matrix. brightness and gain are folded into one
+        scalar. lut maps brightness to the led signal, see ColorProfilesLuts. Without lut, the mapping is linear.
+        """
+        gain = self.gain * brightness
+        if lut is None:
+            return (self.matrix_float * (255 * gain)).astype(np.uint8)
+        index = (self.matrix_float * ((len(lut) - 1) * gain)).astype(np.intp)
+        return lut[index]
 
     def get_ledid_lightid_from_index(self, index: int):
         """gives led_id and light_id for any index.
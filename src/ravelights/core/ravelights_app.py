@@ -1,4 +1,5 @@
 from dataclasses import asdict
+from typing import TYPE_CHECKING, Optional
 
 from loguru import logger
 from ravelights import DeviceLightConfig, TransmitterConfig
@@ -9,6 +10,7 @@ from ravelights.core.event_handler import EventHandler
 from ravelights.core.meta_handler import MetaHandler
 from ravelights.core.pattern_scheduler import PatternScheduler
 from ravelights.core.settings import Settings
+from ravelights.core.state_snapshots import StateSnapshots
 from ravelights.core.time_handler import TimeHandler
 from ravelights.interface.data_router import (
     DataRouter,
@@ -16,8 +18,12 @@ from ravelights.interface.data_router import (
     DataRouterVisualizer,
     DataRouterWebsocket,
 )
-from ravelights.interface.discovery import connectivity_check, discovery_service
-from ravelights.interface.rest_api import RestAPI
+from ravelights.interface.interface_backend import dumps_json, get_settings_data
+
+if TYPE_CHECKING:
+    from ravelights.interface.audio.audio_source import AudioSource
+    from ravelights.interface.audio.beat_tracker import BeatTracker
+    from ravelights.interface.interface_backend import InterfaceBackend
 
 
 class RaveLightsApp:
@@ -27,12 +33,16 @@ class RaveLightsApp:
         fps: int = 20,
         webui_port: int = 80,
         serve_webui: bool = True,
+        interface_backend: Optional["InterfaceBackend | str"] = "flask",
         device_config: list[DeviceLightConfig] = [DeviceLightConfig(n_lights=2, n_leds=100)],
         transmitter_recipes: list[TransmitterConfig] = [],
         use_visualizer: bool = False,
+        visualizer_fps: Optional[float] = None,
         print_stats: bool = False,
+        audio_source: Optional["AudioSource"] = None,
         run: bool = True,
     ):
+        self.snapshots = StateSnapshots()
         self.settings = Settings(root_init=self, device_config=device_config, fps=fps, bpm_base=140.0)
         self.timehandler = TimeHandler(root=self)
         self.devices = [Device(root=self, device_id=idx, **asdict(conf)) for idx, conf in enumerate(device_config)]
@@ -41,28 +51,51 @@ class RaveLightsApp:
         self.patternscheduler = PatternScheduler(root=self)
         self.metahandler = MetaHandler(root=self)
         self.eventhandler = EventHandler(root=self)
+        self.register_snapshots()
+
+        # the interface modules pull in flask, zeroconf and requests, so they are imported here and not on
+        # import of ravelights
+        from ravelights.interface.discovery.discovery_supervisor import DiscoverySupervisor
+        from ravelights.interface.interface_backend import create_interface
 
+        self.discovery_supervisor = DiscoverySupervisor()
         self.data_routers = self.initiate_data_routers(transmitter_recipes)
 
-        self.rest_api = RestAPI(
-            root=self,
-            serve_webui=serve_webui,
-            port=webui_port,
-        )
+        # without interface backend, the app is only controlled through the eventhandler, see render_process
+        if interface_backend is not None:
+            self.rest_api = create_interface(
+                root=self,
+                backend=interface_backend,
+                serve_webui=serve_webui,
+                port=webui_port,
+            )
 
         self.use_visualizer = use_visualizer
+        self.visualizer_fps = visualizer_fps  # None: the visualizer is drawn on every frame
         self.print_stats = print_stats
 
-        connectivity_check.wait_until_connected_to_network()
-        discovery_service.start()
+        self.beat_tracker: Optional["BeatTracker"] = None
+        if audio_source is not None:
+            from ravelights.interface.audio.beat_tracker import BeatTracker
 
-        if run:
-            if self.use_visualizer:
-                from ravelights.interface.visualizer import Visualizer
+            self.beat_tracker = BeatTracker(root=self, source=audio_source)
+            self.beat_tracker.start()
+
+        # network and pixeldriver discovery are handled in the background, rendering starts right away
+        if transmitter_recipes:
+            self.discovery_supervisor.start()
 
-                self.visualizer = Visualizer(root=self)
+        if run:
             self.run()
 
+    def register_snapshots(self) -> None:
+        """json of the state sections that are served by the interface, see StateSnapshots"""
+        self.snapshots.register("settings", lambda: get_settings_data(self), serialize=dumps_json)
+        self.snapshots.register("triggers", lambda: self.settings.triggers, serialize=dumps_json)
+        self.snapshots.register("meta", lambda: self.metahandler.api_content, serialize=dumps_json)
+        # sections that are served to clients are serialized in the slack time of the frames instead of on request
+        self.timehandler.idle_tasks.register("build_snapshots", lambda deadline: self.snapshots.build_stale())
+
     def initiate_data_routers(self, transmitter_recipes: list[TransmitterConfig]) -> list[DataRouter]:
         data_routers: list[DataRouter] = [DataRouterVisualizer(root=self), DataRouterWebsocket(root=self)]
         for receipt in transmitter_recipes:
@@ -74,6 +107,10 @@ class RaveLightsApp:
         return data_routers
 
     def run(self):
+        if self.use_visualizer:
+            from ravelights.interface.visualizer import Visualizer
+
+            self.visualizer = Visualizer(root=self, preview_fps=self.visualizer_fps)
         logger.info("Starting main loop...")
         while True:
             self.render_frame()
@@ -118,6 +155,7 @@ class RaveLightsApp:
         self.timehandler.after()
 
     def refresh_ui(self, sse_event: str):
+        # every ui refresh is caused by a change of settings, triggers or colors
+        self.snapshots.invalidate("settings", "triggers")
         if hasattr(self, "rest_api"):
-            self.rest_api.sse_event = sse_event
-            self.rest_api.sse_unblock_event.set()
+            self.rest_api.sse_broker.publish(sse_event)
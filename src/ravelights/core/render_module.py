@@ -1,7 +1,8 @@
 from typing import TYPE_CHECKING, Literal, Optional, cast, overload
 
-from loguru import logger
-from ravelights.core.custom_typing import ArrayFloat, assert_dims
+from ravelights.core.color_handler import Color
+from ravelights.core.custom_typing import ArrayFloat, BlueprintGen, assert_dims
+from ravelights.core.generator_dict import GeneratorDict, SharedGenerators
 from ravelights.core.generator_super import Dimmer, Generator, Pattern, Thinner, Vfilter
 from ravelights.core.pixel_matrix import PixelMatrix
 from ravelights.core.settings import Settings
@@ -22,7 +23,7 @@ class RenderModule:
         self.device_automatic_timeline_level = 0
         self.counter_frame = 0  # for frameskip
         self.matrix_memory = self.pixelmatrix.matrix_float.copy()
-        self.generators_dict: dict[str, Pattern | Vfilter | Thinner | Dimmer] = dict()
+        self.generators_dict = GeneratorDict(root=self.root, device=self.device, shared_generators=dict())
 
     def get_selected_trigger(
         self,
@@ -83,21 +84,30 @@ class RenderModule:
         else:
             return self.device_automatic_timeline_level
 
+    def get_generator_levels(
+        self, timeline_level: int
+    ) -> dict[Literal["pattern", "pattern_sec", "vfilter", "dimmer", "thinner"], int]:
+        """timeline level of each generator type, global generators are always taken from level 1"""
+        return {
+            "pattern": timeline_level,
+            "pattern_sec": 1 if self.settings.global_pattern_sec else timeline_level,
+            "vfilter": 1 if self.settings.global_vfilter else timeline_level,
+            "thinner": 1 if self.settings.global_thinner else timeline_level,
+            "dimmer": 1 if self.settings.global_dimmer else timeline_level,
+        }
+
     def render(self) -> None:
         # ---------------------------- get timeline_level ---------------------------- #
         timeline_level = self.get_timeline_level()
-        timeline_level_pattern_sec = 1 if self.settings.global_pattern_sec else timeline_level
-        timeline_level_vfilter = 1 if self.settings.global_vfilter else timeline_level
-        timeline_level_thinner = 1 if self.settings.global_thinner else timeline_level
-        timeline_level_dimmer = 1 if self.settings.global_dimmer else timeline_level
+        levels = self.get_generator_levels(timeline_level)
 
         # ------------------------------ get generators ------------------------------ #
         # fmt: off
-        pattern: Pattern = self.get_selected_generator(gen_type="pattern", timeline_level=timeline_level) # type: ignore[type-abstract]
-        pattern_sec: Pattern = self.get_selected_generator(gen_type="pattern_sec", timeline_level=timeline_level_pattern_sec)
-        vfilter: Vfilter = self.get_selected_generator(gen_type="vfilter", timeline_level=timeline_level_vfilter) # type: ignore[type-abstract]
-        thinner: Thinner = self.get_selected_generator(gen_type="thinner", timeline_level=timeline_level_thinner) # type: ignore[type-abstract]
-        dimmer: Dimmer = self.get_selected_generator(gen_type="dimmer", timeline_level=timeline_level_dimmer) # type: ignore[type-abstract]
+        pattern: Pattern = self.get_selected_generator(gen_type="pattern", timeline_level=levels["pattern"]) # type: ignore[type-abstract]
+        pattern_sec: Pattern = self.get_selected_generator(gen_type="pattern_sec", timeline_level=levels["pattern_sec"])
+        vfilter: Vfilter = self.get_selected_generator(gen_type="vfilter", timeline_level=levels["vfilter"]) # type: ignore[type-abstract]
+        thinner: Thinner = self.get_selected_generator(gen_type="thinner", timeline_level=levels["thinner"]) # type: ignore[type-abstract]
+        dimmer: Dimmer = self.get_selected_generator(gen_type="dimmer", timeline_level=levels["dimmer"]) # type: ignore[type-abstract]
         # fmt: on
         # ------------------------ validate thinner and dimmer ----------------------- #
         if pattern.p_add_thinner == 1.0 and thinner.name == "t_none":
@@ -153,31 +163,60 @@ class RenderModule:
         assert_dims(matrix, self.pixelmatrix.n_leds, self.pixelmatrix.n_lights, 3)
 
         # ─── RENDER DIMMER ───────────────────────────────────────────────
-        matrix = dimmer.render(matrix, colors=colors)
-        assert_dims(matrix, self.pixelmatrix.n_leds, self.pixelmatrix.n_lights, 3)
+        # a scalar gain is not applied here, but in the output conversion of the pixelmatrix together with the
+        # brightness, such that it does not take an extra pass over the matrix
+        gain = dimmer.get_gain()
+        if gain is None:
+            matrix = dimmer.render(matrix, colors=colors)
+            assert_dims(matrix, self.pixelmatrix.n_leds, self.pixelmatrix.n_lights, 3)
+            gain = 1.0
 
         # ─── Render Effects ───────────────────────────────────────────────
-        in_matrix = matrix.copy()
-        for effect_wrapper in self.root.effecthandler.effective_effect_queue:
-            out_matrix = effect_wrapper.render(in_matrix=matrix, colors=colors, device_id=self.device.device_id)
-            if effect_wrapper.draw_mode == "overlay":
-                matrix = Generator.merge_matrices(matrix, out_matrix)
-            elif effect_wrapper.draw_mode == "normal":
-                matrix = out_matrix
-            else:
-                logger.error("illegal effect_wrapper.draw_mode")
-
-        # global thing
-        if self.settings.global_effect_draw_mode == "overlay":
-            matrix = Generator.merge_matrices(in_matrix, matrix)
+        matrix, gain = self.render_effects(matrix, gain=gain, colors=colors)
         assert_dims(matrix, self.pixelmatrix.n_leds, self.pixelmatrix.n_lights, 3)
 
         # ─── Send To Pixelmatrix ──────────────────────────────────────
-        self.pixelmatrix.set_matrix_float(matrix)
+        self.pixelmatrix.set_matrix_float(matrix, gain=gain)
+
+    def render_effects(self, matrix: ArrayFloat, gain: float, colors: list[Color]) -> tuple[ArrayFloat, float]:
+        """renders the render plan of the effecthandler. gain has not been applied to matrix yet, see render()"""
+        render_plan = self.root.effecthandler.render_plan
+        if not render_plan:
+            return matrix, gain
+
+        global_overlay = self.settings.global_effect_draw_mode == "overlay"
+        if global_overlay:
+            matrix, gain = matrix * gain, 1.0
+            in_matrix = matrix.copy()
+        device_id = self.device.device_id
+        for effect_step in render_plan:
+            effect = effect_step.effects[device_id]
+            # effects with a scalar gain are folded into the gain, as long as they replace the matrix
+            if not effect_step.is_overlay:
+                effect_gain = effect.get_gain()
+                if effect_gain is not None:
+                    gain *= effect_gain
+                    continue
+            # all other effects need the matrix with the gain applied
+            if gain != 1.0:
+                matrix, gain = matrix * gain, 1.0
+            out_matrix = effect.render_matrix(in_matrix=matrix, colors=colors)
+            matrix = Generator.merge_matrices(matrix, out_matrix) if effect_step.is_overlay else out_matrix
+
+        # global thing
+        if global_overlay:
+            matrix, gain = matrix * gain, 1.0
+            matrix = Generator.merge_matrices(in_matrix, matrix)
+        return matrix, gain
 
     def register_generators(self, generators: list[Pattern | Vfilter | Dimmer | Thinner]) -> None:
         for generator in generators:
-            self.generators_dict.update({generator.name: generator})
+            self.generators_dict.add_generator(generator)
+
+    def register_blueprints(self, blueprints: list[BlueprintGen], shared_generators: SharedGenerators) -> None:
+        """generators are created on first selection, see GeneratorDict"""
+        self.generators_dict.shared_generators = shared_generators
+        self.generators_dict.add_blueprints(blueprints)
 
     def find_generator(self, name: str) -> Pattern | Vfilter | Dimmer | Thinner:
         return self.generators_dict[name]
@@ -0,0 +1,322 @@
+import _thread
+import functools
+import multiprocessing
+import queue
+import threading
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Optional
+
+from loguru import logger
+from ravelights.core.custom_typing import TransmitterConfig
+from ravelights.core.device_shared import DeviceLightConfig
+from ravelights.core.shared_frames import SharedFrameRing, get_frame_shapes
+from ravelights.core.state_snapshots import StateSnapshots
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+
+    from ravelights.core.event_handler import EventHandler
+    from ravelights.core.ravelights_app import RaveLightsApp
+    from ravelights.interface.audio.audio_source import AudioSource
+    from ravelights.interface.audio.beat_tracker import BeatTracker
+    from ravelights.interface.data_router import DataRouter
+    from ravelights.interface.interface_backend import InterfaceBackend
+
+
+# ─── Render Process ───────────────────────────────────────────────────────────
+
+
+class StatePublisher:
+    """
+    Takes the place of the interface in the render process. Sends the sse topics and the state that is served by
+    the interface (snapshots, devices, effect queues) to the interface process, whenever it has changed.
+    """
+
+    def __init__(self, root: "RaveLightsApp", state_queue: "Queue[tuple]"):
+        from ravelights.interface.sse_broker import SseBroker
+
+        self.root = root
+        self.state_queue = state_queue
+        self.websocket_num_clients: int = 0  # the websocket is served from the frames in the interface process
+        self.sse_broker = SseBroker(window=1 / self.root.settings.fps)
+        self._client = self.sse_broker.subscribe()
+        self._versions: dict[str, int] = dict()
+        self._data: dict[str, Any] = dict()
+
+    def send_websocket(self, data: bytes) -> None:
+        pass
+
+    def start(self) -> None:
+        self.publish_state()
+        self.state_queue.put(("ready",))
+        self.sse_broker.start()
+        threading.Thread(target=self._run, name="state_publisher", daemon=True).start()
+
+    def _run(self) -> None:
+        while True:
+            topic = self._client.get(timeout=self.sse_broker.window)
+            self.forward(topic)
+
+    def forward(self, topic: Optional[str]) -> None:
+        """
+        the state is sent before the topic, such that the ui fetches the new state. the state is read while the render
+        thread changes it, errors are logged and the next call tries again, such that the mirror is not frozen
+        """
+        try:
+            self.publish_state()
+            if topic is not None:
+                self.state_queue.put(("sse", topic))
+        except Exception:
+            logger.exception("failed to publish the state of the render process")
+
+    def publish_state(self) -> None:
+        from ravelights.interface.interface_backend import get_devices_data, get_effect_queues_data
+
+        for name, section in self.root.snapshots.sections.items():
+            if self._versions.get(name) != section.version:
+                snapshot = section.get()
+                self._versions[name] = snapshot.version
+                self.state_queue.put(("snapshot", name, snapshot.body))
+
+        # devices and effect queues are small and not always changed with a ui refresh, so they are compared instead
+        for name, data in [("devices", get_devices_data(self.root)), ("effect", get_effect_queues_data(self.root))]:
+            if self._data.get(name) != data:
+                self._data[name] = data
+                self.state_queue.put((name, data))
+
+
+def forward_commands(command_queue: "Queue[Optional[dict[str, Any]]]", eventhandler: "EventHandler") -> None:
+    """commands of the interface process are added to the modification queue. stops the render loop on None or if
+    the interface process has died"""
+    parent_process = multiprocessing.parent_process()
+    while True:
+        try:
+            receive_data = command_queue.get(timeout=1.0)
+        except queue.Empty:
+            if parent_process is not None and not parent_process.is_alive():
+                break
+            continue
+        if receive_data is None:
+            break
+        eventhandler.add_to_modification_queue(receive_data=receive_data)
+    _thread.interrupt_main()
+
+
+def run_render_process(
+    app_kwargs: dict[str, Any],
+    frames_name: str,
+    n_slots: int,
+    command_queue: "Queue[Optional[dict[str, Any]]]",
+    state_queue: "Queue[tuple]",
+) -> None:
+    """entry point of the render process"""
+    from ravelights.core.ravelights_app import RaveLightsApp
+    from ravelights.interface.data_router import DataRouterSharedMemory
+
+    # the visualizer shows render state such as the selected generators, so it stays in the render process
+    app = RaveLightsApp(**app_kwargs, interface_backend=None, transmitter_recipes=[], run=False)
+    frames = SharedFrameRing.attach(frames_name, shapes=get_frame_shapes(app_kwargs["device_config"]), n_slots=n_slots)
+    app.data_routers.append(DataRouterSharedMemory(root=app, frames=frames))
+    state_publisher = StatePublisher(root=app, state_queue=state_queue)
+    app.rest_api = state_publisher  # type: ignore
+    state_publisher.start()
+    threading.Thread(
+        target=forward_commands, args=(command_queue, app.eventhandler), name="command_forwarder", daemon=True
+    ).start()
+    try:
+        app.run()
+    except KeyboardInterrupt:
+        logger.info("Render process stopped")
+    finally:
+        frames.close()
+
+
+# ─── Interface Process ────────────────────────────────────────────────────────
+
+
+class CommandForwarder:
+    """takes the place of the eventhandler in the interface process, see EventHandler.add_to_modification_queue"""
+
+    def __init__(self, command_queue: "Queue[Optional[dict[str, Any]]]"):
+        self.command_queue = command_queue
+
+    def add_to_modification_queue(self, receive_data: dict[str, Any]) -> None:
+        self.command_queue.put(receive_data)
+
+
+class RaveLightsMultiProcessApp:
+    """
+    Same as RaveLightsApp, but the render loop runs in its own process, such that load on the interface (requests,
+    websocket, sse) cannot cause frame jitter. Rendered frames are published through a SharedFrameRing. This
+    process serves the interface from a mirror of the render state, forwards api commands to the EventHandler of
+    the render process, and runs the output loop that sends the frames to the transmitters and the websocket.
+    """
+
+    def __init__(
+        self,
+        *,
+        fps: int = 20,
+        webui_port: int = 80,
+        serve_webui: bool = True,
+        interface_backend: Optional["InterfaceBackend | str"] = "flask",
+        device_config: list[DeviceLightConfig] = [DeviceLightConfig(n_lights=2, n_leds=100)],
+        transmitter_recipes: list[TransmitterConfig] = [],
+        use_visualizer: bool = False,
+        visualizer_fps: Optional[float] = None,
+        print_stats: bool = False,
+        audio_source: Optional["AudioSource"] = None,
+        run: bool = True,
+        n_slots: int = 3,
+        startup_timeout: float = 60.0,
+    ):
+        # ─── Render Process ───────────────────────────────────────────
+        # spawn, such that the render process does not inherit the transmitters, sockets and threads of this process
+        context = multiprocessing.get_context("spawn")
+        self.frames = SharedFrameRing.create(shapes=get_frame_shapes(device_config), n_slots=n_slots)
+        self.command_queue: "Queue[Optional[dict[str, Any]]]" = context.Queue()
+        self.state_queue: "Queue[tuple]" = context.Queue()
+        app_kwargs = dict(
+            fps=fps,
+            device_config=device_config,
+            use_visualizer=use_visualizer,
+            visualizer_fps=visualizer_fps,
+            print_stats=print_stats,
+        )
+        self.render_process = context.Process(
+            target=run_render_process,
+            args=(app_kwargs, self.frames.name, n_slots, self.command_queue, self.state_queue),
+            name="ravelights_render",
+            daemon=True,
+        )
+        self.render_process.start()
+
+        # ─── Mirror of the Render State ───────────────────────────────
+        self.settings = SimpleNamespace(fps=fps)
+        self.snapshots = StateSnapshots()
+        self._snapshot_bodies: dict[str, bytes] = dict()
+        self.devices = [
+            SimpleNamespace(device_id=device_id, n_leds=conf.n_leds, n_lights=conf.n_lights)
+            for device_id, conf in enumerate(device_config)
+        ]
+        self.effecthandler = SimpleNamespace(effect_queues=[])
+        self.eventhandler = CommandForwarder(command_queue=self.command_queue)
+
+        self._ready = threading.Event()
+        threading.Thread(target=self._receive_state, name="state_receiver", daemon=True).start()
+        self.wait_until_ready(timeout=startup_timeout)
+
+        # ─── Interface and Outputs ────────────────────────────────────
+        from ravelights.interface.discovery.discovery_supervisor import DiscoverySupervisor
+        from ravelights.interface.interface_backend import create_interface
+
+        self.discovery_supervisor = DiscoverySupervisor()
+        self.data_routers = self.initiate_data_routers(transmitter_recipes)
+        self.frame_buffer = self.frames.create_frame_buffer()
+        self.torn_frame_counter: int = 0
+
+        if interface_backend is not None:
+            self.rest_api = create_interface(
+                root=self,  # type: ignore
+                backend=interface_backend,
+                serve_webui=serve_webui,
+                port=webui_port,
+            )
+
+        self.beat_tracker: Optional["BeatTracker"] = None
+        if audio_source is not None:
+            from ravelights.interface.audio.beat_tracker import BeatTracker
+
+            self.beat_tracker = BeatTracker(root=self, source=audio_source)  # type: ignore
+            self.beat_tracker.start()
+
+        if transmitter_recipes:
+            self.discovery_supervisor.start()
+
+        if run:
+            self.run()
+
+    def wait_until_ready(self, timeout: float) -> None:
+        """waits until the render process has sent its initial state"""
+        for _ in range(int(timeout / 0.1)):
+            if self._ready.wait(timeout=0.1):
+                return
+            if not self.render_process.is_alive():
+                break
+        self.stop()
+        raise RuntimeError("render process did not start")
+
+    def initiate_data_routers(self, transmitter_recipes: list[TransmitterConfig]) -> list["DataRouter"]:
+        from ravelights.interface.data_router import DataRouterTransmitter, DataRouterWebsocket
+
+        data_routers: list["DataRouter"] = [DataRouterWebsocket(root=self)]  # type: ignore
+        for receipt in transmitter_recipes:
+            data_router_transmitter = DataRouterTransmitter(root=self)  # type: ignore
+            data_router_transmitter.apply_transmitter_receipt(**receipt)
+            data_routers.append(data_router_transmitter)
+        return data_routers
+
+    def _receive_state(self) -> None:
+        while True:
+            try:
+                message = self.state_queue.get(timeout=1.0)
+            except queue.Empty:
+                if not self.render_process.is_alive():
+                    return
+                continue
+            self.apply_state(message)
+
+    def apply_state(self, message: tuple) -> None:
+        match message:
+            case ("snapshot", name, body):
+                if name not in self.snapshots.sections:
+                    builder = functools.partial(self._snapshot_bodies.__getitem__, name)
+                    self.snapshots.register(name, builder, serialize=bytes.decode)
+                self._snapshot_bodies[name] = body
+                self.snapshots.invalidate(name)
+            case ("devices", data):
+                for device, device_data in zip(self.devices, data):
+                    vars(device).update(device_data)
+            case ("effect", data):
+                self.effecthandler.effect_queues = [[SimpleNamespace(**effect) for effect in q] for q in data]
+            case ("sse", topic):
+                if hasattr(self, "rest_api"):
+                    self.rest_api.sse_broker.publish(topic)
+            case ("ready",):
+                self._ready.set()
+
+    def run(self) -> None:
+        """output loop, sends every frame of the render process to the data routers"""
+        logger.info("Starting output loop...")
+        sequence = 0
+        while self.render_process.is_alive():
+            sequence, frames = self.frames.wait_for_frame(sequence, timeout=1.0)
+            if frames is not None:
+                self.transmit_frame(sequence)
+        logger.error("Render process has stopped")
+
+    def transmit_frame(self, sequence: int) -> bool:
+        """
+        the frame is copied out of the ring before it is sent, such that slow data routers cannot send a frame whose
+        slot is overwritten by the render process. frames that were overwritten while copying are dropped
+        """
+        if not self.frames.copy_frame(sequence, out=self.frame_buffer):
+            self.torn_frame_counter += 1
+            logger.debug(f"dropped frame {sequence}, it was overwritten while copying")
+            return False
+        matrices_processed_int, matrices_int = self.frame_buffer
+        for datarouter in self.data_routers:
+            datarouter.transmit_matrix(matrices_processed_int, matrices_int)
+        return True
+
+    def stop(self) -> None:
+        beat_tracker: Optional["BeatTracker"] = getattr(self, "beat_tracker", None)
+        if beat_tracker is not None:
+            beat_tracker.stop()
+        if hasattr(self, "discovery_supervisor"):
+            self.discovery_supervisor.stop()
+        self.command_queue.put(None)
+        self.render_process.join(timeout=5.0)
+        if self.render_process.is_alive():
+            self.render_process.terminate()
+            self.render_process.join()
+        self.frames.close()
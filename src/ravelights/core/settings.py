@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Optional, Type
 from loguru import logger
 from ravelights.core.color_handler import COLOR_TRANSITION_SPEEDS, ColorEngine, SecondaryColorModes
 from ravelights.core.device_shared import DeviceLightConfig
+from ravelights.core.frame_scheduler import FrameDropPolicies
 from ravelights.core.generator_super import Dimmer, Generator, Pattern, Thinner, Vfilter
 from ravelights.core.time_handler import BeatStatePattern
 from ravelights.core.utils import StrEnum
@@ -118,6 +119,9 @@ class Settings:
     fps: int = 20
     queue_length: int = 32 * 4
     global_frameskip: int = 1  # must be >= 1
+    frame_drop_policy: str = FrameDropPolicies.SKIP.value
+    audio_beat_tracking: bool = True  # follow bpm and beat phase of the BeatTracker, if an audio source is used
+    audio_phase_correction: float = 0.5  # fraction of the phase error that is corrected with each estimate
 
     # ─── Autoloading ──────────────────────────────────────────────────────
     renew_trigger_from_manual: bool = True
@@ -0,0 +1,132 @@
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+from ravelights.core.custom_typing import ArrayUInt8
+from ravelights.core.device_shared import DeviceLightConfig
+
+HEADER_SIZE = 8  # bytes, int64 sequence number of the latest frame
+
+Shape = tuple[int, int, int]
+Frames = tuple[list[ArrayUInt8], list[ArrayUInt8]]
+
+
+def get_frame_shapes(device_config: list[DeviceLightConfig]) -> list[Shape]:
+    """shape of the matrices of each device, see PixelMatrix"""
+    return [(conf.n_leds, conf.n_lights, 3) for conf in device_config]
+
+
+class SharedFrameRing:
+    """
+    Ring buffer of rendered frames in shared memory, written by the render process and read by any number of
+    output processes. Each slot holds matrices_processed_int and matrices_int of all devices.
+
+    The sequence number in the header counts the published frames and is incremented after the slot has been
+    written. Readers get numpy views into the slot of the latest frame, i.e. no copy is made. A slot is only
+    written again after n_slots - 1 newer frames have been published, which is checked with is_valid().
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, shapes: list[Shape], n_slots: int, owner: bool):
+        self.shm = shm
+        self.shapes = shapes
+        self.n_slots = n_slots
+        self.owner = owner
+        self._sequence: NDArray[np.int64] = np.ndarray((1,), dtype=np.int64, buffer=shm.buf, offset=0)
+
+        frame_size = 2 * sum(int(np.prod(shape)) for shape in shapes)
+        self.slots: list[Frames] = []
+        for slot_index in range(n_slots):
+            offset = HEADER_SIZE + slot_index * frame_size
+            matrices: list[ArrayUInt8] = []
+            for shape in shapes + shapes:
+                matrices.append(np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=offset))
+                offset += int(np.prod(shape))
+            self.slots.append((matrices[: len(shapes)], matrices[len(shapes) :]))
+
+    @staticmethod
+    def get_size(shapes: list[Shape], n_slots: int) -> int:
+        return HEADER_SIZE + n_slots * 2 * sum(int(np.prod(shape)) for shape in shapes)
+
+    @classmethod
+    def create(cls, shapes: list[Shape], n_slots: int = 3) -> "SharedFrameRing":
+        shm = shared_memory.SharedMemory(create=True, size=cls.get_size(shapes, n_slots))
+        shm.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+        return cls(shm=shm, shapes=shapes, n_slots=n_slots, owner=True)
+
+    @classmethod
+    def attach(cls, name: str, shapes: list[Shape], n_slots: int = 3) -> "SharedFrameRing":
+        # processes started with multiprocessing share the resource tracker of the creating process, which unlinks
+        # the memory if the creating process dies without calling close()
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm=shm, shapes=shapes, n_slots=n_slots, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def sequence(self) -> int:
+        return int(self._sequence[0])
+
+    # ─── Writer ───────────────────────────────────────────────────────────
+    def write(self, matrices_processed_int: list[ArrayUInt8], matrices_int: list[ArrayUInt8]) -> int:
+        sequence = self.sequence + 1
+        slot_processed_int, slot_int = self.slots[(sequence - 1) % self.n_slots]
+        for target, source in zip(slot_processed_int + slot_int, matrices_processed_int + matrices_int):
+            target[...] = source
+        self._sequence[0] = sequence
+        return sequence
+
+    # ─── Reader ───────────────────────────────────────────────────────────
+    def read(self) -> tuple[int, Optional[Frames]]:
+        """sequence number and views of the latest frame, None if no frame has been published yet"""
+        sequence = self.sequence
+        if sequence == 0:
+            return sequence, None
+        return sequence, self.slots[(sequence - 1) % self.n_slots]
+
+    def wait_for_frame(
+        self, last_sequence: int, timeout: float, poll_interval: float = 0.001
+    ) -> tuple[int, Optional[Frames]]:
+        """waits until a frame newer than last_sequence has been published, returns (last_sequence, None) on timeout"""
+        deadline = time.monotonic() + timeout
+        while True:
+            sequence, frames = self.read()
+            if sequence != last_sequence:
+                return sequence, frames
+            if time.monotonic() >= deadline:
+                return last_sequence, None
+            time.sleep(poll_interval)
+
+    def is_valid(self, sequence: int) -> bool:
+        """False if the slot of the frame with this sequence number may have been overwritten in the meantime"""
+        return self.sequence - sequence < self.n_slots - 1
+
+    def create_frame_buffer(self) -> Frames:
+        """matrices in process memory with the shapes of a slot, see copy_frame()"""
+        return [np.zeros(shape, dtype=np.uint8) for shape in self.shapes], [
+            np.zeros(shape, dtype=np.uint8) for shape in self.shapes
+        ]
+
+    def copy_frame(self, sequence: int, out: Frames) -> bool:
+        """
+        copies the frame with this sequence number into out. returns False if the slot has been overwritten before
+        the copy was finished, i.e. out may hold a torn frame and must not be used
+        """
+        slot_processed_int, slot_int = self.slots[(sequence - 1) % self.n_slots]
+        for target, source in zip(out[0] + out[1], slot_processed_int + slot_int):
+            np.copyto(target, source)
+        return self.is_valid(sequence)
+
+    def close(self) -> None:
+        self.slots.clear()
+        del self._sequence
+        try:
+            self.shm.close()
+        except BufferError:
+            # views of a reader are still in use, the mapping is released once they have been garbage collected
+            pass
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,42 @@
+import numpy as np
+from ravelights.core.custom_typing import ArrayFloat
+
+
+class CircularShiftBuffer:
+    """
+    Stores a matrix twice along axis 0, so that every circular shift of the matrix is a contiguous slice.
+    shifted(shift) returns the same values as np.roll(matrix, shift, axis=0), but as a view without copy.
+    The buffer is allocated once, load() only copies into it.
+    """
+
+    def __init__(self, shape: tuple[int, ...], dtype: type = float):
+        self.n = shape[0]
+        self._buffer: ArrayFloat = np.zeros((2 * self.n, *shape[1:]), dtype=dtype)
+
+    def load(self, matrix: ArrayFloat) -> None:
+        self._buffer[: self.n] = matrix
+        self._buffer[self.n :] = matrix
+
+    def shifted(self, shift: int) -> ArrayFloat:
+        start = -shift % self.n
+        return self._buffer[start : start + self.n]
+
+
+class PaddedShiftBuffer:
+    """
+    Stores a matrix with max_shift zeros before and after it along axis 0. shifted(shift) returns a view of the
+    matrix shifted by shift, where elements that are shifted in from outside are zero (no wrap around).
+    """
+
+    def __init__(self, shape: tuple[int, ...], max_shift: int, dtype: type = float):
+        self.n = shape[0]
+        self.max_shift = max_shift
+        self._buffer: ArrayFloat = np.zeros((self.n + 2 * max_shift, *shape[1:]), dtype=dtype)
+
+    def load(self, matrix: ArrayFloat) -> None:
+        self._buffer[self.max_shift : self.max_shift + self.n] = matrix
+
+    def shifted(self, shift: int) -> ArrayFloat:
+        assert abs(shift) <= self.max_shift
+        start = self.max_shift - shift
+        return self._buffer[start : start + self.n]
@@ -0,0 +1,85 @@
+import gzip
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Optional
+
+MIN_GZIP_SIZE = 1024  # bytes, smaller responses are sent uncompressed
+
+
+class SerializedSnapshot:
+    """serialized json of a state section, with an etag derived from its content"""
+
+    def __init__(self, body: bytes, version: int):
+        self.body = body
+        self.version = version
+        self.etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        self._body_gzip: Optional[bytes] = None
+
+    @property
+    def body_gzip(self) -> bytes:
+        """compressed once, on the first request that accepts gzip"""
+        if self._body_gzip is None:
+            self._body_gzip = gzip.compress(self.body, compresslevel=6)
+        return self._body_gzip
+
+
+class StateSnapshot:
+    """
+    Cached json of one section of the app state. invalidate() only increments the version, which is cheap
+    enough to be called from the render thread. The section is serialized again on the first get() after an
+    invalidation, i.e. at most once per change and not once per request.
+    """
+
+    def __init__(self, builder: Callable[[], Any], serialize: Callable[[Any], str] = json.dumps):
+        self.builder = builder
+        self.serialize = serialize
+        self.version: int = 0
+        self._snapshot: Optional[SerializedSnapshot] = None
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        self.version += 1
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the section has been requested before and has been invalidated since"""
+        snapshot = self._snapshot
+        return snapshot is not None and snapshot.version != self.version
+
+    def get(self) -> SerializedSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self.version:
+            return snapshot
+        with self._lock:
+            # read the version before building. if the state changes while building, the next get() rebuilds
+            version = self.version
+            if self._snapshot is None or self._snapshot.version != version:
+                body = self.serialize(self.builder()).encode("utf-8")
+                self._snapshot = SerializedSnapshot(body=body, version=version)
+            return self._snapshot
+
+
+class StateSnapshots:
+    """collection of StateSnapshot objects, one for each section of the api, e.g. settings, triggers, meta"""
+
+    def __init__(self):
+        self.sections: dict[str, StateSnapshot] = dict()
+
+    def register(self, name: str, builder: Callable[[], Any], serialize: Callable[[Any], str] = json.dumps) -> None:
+        self.sections[name] = StateSnapshot(builder=builder, serialize=serialize)
+
+    def invalidate(self, *names: str) -> None:
+        """invalidates the given sections, sections that are not registered are ignored"""
+        for name in names:
+            if name in self.sections:
+                self.sections[name].invalidate()
+
+    def get(self, name: str) -> SerializedSnapshot:
+        return self.sections[name].get()
+
+    def build_stale(self) -> None:
+        """serializes the stale sections ahead of the next request, see RaveLightsApp.register_snapshots"""
+        for section in self.sections.values():
+            if section.is_stale:
+                section.get()
@@ -1,8 +1,9 @@
+import random
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional, Type, cast
+from typing import TYPE_CHECKING, Optional, Sequence, Type, cast
 
 from loguru import logger
-from ravelights.core.custom_typing import GeneratorMeta
+from ravelights.core.custom_typing import AvailableGenerators, GeneratorMeta
 from ravelights.core.generator_super import Dimmer, Generator, Pattern, Thinner, Vfilter
 from ravelights.core.settings import Settings
 from ravelights.core.utils import get_random_from_weights, p
@@ -31,6 +32,65 @@ def get_names_and_weights(generators: list[str], keywords: Optional[list[str]] =
     return names, weights
 
 
+class GeneratorIndex:
+    """
+    Weighted random selection of generators by keywords. Holds the positions of the generators of each type by
+    keyword. For each combination of generator type, keywords and music style, the matching generators and the
+    cumulative sums of their weights are computed once, then each selection is a single binary search.
+    The index belongs to one AvailableGenerators object, see MetaHandler.generator_index
+    """
+
+    def __init__(self, available_generators: AvailableGenerators):
+        self.available_generators = available_generators
+        # generator type -> keyword -> positions in available_generators[generator type]
+        self._keyword_index: dict[str, dict[str, set[int]]] = dict()
+        for identifier, generators in available_generators.items():
+            keyword_index: dict[str, set[int]] = dict()
+            for position, generator in enumerate(cast(list[GeneratorMeta], generators)):
+                for keyword in generator["generator_keywords"]:
+                    keyword_index.setdefault(str(keyword), set()).add(position)
+            self._keyword_index[identifier] = keyword_index
+        self._choices: dict[tuple[str, tuple[str, ...], str], tuple[list[str], list[float]]] = dict()
+
+    def get_names_and_cum_weights(self, identifier: str, keywords: Sequence[str]) -> tuple[list[str], list[float]]:
+        """generators of the type with all the given keywords and the cumulative sums of their weights. generators
+        with weight 0 are left out, as they are never selected"""
+        generators = cast(list[GeneratorMeta], self.available_generators[identifier])  # type: ignore
+        positions = set(range(len(generators)))
+        for keyword in keywords:
+            positions &= self._keyword_index[identifier].get(str(keyword), set())
+        names: list[str] = []
+        cum_weights: list[float] = []
+        total = 0.0
+        for position in sorted(positions):
+            generator = generators[position]
+            if generator["generator_weight"] > 0:
+                total += generator["generator_weight"]
+                names.append(generator["generator_name"])
+                cum_weights.append(total)
+        return names, cum_weights
+
+    def get_random_generator(self, identifier: str, keywords: Sequence[str], music_style: str) -> Optional[str]:
+        key = (identifier, tuple(str(keyword) for keyword in keywords), music_style)
+        if key not in self._choices:
+            self._choices[key] = self._find_choices(*key)
+        names, cum_weights = self._choices[key]
+        if not names:
+            return None
+        return random.choices(names, cum_weights=cum_weights)[0]
+
+    def _find_choices(
+        self, identifier: str, keywords: tuple[str, ...], music_style: str
+    ) -> tuple[list[str], list[float]]:
+        # first try with music_style, second try without music_style, third try without keywords
+        for try_keywords in [[*keywords, music_style], keywords, []]:
+            names, cum_weights = self.get_names_and_cum_weights(identifier, try_keywords)
+            if names:
+                return names, cum_weights
+            logger.warning(f"no generators of type {identifier} found with keywords {try_keywords}")
+        return [], []
+
+
 @dataclass
 class GenSelector:
     """
@@ -107,37 +167,18 @@ class GenSelector:
             self.thinner_name = "t_none"
 
     def get_random_generator(self, gen_type: Type[Generator]) -> str:
-        generators = self.get_gen_list(gen_type=gen_type)
-        keywords = self.keywords + [self.settings.music_style]
-
-        # first try
-        names, weights = get_names_and_weights(generators=generators, keywords=keywords)
-        if len(names) > 0:
-            return get_random_from_weights(names=names, weights=weights)
-
-        # second try without music_style
-        logger.warning(f"no generators found with keywords {keywords}")
-        names, weights = get_names_and_weights(generators=generators, keywords=self.keywords)
-        if len(names) > 0:
-            return get_random_from_weights(names=names, weights=weights)
-
-        # third try without keywords
-        logger.warning(f"no generators found with keywords {keywords}")
-        names, weights = get_names_and_weights(generators=generators)
-        if len(names) > 0:
-            return get_random_from_weights(names=names, weights=weights)
-        logger.warning(f"no generators of type {gen_type} found")
+        # the metahandler is created after the first timeline has been loaded
+        if hasattr(self.root, "metahandler"):
+            identifier = gen_type.get_identifier()
+            gen_name = self.root.metahandler.generator_index.get_random_generator(
+                identifier, keywords=self.keywords, music_style=self.settings.music_style
+            )
+            if gen_name is not None:
+                return gen_name
 
         # backup
         return gen_type.get_identifier()[0] + "_none"
 
-    def get_gen_list(self, gen_type: str | Type[Generator] | Type[Effect]) -> list[GeneratorMeta]:
-        identifier = gen_type if isinstance(gen_type, str) else gen_type.get_identifier()
-        if hasattr(self.root, "metahandler"):
-            return self.root.metahandler["available_generators"][identifier]
-        else:
-            return []
-
 
 @dataclass
 class GenPlacing:
@@ -1,9 +1,12 @@
+import itertools
 import time
 from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 from loguru import logger
+from ravelights.core.frame_scheduler import FrameScheduler
+from ravelights.core.idle_tasks import IdleTaskScheduler
 from ravelights.core.performance_logger import PerformanceLogger
 from ravelights.core.utils import p
 
@@ -11,6 +14,8 @@ if TYPE_CHECKING:
     from ravelights.core.device import Device
     from ravelights.core.ravelights_app import RaveLightsApp
 
+_pattern_ids = itertools.count()
+
 
 @dataclass
 class BeatState:
@@ -18,6 +23,8 @@ class BeatState:
     is_quarter: bool = False
     beat_progress: float = 0.0
     n_quarters_long: int = 0
+    # per-frame cache for BeatStatePattern evaluations: (pattern_id, n_quarters_long) -> is_triggered
+    trigger_cache: dict[tuple[int, int], bool] = field(default_factory=dict, repr=False, compare=False)
 
     @property
     def n_beats(self):
@@ -52,6 +59,9 @@ class BeatStatePattern:
 
     beats_array: list of length 32, containing True or False
     quarters: list of length 4, containing True or False
+
+    The pattern is compiled into an integer bitmask over queue_length quarters, bit n is set if the
+    pattern matches quarter n. The mask is rebuilt whenever the pattern is modified.
     """
 
     beats: Optional[list[int]] = None
@@ -63,31 +73,59 @@ class BeatStatePattern:
     quarters_array: list[bool] = field(init=False)
 
     def __post_init__(self):
+        self.compile()
+
+        # for global frame skip
+        self.trigger_counter = -1
+
+    def compile(self):
+        """Rebuilds the lookup arrays. The bitmask is built lazily, once queue_length is known.
+        A new pattern_id invalidates results cached for the previous state of the pattern."""
+        self.pattern_id: int = next(_pattern_ids)
         if self.beats is None:
             self.beats = [0]
         self.beats_array = [idx in self.beats for idx in range(32)]
         self.quarters_array = ["ABCD"[idx] in self.quarters for idx in range(4)]
+        self._trigger_mask: int = 0
+        self._trigger_mask_length: Optional[int] = None
+
+    def get_trigger_mask(self, queue_length: int) -> int:
+        """returns the bitmask of all quarters within queue_length, at which the pattern matches"""
+        if self._trigger_mask_length != queue_length:
+            loop_length_quarters = self.loop_length * 4
+            mask = 0
+            for n_quarter in range(queue_length):
+                current_beat, current_quarter = divmod(n_quarter % loop_length_quarters, 4)
+                if self.beats_array[current_beat] and self.quarters_array[current_quarter]:
+                    mask |= 1 << n_quarter
+            self._trigger_mask = mask
+            self._trigger_mask_length = queue_length
+        return self._trigger_mask
+
+    def is_triggered(self, other: BeatState) -> bool:
+        """
+        Will return True, if the beat conditions of the pattern match the current BeatState. Triggerskip
+        and random chance are not applied. The result is cached within the BeatState of the frame.
+        """
 
-        # for global frame skip
-        self.previous_triggered_time = None
-        self.trigger_counter = -1
+        key = (self.pattern_id, other.n_quarters_long)
+        is_triggered = other.trigger_cache.get(key)
+        if is_triggered is None:
+            is_triggered = other.is_quarter and bool(
+                self.get_trigger_mask(other.root.settings.queue_length) >> other.n_quarters_long & 1
+            )
+            if is_triggered:
+                self.trigger_counter += 1
+            other.trigger_cache[key] = is_triggered
+        return is_triggered
 
     def is_match(self, other: BeatState, device: Optional["Device"] = None) -> bool:
         """
         Will return True, if pattern matches current BeatState.
         """
 
-        # check if BeatPattern conditions are met
-        # current_beat: other.n_quarters_long % (self.loop_length * 4) // 4
-        # current_quarter: other.n_quarters_long % (self.loop_length * 4) % 4
-        current_beat, current_quarter = divmod(other.n_quarters_long % (self.loop_length * 4), 4)
-        is_triggered = all(
-            [
-                other.is_quarter,
-                self.beats_array[current_beat],
-                self.quarters_array[current_quarter],
-            ]
-        )
+        if not self.is_triggered(other):
+            return False
 
         # ----------------------------------- skip ----------------------------------- #
         # global skip trigger = 1: each trigger works
@@ -99,24 +137,13 @@ class BeatStatePattern:
         triggerskip = other.root.settings.global_triggerskip
         if device:
             triggerskip = max(triggerskip, device.device_triggerskip)
-
-        if is_triggered:
-            if self.previous_triggered_time == other.root.timehandler.time_0:
-                # the BeatStatePattern was already triggered within the current frame
-                pass
-            else:
-                self.trigger_counter += 1
-                self.previous_triggered_time = other.root.timehandler.time_0
-
-            is_triggered = self.trigger_counter % triggerskip == 0
+        if self.trigger_counter % triggerskip != 0:
+            return False
 
         # ------------------------------- random chance ------------------------------ #
         # add random chance for trigger to fail if p < 1.0
         # trigger will be omitted by chance even if trigger conditions are met
-        if p(self.p):
-            return is_triggered
-        else:
-            return False
+        return self.p >= 1.0 or p(self.p)
 
     def __repr__(self):
         return f"n_beats: {len(cast(list[Any], self.beats))}, quarters: {self.quarters}, loop_length: {self.loop_length}, p: {self.p}"
@@ -128,6 +155,7 @@ class BeatStatePattern:
                 setattr(self, key, value)
             else:
                 logger.warning(f"key {key} does not exist in settings")
+        self.compile()
 
 
 class TimeHandler:
@@ -145,10 +173,13 @@ class TimeHandler:
         self.measure_time_2()
         self.bpm_sync()
         self.dynamic_sleep_time = 0
-        self.dynamic_sleep_time_correction = 0
-        self.stats: dict[str, float | int] = dict(delayed_frame_counter=0)
+        self.frame_scheduler = FrameScheduler()
+        # deferred work of all components, which is run in the slack time of the frames
+        self.idle_tasks = IdleTaskScheduler(get_current_time=self.get_current_time)
+        self.stats: dict[str, float | int] = dict(delayed_frame_counter=0, dropped_frame_counter=0)
         self._performance_logger = PerformanceLogger(log_interval_seconds=10)
         self._calculate_stats()
+        self.idle_tasks.register("calculate_stats", lambda deadline: self._calculate_stats(), max_delay_frames=10)
 
         # bpmhandler
         self.n_quarters_long_memory = 0
@@ -158,14 +189,13 @@ class TimeHandler:
     def before(self):
         """Abstract function called before rendering"""
         self.measure_time_0()
-        self._calculate_stats()
 
     def after(self):
         """Abstract function called after rendering"""
         self.measure_time_1()
+        self.run_idle_tasks()
         self.sleep_dynamic()
         self.measure_time_2()
-        self._calibrate_sleep_dynamic()
 
     def get_current_time(self) -> float:
         return time.perf_counter()
@@ -189,21 +219,49 @@ class TimeHandler:
         """Synchronize bpm"""
         self.time_sync = self.get_current_time()
 
+    def set_beat_tracking(self, bpm: float, beat_time_stamp: float):
+        """Follows bpm and beat phase of an audio beat tracker. The bpm is changed without jump of the beat
+        position, the phase error is corrected gradually to smooth out inaccurate estimates."""
+        if not self.settings.audio_beat_tracking:
+            return
+        now = self.get_current_time()
+        position = (now - self.time_sync) / self.beat_time
+        previous_bpm = self.settings.bpm_base
+        self.settings.bpm_base = bpm
+        self.time_sync = now - position * self.beat_time
+
+        music_beat_time = 60 / bpm
+        phase_error = ((beat_time_stamp - self.time_sync) / music_beat_time + 0.5) % 1 - 0.5
+        self.time_sync += phase_error * music_beat_time * self.settings.audio_phase_correction
+        self.root.snapshots.invalidate("settings")
+        if round(previous_bpm) != round(bpm):
+            self.root.refresh_ui(sse_event="settings")
+
+    def run_idle_tasks(self):
+        """runs deferred work until the deadline of the next frame. without deadline, e.g. in the first frame, only
+        overdue tasks are run"""
+        deadline = self.frame_scheduler.get_next_deadline(self.frame_time)
+        self.idle_tasks.run(deadline=self.time_1 if deadline is None else deadline)
+
     def sleep_static(self, t: float = 1 / 30):
         time.sleep(t)
 
     def sleep_dynamic(self):
-        """Perform sleep of dynamic length to hit fps target
+        """Perform sleep of dynamic length to hit fps target. The FrameScheduler waits for absolute
+        frame deadlines, see FrameScheduler for details.
         <------- frame  time ------>
         |           frame          |
         | render |      sleep      |
         """
         self.avg_time_excess = self.stats["avg_frame_time"] - self.frame_time, 0
-        self.dynamic_sleep_time = self.frame_time - self.render_time - self.dynamic_sleep_time_correction
-        if self.dynamic_sleep_time > 0:
-            time.sleep(self.dynamic_sleep_time)
-        else:
-            self.stats["delayed_frame_counter"] += 1
+        self.frame_scheduler.policy = self.settings.frame_drop_policy
+        self.dynamic_sleep_time = self.frame_scheduler.wait_for_next_frame(self.frame_time)
+        self.stats["delayed_frame_counter"] = self.frame_scheduler.delayed_frame_counter
+        self.stats["dropped_frame_counter"] = self.frame_scheduler.dropped_frame_counter
+
+    def get_jitter_histogram(self) -> dict[str, float | int | list[int]]:
+        """histogram of frame start deviations from the frame deadlines, in seconds"""
+        return self.frame_scheduler.get_jitter_histogram()
 
     def get_stats(self, precision: int = 2) -> dict[str, float | int]:
         return {k: round(v, precision) for k, v in self.stats.items()}
@@ -220,6 +278,8 @@ class TimeHandler:
     def _calculate_sleep_stats(self):
         self.stats["dynamic_sleep_time"] = self.dynamic_sleep_time
         self.stats["dynamic_sleep_time_inv"] = 1 / (self.dynamic_sleep_time + 1e-5)
+        self.stats["jitter_mean_ms"] = self.frame_scheduler.jitter_histogram.mean * 1000
+        self.stats["jitter_p99_ms"] = self.frame_scheduler.jitter_histogram.percentile(0.99) * 1000
 
     def _calculate_fps_stats(self):
         """Calculates average of time1-time0 (render time) for last 10 framess"""
@@ -237,13 +297,6 @@ class TimeHandler:
             self.stats["avg_render_time"] = sum(self.render_time_deque) / len(self.render_time_deque)
             self.stats["avg_render_time_inv"] = 1 / self.stats["avg_render_time"]
 
-    def _calibrate_sleep_dynamic(self):
-        """Calibrates sleep_dynamic, so that resulting frame time is accurate.
-        This is the integral part of a pid feedback loop control"""
-        correction_tuning = 0.02
-        excess = (self.time_2 - self.time_0) - self.frame_time
-        self.dynamic_sleep_time_correction += excess * correction_tuning
-
     def bpm_adjust(self, amount: float | int):
         """Shifts the bpm sync point in seconds."""
         # self.timehandler.time_sync += amount
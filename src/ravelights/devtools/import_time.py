@@ -0,0 +1,63 @@
+import argparse
+import subprocess
+import sys
+from typing import NamedTuple
+
+from loguru import logger
+
+# modules that should only be imported once the app is started or the generator is selected
+DEFERRED_MODULES = ["flask", "flask_socketio", "zeroconf", "requests", "ravelights.patterns", "ravelights.vfilters"]
+
+
+class ImportTimeReport(NamedTuple):
+    total_ms: float
+    modules_ms: dict[str, float]  # cumulative import time of each module
+    loaded_modules: list[str]
+
+
+def measure_import_time(module: str = "ravelights") -> ImportTimeReport:
+    """imports module in a fresh interpreter with -X importtime"""
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+
+    modules_ms: dict[str, float] = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        modules_ms[name.strip()] = int(cumulative) / 1000
+    return ImportTimeReport(
+        total_ms=modules_ms.get(module, 0.0),
+        modules_ms=modules_ms,
+        loaded_modules=result.stdout.splitlines(),
+    )
+
+
+def find_deferred_modules(loaded_modules: list[str]) -> list[str]:
+    return [m for m in loaded_modules if any(m == d or m.startswith(d + ".") for d in DEFERRED_MODULES)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measures the import time of ravelights")
+    parser.add_argument("--module", type=str, default="ravelights")
+    parser.add_argument("--budget-ms", type=float, default=400.0)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    report = measure_import_time(args.module)
+    for name, ms in sorted(report.modules_ms.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        logger.info(f"{ms:8.1f} ms  {name}")
+    logger.info(f"total import time of {args.module}: {report.total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if deferred := find_deferred_modules(report.loaded_modules):
+        logger.error(f"modules imported too early: {deferred}")
+        failed = True
+    if report.total_ms > args.budget_ms:
+        logger.error("import time exceeds budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,7 +26,10 @@ class DimmerDecayMedium(Dimmer):
     def on_trigger(self):
         self.decay_ref = self.timehandler.time_0
 
-    def render(self, in_matrix: ArrayFloat, colors: list[Color]):
+    def get_gain(self) -> float:
         decay: float = 1 + (self.timehandler.time_0 - self.decay_ref) * self.decay_factor
-        matrix = in_matrix * (1 / decay)
+        return 1 / decay
+
+    def render(self, in_matrix: ArrayFloat, colors: list[Color]):
+        matrix = in_matrix * self.get_gain()
         return matrix
@@ -16,9 +16,12 @@ class DimmerPeak(Dimmer):
     def on_trigger(self):
         ...
 
-    def render(self, in_matrix: ArrayFloat, colors: list[Color]):
+    def get_gain(self) -> float:
         x = self.timehandler.get_beat_progress_n(self.frequency)
         x_shift = abs((x - 0.5) * 2)
         intensity = max(x_shift**2 * 0.3, x_shift**5)
-        matrix = in_matrix * intensity
+        return intensity
+
+    def render(self, in_matrix: ArrayFloat, colors: list[Color]):
+        matrix = in_matrix * self.get_gain()
         return matrix
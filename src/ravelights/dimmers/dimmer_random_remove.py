@@ -2,12 +2,13 @@ import numpy as np
 from ravelights.core.color_handler import Color
 from ravelights.core.custom_typing import ArrayFloat
 from ravelights.core.generator_super import Dimmer
-from ravelights.core.utils import p
 
 
 class DimmerRandomRemove(Dimmer):
     def init(self):
-        self.mask = self.get_float_matrix_1d_mono(fill_value=1.0)
+        self.p_remove = 0.1  # chance per frame that a remaining pixel is removed
+        self.mask = self.get_float_matrix_mask(fill_value=1.0)
+        self.out_matrix = self.get_float_matrix_rgb()
 
     def alternate(self):
         ...
@@ -26,13 +27,12 @@ class DimmerRandomRemove(Dimmer):
         if self.counter_frames == 2:
             self.intensity = 1.0
 
-        # progress thinning mask
-        for i in np.nonzero(self.mask)[0]:
-            if p(0.1):
-                self.mask[i] = False
+        # progress thinning mask, pixels that are removed already stay removed
+        self.mask[np.random.random(size=self.mask.shape) < self.p_remove] = 0.0
         self.counter_frames += 1
 
     def render(self, in_matrix: ArrayFloat, colors: list[Color]):
         self.step()  # todo: set this to seperate trigger
-        matrix = self.apply_mask(in_matrix=self.intensity * in_matrix, mask=self.mask.reshape(self.n_leds, -1))
+        matrix = self.apply_mask(in_matrix=in_matrix, mask=self.mask, out=self.out_matrix)
+        matrix *= self.intensity
         return matrix
@@ -17,8 +17,11 @@ class DimmerSine(Dimmer):
     def on_trigger(self):
         ...
 
-    def render(self, in_matrix: ArrayFloat, colors: list[Color]):
+    def get_gain(self) -> float:
         x = self.timehandler.get_beat_progress_n(self.frequency)
         intensity = cos_mapper(x)
-        matrix = in_matrix * intensity
+        return intensity
+
+    def render(self, in_matrix: ArrayFloat, colors: list[Color]):
+        matrix = in_matrix * self.get_gain()
         return matrix
@@ -0,0 +1,17 @@
+import random
+
+import numpy as np
+from ravelights.effects.effect_color_transform import EffectColorTransform
+
+
+class EffectColorGrade(EffectColorTransform):
+    def reset(self):
+        """
+        random combination of saturation, gamma and swapped color channels, which stays the same until reset
+        """
+
+        super().reset()
+        self.transform.saturation = random.choice([0.0, 0.5, 1.0, 1.0, 2.0])
+        self.transform.gamma = random.choice([0.5, 1.0, 2.2])
+        if random.random() < 0.5:
+            self.transform.channel_mix = np.eye(3)[np.random.permutation(3)]
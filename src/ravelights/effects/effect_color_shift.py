@@ -7,6 +7,8 @@ from ravelights.effects.effect_super import Effect
 
 
 class EffectColorShift(Effect):
+    is_passthrough = True
+
     def reset(self, hue_range=None) -> None:
         """
         starts at the current primary color and ramps from there, then jumps back to the color before
@@ -29,14 +31,12 @@ class EffectColorShift(Effect):
 
             new_hue = (base_hue + self.sign * self.hue_slide_speed) % 1
             self.base_hue[index] = new_hue
-            new_color = ColorHandler.get_color_from_hue(new_hue)
-            color_key = "ABC"[index]
-            self.settings.color_engine.color_overwrite[color_key] = new_color
+            # the hue changes by less than a step of the hue wheel per frame
+            new_color = ColorHandler.get_color_from_hue(new_hue, exact=True)
+            self.settings.color_engine.set_color_override("ABC"[index], new_color)
 
     def run_after(self):
-        for index in range(2):
-            color_key = "ABC"[index]
-            self.settings.color_engine.color_overwrite[color_key] = None
+        self.settings.color_engine.clear_color_overrides("AB")
 
     def render_matrix(self, in_matrix: Array, colors: list[Color]) -> Array:
         """Called each render cycle"""
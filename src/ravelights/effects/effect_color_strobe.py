@@ -1,12 +1,14 @@
 import random
 from typing import Optional
 
-from ravelights.core.color_handler import Color, ColorHandler
+from ravelights.core.color_handler import COLOR_KEYS, Color, ColorHandler
 from ravelights.core.custom_typing import ArrayFloat
 from ravelights.effects.effect_super import Effect
 
 
 class EffectColorStrobe(Effect):
+    is_passthrough = True
+
     def reset(self, hue_range: Optional[float] = None):
         # todo: many versions, rainbow, strobe, random, etc pp
         """
@@ -20,15 +22,13 @@ class EffectColorStrobe(Effect):
         self.hue_range = 0.1
 
     def run_before(self):
-        for index in "ABC":  # A, B, C
+        for color_key in COLOR_KEYS:
             random_hue_shift = random.uniform(0, self.hue_range)
-            new_hue = (self.base_hue + self.sign * random_hue_shift) % 1
-            random_color = ColorHandler.get_color_from_hue(new_hue)
-            self.settings.color_engine.color_overwrite[index] = random_color
+            random_color = ColorHandler.get_color_from_hue(self.base_hue + self.sign * random_hue_shift)
+            self.settings.color_engine.set_color_override(color_key, random_color)
 
     def run_after(self):
-        for index in "ABC":
-            self.settings.color_engine.color_overwrite[index] = None
+        self.settings.color_engine.clear_color_overrides()
 
     def render_matrix(self, in_matrix: ArrayFloat, colors: list[Color]) -> ArrayFloat:
         """Called each render cycle"""
@@ -1,19 +1,19 @@
-import random
-
-from ravelights.core.color_handler import Color, ColorHandler
+import numpy as np
+from ravelights.core.color_handler import Color
+from ravelights.core.colorspace import hue_to_rgb
 from ravelights.core.custom_typing import ArrayFloat
 from ravelights.core.generator_super import Generator
 from ravelights.effects.effect_super import Effect
-from ravelights.vfilters.vfilter_bw import VfilterBW
 
 
 class EffectColorStrobeRainbow(Effect):
     def reset(self):
         """
-        hue_range controls the color variation for each frame
+        each light gets a random color in each frame
         """
 
-        self.bw_filter = VfilterBW(root=self.root, device=self.device)
+        self.light_colors: ArrayFloat = np.zeros((self.n_lights, 3))
+        self.out_matrix: ArrayFloat = np.zeros((self.n_leds, self.n_lights, 3))
 
     def run_before(self):
         ...
@@ -24,17 +24,8 @@ class EffectColorStrobeRainbow(Effect):
     def render_matrix(self, in_matrix: ArrayFloat, colors: list[Color]) -> ArrayFloat:
         """Called each render cycle"""
         bw_matrix_mono = Generator.bw_matrix(in_matrix)
-
-        matrix_out = self.bw_filter.get_float_matrix_rgb()
-
-        for light_id in range(self.n_lights):
-            matrix_view = bw_matrix_mono[:, light_id]
-            random_hue = random.random()
-            random_color = ColorHandler.get_color_from_hue(random_hue)
-            colored_matrix = self.colorize_matrix(matrix_mono=matrix_view, color=random_color)
-            matrix_out[:, light_id, :] = colored_matrix
-
-        return matrix_out
+        hue_to_rgb(np.random.random(self.n_lights), out=self.light_colors)
+        return np.multiply(bw_matrix_mono[..., None], self.light_colors, out=self.out_matrix)
 
     def on_delete(self):
         pass
@@ -1,19 +1,22 @@
-import random
-
 import numpy as np
-from ravelights.core.color_handler import Color, ColorHandler
+from ravelights.core.color_handler import Color
+from ravelights.core.colorspace import hue_to_rgb
 from ravelights.core.custom_typing import ArrayFloat
 from ravelights.core.generator_super import Generator
+from ravelights.core.shift_buffer import CircularShiftBuffer
 from ravelights.effects.effect_super import Effect
 
 
 class EffectColorStrobeRainbowPixel(Effect):
     def reset(self):
         """
-        hue_range controls the color variation for each frame
+        each pixel gets a random color, the colors move along the leds
         """
 
-        self.color_matrix = self.get_color_matrix()
+        self.color_buffer = CircularShiftBuffer(shape=(self.n_leds, self.n_lights, 3))
+        self.color_buffer.load(self.get_color_matrix())
+        self.out_matrix: ArrayFloat = np.zeros((self.n_leds, self.n_lights, 3))
+        self.shift = 0
 
     def run_before(self):
         ...
@@ -22,32 +25,17 @@ class EffectColorStrobeRainbowPixel(Effect):
         ...
 
     def alternate(self):
-        self.color_matrix = self.get_color_matrix()
+        self.color_buffer.load(self.get_color_matrix())
 
-    def get_color_matrix(self):
-        color_matrix = np.zeros((self.n, 3))
-        color_matrix[:, 0] = np.random.rand(self.n)
-        color_matrix[:, 1] = 1.0
-        rng = np.random.default_rng()
-        rng.shuffle(color_matrix, axis=-1)  # same shuffle for each row
-        color_matrix = color_matrix.reshape((self.n_leds, self.n_lights, 3), order="F")
-        return color_matrix
+    def get_color_matrix(self) -> ArrayFloat:
+        return hue_to_rgb(np.random.random((self.n_leds, self.n_lights)))
 
     def render_matrix(self, in_matrix: ArrayFloat, colors: list[Color]) -> ArrayFloat:
         """Called each render cycle"""
-        self.color_matrix = np.roll(self.color_matrix, shift=1, axis=0)
+        self.shift = (self.shift + 1) % self.n_leds
 
         bw_matrix_mono = Generator.bw_matrix(in_matrix)
-        matrix_out = bw_matrix_mono[..., None] * self.color_matrix
-
-        return matrix_out
+        return np.multiply(bw_matrix_mono[..., None], self.color_buffer.shifted(self.shift), out=self.out_matrix)
 
     def on_delete(self):
         pass
-
-
-if __name__ == "__main__":
-    for _ in range(10):
-        random_hue = random.random()
-        random_color = ColorHandler.get_color_from_hue(random_hue)
-        print(random_color, sum(random_color))
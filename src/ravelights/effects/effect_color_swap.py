@@ -4,6 +4,8 @@ from ravelights.effects.effect_super import Effect
 
 
 class EffectColorSwap(Effect):
+    is_passthrough = True
+
     def reset(self):
         ...
 
@@ -13,11 +15,11 @@ class EffectColorSwap(Effect):
     def run_before(self):
         color_keys = self.settings.color_engine.get_color_keys(timeline_level=1)
         curent_colors = self.settings.color_engine.get_colors_rgb(timeline_level=1)
-        self.settings.color_engine.color_overwrite[color_keys[0]] = curent_colors[1]
-        self.settings.color_engine.color_overwrite[color_keys[1]] = curent_colors[0]
+        self.settings.color_engine.set_color_override(color_keys[0], curent_colors[1])
+        self.settings.color_engine.set_color_override(color_keys[1], curent_colors[0])
 
     def run_after(self):
-        self.settings.color_engine.reset_color_overwrite()
+        self.settings.color_engine.clear_color_overrides()
 
     def render_matrix(self, in_matrix: ArrayFloat, colors: list[Color]) -> ArrayFloat:
         return in_matrix
@@ -0,0 +1,38 @@
+from typing import Any, Optional
+
+import numpy as np
+from ravelights.core.color_handler import Color
+from ravelights.core.colorspace import ColorTransform
+from ravelights.core.custom_typing import ArrayFloat
+from ravelights.effects.effect_super import Effect
+
+
+class EffectColorTransform(Effect):
+    """
+    base class of effects that transform the color of each pixel, see ColorTransform. subclasses only set the
+    parameters of self.transform in update_transform(), the whole matrix is transformed in one pass
+    """
+
+    def reset(self):
+        self.transform = ColorTransform()
+        self.out_matrix: ArrayFloat = np.zeros((self.n_leds, self.n_lights, 3))
+
+    def update_transform(self):
+        """Called before rendering of each frame, sets the parameters of self.transform"""
+        ...
+
+    def run_before(self):
+        ...
+
+    def run_after(self):
+        ...
+
+    def sync_send(self) -> Optional[dict[str, Any]]:
+        return dict(transform=self.transform)
+
+    def render_matrix(self, in_matrix: ArrayFloat, colors: list[Color]) -> ArrayFloat:
+        self.update_transform()
+        return self.transform.apply(in_matrix, out=self.out_matrix)
+
+    def on_delete(self):
+        pass
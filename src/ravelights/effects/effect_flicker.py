@@ -17,9 +17,12 @@ class EffectFlicker(Effect):
     def run_after(self):
         ...
 
+    def get_gain(self) -> float:
+        return random.random()
+
     def render_matrix(self, in_matrix: ArrayFloat, colors: list[Color]) -> ArrayFloat:
         """Called each render cycle"""
-        return in_matrix * random.random()
+        return in_matrix * self.get_gain()
 
     def on_delete(self):
         pass
@@ -8,6 +8,8 @@ class EffectFrameskip(Effect):
     sets frameskip to 2
     """
 
+    is_passthrough = True
+
     def reset(self):
         self.frameskip_new = 2  # todo: alternate
 
@@ -0,0 +1,20 @@
+import random
+
+from ravelights.effects.effect_color_transform import EffectColorTransform
+
+
+class EffectHueRotate(EffectColorTransform):
+    def reset(self):
+        """
+        rotates the hue of all pixels, one full turn takes n_beats
+        """
+
+        super().reset()
+        self.n_beats = random.choice([2, 4, 8, 16])
+        self.sign = random.choice([1, -1])
+
+    def sync_send(self):
+        return dict(n_beats=self.n_beats, sign=self.sign)
+
+    def update_transform(self):
+        self.transform.hue_shift = self.sign * self.timehandler.get_beat_progress_n(self.n_beats)
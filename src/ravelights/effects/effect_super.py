@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
@@ -26,15 +27,19 @@ class EffectWrapper:
     def __init__(self, root: "RaveLightsApp", effect_objects: list["Effect"]):
         self.root = root
         self.settings: Settings = self.root.settings
+        self.timehandler: TimeHandler = self.root.timehandler
         self.effects: list[Effect] = effect_objects
         self.name = effect_objects[0].name
         self.keywords = effect_objects[0].keywords
         self.weight = effect_objects[0].weight
+        self.is_passthrough = effect_objects[0].is_passthrough
+        # effects without sync_send() have no state to sync between devices
+        self.has_sync = len(effect_objects) > 1 and type(effect_objects[0]).sync_send is not Effect.sync_send
         self.mode = "frames"  # todo: make EnumStr
         self.draw_mode = "overlay"  # "overlay", "normal"
         self.active = False
+        # the trigger is drawn when the effect is loaded, such that vfilter effects do not create their vfilter here
         self.trigger: Optional[BeatStatePattern] = None
-        self.renew_trigger()
 
         # mode == "frames"
         self.counter_frames: int = 0
@@ -61,7 +66,7 @@ class EffectWrapper:
         """Called once after each render cycle"""
         if self.active:
             effect = self.effects[0]
-            effect.run_before()
+            effect.run_after()
 
     def reset(
         self,
@@ -273,12 +278,23 @@ class EffectWrapper:
         return f"<EffectWrapper {self.name}>"
 
 
+@dataclass
+class EffectStep:
+    """one effect of the render plan of a frame, see EffectHandler.compile_render_plan"""
+
+    effects: list["Effect"]  # one effect per device
+    is_overlay: bool
+
+
 class Effect(ABC):
     """
     effects will be present temporarily (for n frames) before delted
     effects can modify settings parameters, for example color attribute
     """
 
+    # effects that only modify settings (e.g. colors) and return in_matrix unchanged, they are not rendered
+    is_passthrough: bool = False
+
     def __init__(
         self,
         root: "RaveLightsApp",
@@ -325,6 +341,10 @@ class Effect(ABC):
         # todo: is this needed anymore?
         ...
 
+    def get_gain(self) -> Optional[float]:
+        """Effects that multiply the whole matrix with one value return this value here, see Dimmer.get_gain()"""
+        return None
+
     @staticmethod
     def get_identifier():
         return "effect"
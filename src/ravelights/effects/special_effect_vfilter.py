@@ -1,8 +1,8 @@
 import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from ravelights.core.color_handler import Color
-from ravelights.core.custom_typing import Array
+from ravelights.core.custom_typing import Array, import_class
 from ravelights.core.generator_super import Vfilter
 from ravelights.effects.effect_super import Effect
 
@@ -17,9 +17,18 @@ class SpecialEffectVfilter(Effect):
     do not register in components
     """
 
-    def __init__(self, root: "RaveLightsApp", device: "Device", name: str, vfilter: type["Vfilter"]):
+    def __init__(self, root: "RaveLightsApp", device: "Device", name: str, vfilter: type["Vfilter"] | str):
+        self.vfilter_cls = vfilter
+        self._vfilter: Optional[Vfilter] = None
         super().__init__(root, device, name)
-        self.vfilter = vfilter(root, device, name)
+
+    @property
+    def vfilter(self) -> Vfilter:
+        """the vfilter is created when the effect is used for the first time"""
+        if self._vfilter is None:
+            cls = import_class(self.vfilter_cls) if isinstance(self.vfilter_cls, str) else self.vfilter_cls
+            self._vfilter = cls(self.root, self.device, self.name)
+        return self._vfilter
 
     def alternate(self):
         self.vfilter.alternate()
@@ -0,0 +1,222 @@
+import asyncio
+import json
+import mimetypes
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+
+import socketio  # type: ignore
+from loguru import logger
+from ravelights.core.state_snapshots import MIN_GZIP_SIZE, SerializedSnapshot
+from ravelights.interface.interface_backend import (
+    dumps_json,
+    get_devices_data,
+    get_effect_queues_data,
+    get_quasar_ui_dir,
+)
+from ravelights.interface.sse_broker import AsyncSseClient, SseBroker
+
+if TYPE_CHECKING:
+    from ravelights.core.ravelights_app import RaveLightsApp
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class AsgiAPI:
+    """
+    Provides the same /rest/*, /sse, websocket (socket.io) and static webui endpoints as RestAPI, but as an ASGI app
+    that is served by uvicorn. All clients are handled by one asyncio event loop in one thread, instead of one
+    thread per client. Requires the asgi extra: pip install .[asgi]
+    """
+
+    def __init__(
+        self,
+        root: "RaveLightsApp",
+        port: int = 80,
+        serve_webui: bool = True,
+    ):
+        self.root = root
+        self.port = port
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.sse_broker = SseBroker(window=1 / self.root.settings.fps)
+        self.sse_broker.start()
+
+        self.websocket_num_clients: int = 0
+        self._websocket_future: Optional[Future[None]] = None
+
+        self.quasar_dir: Optional[Path] = get_quasar_ui_dir() if serve_webui else None
+
+        # ─── Websocket ────────────────────────────────────────────────
+        self.sio = socketio.AsyncServer(async_mode="asgi", cors_allowed_origins="*")
+
+        @self.sio.on("connect")
+        async def handle_connect(sid, environ):
+            self.websocket_num_clients += 1
+            logger.info("connected - new websocket client connected")
+            logger.info(f"{self.websocket_num_clients} connected in total")
+            await self.sio.emit("my response", {"data": "Connected"}, to=sid)
+
+        @self.sio.on("disconnect")
+        async def handle_disconnect(sid):
+            self.websocket_num_clients -= 1
+            logger.info("disconnected - websocket client connected")
+            logger.info(f"{self.websocket_num_clients} connected in total")
+
+        self.asgi_app = socketio.ASGIApp(self.sio, other_asgi_app=self.http_app, on_startup=self.on_startup)
+
+        self.start_threaded()
+
+    def on_startup(self) -> None:
+        self.loop = asyncio.get_running_loop()
+
+    def start_threaded(self) -> None:
+        try:
+            import uvicorn
+        except ImportError:
+            logger.error("the asgi interface backend requires uvicorn, install it with: pip install .[asgi]")
+            raise
+
+        logger.info("Starting ASGI API thread...")
+        config = uvicorn.Config(self.asgi_app, host="0.0.0.0", port=self.port, log_level="warning", lifespan="on")
+        self.server = uvicorn.Server(config)
+        threading.Thread(target=self.server.run, name="asgi_api", daemon=True).start()
+
+    def send_websocket(self, data: bytes) -> None:
+        """called by the render thread, drops the frame if the previous one has not been sent yet"""
+        if self.loop is None:
+            return
+        if self._websocket_future is not None and not self._websocket_future.done():
+            return
+        self._websocket_future = asyncio.run_coroutine_threadsafe(self.sio.send(data), self.loop)
+
+    # ─── HTTP ─────────────────────────────────────────────────────────────
+    async def http_app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return
+        method: str = scope["method"]
+        path: str = scope["path"].rstrip("/") or "/"
+        headers = {key.decode("latin-1").lower(): value.decode("latin-1") for key, value in scope["headers"]}
+
+        match method, path:
+            case "GET", "/rest/settings" | "/rest/triggers" | "/rest/meta":
+                snapshot = self.root.snapshots.get(path.removeprefix("/rest/"))
+                await send_snapshot(send, snapshot, headers)
+            case "GET", "/rest/devices":
+                await send_response(send, 200, dumps_json(get_devices_data(self.root)).encode())
+            case "GET", "/rest/effect":
+                await send_response(send, 200, dumps_json(get_effect_queues_data(self.root)).encode())
+            case "PUT", "/rest/settings" | "/rest/effect":
+                await self.receive_command(receive)
+                await send_response(send, 204, b"")
+            case "GET", "/sse":
+                await self.stream_sse(receive, send)
+            case "GET", _ if self.quasar_dir is not None:
+                await self.send_static_file(send, path)
+            case _:
+                await send_response(send, 404, b"", content_type="text/plain")
+
+    async def receive_command(self, receive: Receive) -> None:
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+        try:
+            receive_data = json.loads(body)
+        except json.JSONDecodeError:
+            logger.warning("received invalid json")
+            return
+        if isinstance(receive_data, dict):
+            logger.debug(receive_data)
+            self.root.eventhandler.add_to_modification_queue(receive_data=receive_data)
+
+    async def stream_sse(self, receive: Receive, send: Send) -> None:
+        assert self.loop is not None
+        client = AsyncSseClient(max_queue_size=self.sse_broker.max_queue_size, loop=self.loop)
+        self.sse_broker.subscribe(client)
+        disconnected = asyncio.ensure_future(wait_for_disconnect(receive))
+        try:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-type", b"text/event-stream"), (b"cache-control", b"no-cache")],
+                }
+            )
+            while not disconnected.done():
+                getter = asyncio.ensure_future(client.async_queue.get())
+                done, _ = await asyncio.wait(
+                    {getter, disconnected},
+                    timeout=self.sse_broker.keepalive_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if getter in done:
+                    chunk = f"data: {getter.result()}\n\n"
+                else:
+                    getter.cancel()
+                    if disconnected.done():
+                        break
+                    chunk = ": keepalive\n\n"
+                await send({"type": "http.response.body", "body": chunk.encode(), "more_body": True})
+        finally:
+            disconnected.cancel()
+            self.sse_broker.unsubscribe(client)
+
+    async def send_static_file(self, send: Send, path: str) -> None:
+        assert self.quasar_dir is not None
+        file_path = (self.quasar_dir / path.lstrip("/")).resolve() if path != "/" else self.quasar_dir / "index.html"
+        if not file_path.is_relative_to(self.quasar_dir.resolve()) or not file_path.is_file():
+            await send_response(send, 404, b"", content_type="text/plain")
+            return
+        content_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+        body = await asyncio.to_thread(file_path.read_bytes)
+        await send_response(send, 200, body, content_type=content_type)
+
+
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+
+async def wait_for_disconnect(receive: Receive) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def send_response(
+    send: Send,
+    status: int,
+    body: bytes,
+    content_type: str = "application/json",
+    headers: Optional[list[tuple[bytes, bytes]]] = None,
+) -> None:
+    response_headers = [(b"content-type", content_type.encode())] if status not in (204, 304) else []
+    response_headers += headers or []
+    await send({"type": "http.response.start", "status": status, "headers": response_headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def matches_etag(if_none_match: str, etag: str) -> bool:
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip().removeprefix("W/").strip('"')
+        if candidate in ("*", etag):
+            return True
+    return False
+
+
+async def send_snapshot(send: Send, snapshot: SerializedSnapshot, headers: dict[str, str]) -> None:
+    """same caching and compression as make_snapshot_response of the flask backend"""
+    cache_headers = [
+        (b"etag", f'"{snapshot.etag}"'.encode()),
+        (b"vary", b"Accept-Encoding"),
+        (b"cache-control", b"no-cache"),
+    ]
+    if matches_etag(headers.get("if-none-match", ""), snapshot.etag):
+        await send_response(send, 304, b"", headers=cache_headers)
+    elif len(snapshot.body) >= MIN_GZIP_SIZE and "gzip" in headers.get("accept-encoding", ""):
+        await send_response(send, 200, snapshot.body_gzip, headers=[(b"content-encoding", b"gzip"), *cache_headers])
+    else:
+        await send_response(send, 200, snapshot.body, headers=cache_headers)
@@ -0,0 +1,47 @@
+import queue
+from typing import Optional
+
+import numpy as np
+import sounddevice
+from loguru import logger
+from ravelights.core.custom_typing import ArrayFloat
+from ravelights.interface.audio.audio_source import AudioSource
+
+
+class DeviceAudioSource(AudioSource):
+    """
+    Records from a local audio input device. Requires the optional dependency sounddevice:
+    pip install ravelights[audio]
+    """
+
+    def __init__(self, device: Optional[int | str] = None, sample_rate: int = 44100, block_size: int = 512):
+        super().__init__(sample_rate=sample_rate)
+        self._queue: queue.Queue[ArrayFloat] = queue.Queue(maxsize=256)
+        self._buffer: ArrayFloat = np.zeros(0, dtype=np.float32)
+        self._stream = sounddevice.InputStream(
+            device=device,
+            samplerate=sample_rate,
+            blocksize=block_size,
+            channels=1,
+            dtype="float32",
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    def _callback(self, indata, frames, time, status) -> None:  # type: ignore[no-untyped-def]
+        if status:
+            logger.warning(f"audio input: {status}")
+        try:
+            self._queue.put_nowait(indata[:, 0].copy())
+        except queue.Full:
+            pass  # the analysis thread fell behind, drop the block
+
+    def read(self, n_samples: int) -> Optional[ArrayFloat]:
+        while len(self._buffer) < n_samples:
+            self._buffer = np.concatenate((self._buffer, self._queue.get()))
+        samples, self._buffer = self._buffer[:n_samples], self._buffer[n_samples:]
+        return samples
+
+    def close(self) -> None:
+        self._stream.stop()
+        self._stream.close()
@@ -0,0 +1,137 @@
+import sys
+import time
+import wave
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Optional
+
+import numpy as np
+from ravelights.core.custom_typing import ArrayFloat
+
+
+class AudioSource(ABC):
+    """
+    Source of mono PCM audio for the BeatTracker. read() blocks until n_samples are available and returns them
+    as float array in the range [-1, 1], or None if the stream has ended.
+    """
+
+    def __init__(self, sample_rate: int):
+        self.sample_rate = sample_rate
+
+    @abstractmethod
+    def read(self, n_samples: int) -> Optional[ArrayFloat]:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+def pcm_to_mono_float(data: bytes, sample_width: int, n_channels: int) -> ArrayFloat:
+    """converts interleaved little endian pcm data with 8, 16 or 32 bit to a mono float array"""
+    if sample_width == 1:
+        samples = (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif sample_width == 2:
+        samples = np.frombuffer(data, dtype="<i2").astype(np.float32) / 2**15
+    elif sample_width == 4:
+        samples = np.frombuffer(data, dtype="<i4").astype(np.float32) / 2**31
+    else:
+        raise ValueError(f"sample width of {sample_width} bytes is not supported")
+    n_frames = len(samples) // n_channels
+    return samples[: n_frames * n_channels].reshape(n_frames, n_channels).mean(axis=1)
+
+
+class StreamAudioSource(AudioSource):
+    """
+    Reads raw interleaved pcm data from a binary stream, for example a pipe:
+    arecord -f S16_LE -r 44100 -c 1 | python main.py --audio-pipe
+
+    realtime: if True, reading is paced to the sample rate. Use this for files, so that the timing
+    of detected beats matches the wall clock. Pipes from live sources are paced by the writer already.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        sample_rate: int = 44100,
+        sample_width: int = 2,
+        n_channels: int = 1,
+        realtime: bool = False,
+    ):
+        super().__init__(sample_rate=sample_rate)
+        self._stream = stream
+        self.sample_width = sample_width
+        self.n_channels = n_channels
+        self.realtime = realtime
+        self._start_time: Optional[float] = None
+        self._samples_read: int = 0
+
+    def _read_bytes(self, n_samples: int) -> bytes:
+        return self._stream.read(n_samples * self.sample_width * self.n_channels)
+
+    def read(self, n_samples: int) -> Optional[ArrayFloat]:
+        data = self._read_bytes(n_samples)
+        if not data:
+            return None
+        samples = pcm_to_mono_float(data, sample_width=self.sample_width, n_channels=self.n_channels)
+        if self.realtime:
+            self._pace(len(samples))
+        return samples
+
+    def _pace(self, n_samples: int) -> None:
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+        self._samples_read += n_samples
+        wait_time = self._start_time + self._samples_read / self.sample_rate - time.perf_counter()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class RawFileAudioSource(StreamAudioSource):
+    """raw pcm file, or named pipe, with known format"""
+
+    def __init__(
+        self,
+        path: str,
+        sample_rate: int = 44100,
+        sample_width: int = 2,
+        n_channels: int = 1,
+        realtime: bool = True,
+    ):
+        stream = open(path, "rb")
+        super().__init__(stream, sample_rate, sample_width, n_channels, realtime)
+
+
+class PipeAudioSource(StreamAudioSource):
+    """raw pcm data from stdin"""
+
+    def __init__(self, sample_rate: int = 44100, sample_width: int = 2, n_channels: int = 1):
+        super().__init__(sys.stdin.buffer, sample_rate, sample_width, n_channels, realtime=False)
+
+
+class WavFileAudioSource(StreamAudioSource):
+    """wav file, the format is read from the file header"""
+
+    def __init__(self, path: str, realtime: bool = True, loop: bool = False):
+        stream = open(path, "rb")
+        self._wave = wave.open(stream, "rb")
+        self.loop = loop
+        super().__init__(
+            stream=stream,
+            sample_rate=self._wave.getframerate(),
+            sample_width=self._wave.getsampwidth(),
+            n_channels=self._wave.getnchannels(),
+            realtime=realtime,
+        )
+
+    def _read_bytes(self, n_samples: int) -> bytes:
+        data = self._wave.readframes(n_samples)
+        if not data and self.loop:
+            self._wave.rewind()
+            data = self._wave.readframes(n_samples)
+        return data
+
+    def close(self) -> None:
+        self._wave.close()
+        super().close()
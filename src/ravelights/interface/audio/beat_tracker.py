@@ -0,0 +1,206 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from loguru import logger
+from ravelights.core.custom_typing import ArrayFloat
+from ravelights.interface.audio.audio_source import AudioSource
+
+if TYPE_CHECKING:
+    from ravelights.core.ravelights_app import RaveLightsApp
+
+
+@dataclass
+class BeatEstimate:
+    bpm: float
+    beat_time_stamp: float  # time of the most recent beat, in the clock of TimeHandler.get_current_time()
+    confidence: float
+
+
+class OnsetDetector:
+    """computes a log compressed spectral flux onset envelope, one value per hop"""
+
+    def __init__(self, window_size: int = 1024, hop_size: int = 512, compression: float = 100.0):
+        self.window_size = window_size
+        self.hop_size = hop_size
+        self.compression = compression
+        self.window = np.hanning(window_size).astype(np.float32)
+        self._samples: ArrayFloat = np.zeros(window_size, dtype=np.float32)
+        self._previous_spectrum: ArrayFloat = np.zeros(window_size // 2 + 1, dtype=np.float32)
+
+    def process_hop(self, hop: ArrayFloat) -> float:
+        assert len(hop) == self.hop_size
+        self._samples[: -self.hop_size] = self._samples[self.hop_size :]
+        self._samples[-self.hop_size :] = hop
+        spectrum = np.log1p(self.compression * np.abs(np.fft.rfft(self._samples * self.window)))
+        flux = float(np.sum(np.maximum(spectrum - self._previous_spectrum, 0.0)))
+        self._previous_spectrum = spectrum
+        return flux
+
+
+def estimate_tempo(
+    envelope: ArrayFloat, envelope_rate: float, min_bpm: float = 70.0, max_bpm: float = 180.0
+) -> tuple[float, float]:
+    """
+    Estimates the tempo from the autocorrelation of the onset envelope. Lags are weighted with a log normal
+    prior around 120 bpm to resolve octave errors. Returns bpm and a confidence between 0 and 1.
+    """
+    envelope = envelope - np.mean(envelope)
+    n = len(envelope)
+    spectrum = np.fft.rfft(envelope, n=2 * n)
+    autocorrelation = np.fft.irfft(spectrum * np.conj(spectrum))[:n]
+    if autocorrelation[0] <= 0:
+        return 0.0, 0.0
+    autocorrelation /= autocorrelation[0]
+
+    min_lag = max(1, int(60 * envelope_rate / max_bpm))
+    max_lag = min(n - 2, int(np.ceil(60 * envelope_rate / min_bpm)))
+    if max_lag <= min_lag:
+        return 0.0, 0.0
+    lags = np.arange(min_lag, max_lag + 1)
+    bpms = 60 * envelope_rate / lags
+    prior = np.exp(-0.5 * (np.log2(bpms / 120.0) / 0.5) ** 2)
+    scores = autocorrelation[lags] * prior
+    best = int(np.argmax(scores))
+    lag = float(lags[best])
+
+    # parabolic interpolation for sub frame lag resolution
+    if 0 < best < len(lags) - 1:
+        a, b, c = autocorrelation[lags[best] - 1 : lags[best] + 2]
+        denominator = a - 2 * b + c
+        if denominator != 0:
+            lag += 0.5 * (a - c) / denominator
+    confidence = float(np.clip(autocorrelation[lags[best]], 0.0, 1.0))
+    return 60 * envelope_rate / lag, confidence
+
+
+def estimate_beat_phase(envelope: ArrayFloat, envelope_rate: float, bpm: float) -> float:
+    """
+    Returns the phase of the beat grid in envelope frames, counted backwards from the last frame.
+    Each candidate phase is scored with a comb filter over the envelope.
+    """
+    period = 60 * envelope_rate / bpm
+    n = len(envelope)
+    n_teeth = int((n - 1) // period)
+    if n_teeth < 1:
+        return 0.0
+    offsets = np.arange(int(np.ceil(period)))
+    teeth = np.round(offsets[:, None] + np.arange(n_teeth)[None, :] * period).astype(int)
+    teeth = np.minimum(teeth, n - 1)
+    reversed_envelope = envelope[::-1]
+    scores = reversed_envelope[teeth].sum(axis=1)
+    return float(offsets[int(np.argmax(scores))])
+
+
+class BeatTracker:
+    """
+    Reads audio from an AudioSource in a background thread and estimates bpm and beat phase.
+    Results are passed to the render thread via the modification queue of the EventHandler,
+    so that the render loop is never blocked by the analysis.
+    """
+
+    def __init__(
+        self,
+        root: Optional["RaveLightsApp"],
+        source: AudioSource,
+        window_size: int = 1024,
+        hop_size: int = 512,
+        history_time: float = 6.0,
+        update_interval: float = 1.0,
+        min_bpm: float = 70.0,
+        max_bpm: float = 180.0,
+        min_confidence: float = 0.1,
+    ):
+        self.root = root
+        self.source = source
+        self.hop_size = hop_size
+        self.update_interval = update_interval
+        self.min_bpm = min_bpm
+        self.max_bpm = max_bpm
+        self.min_confidence = min_confidence
+        self.onset_detector = OnsetDetector(window_size=window_size, hop_size=hop_size)
+        self.envelope_rate = source.sample_rate / hop_size
+
+        # ring buffer of the onset envelope
+        self.history_length = int(history_time * self.envelope_rate)
+        self._envelope: ArrayFloat = np.zeros(self.history_length, dtype=np.float32)
+        self._envelope_index: int = 0
+        self._n_hops: int = 0
+        self._last_hop_time: float = 0.0
+        self._samples: ArrayFloat = np.zeros(0, dtype=np.float32)
+        self._last_update_hop: int = 0
+
+        self.estimate: Optional[BeatEstimate] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = threading.Event()
+
+    # ─── Thread ───────────────────────────────────────────────────────────
+    def start(self) -> None:
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, name="beat_tracker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running.clear()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.source.close()
+
+    def _run(self) -> None:
+        logger.info(f"beat tracking started with sample rate {self.source.sample_rate}")
+        while self._running.is_set():
+            samples = self.source.read(self.hop_size)
+            if samples is None:
+                logger.info("audio stream ended, beat tracking stopped")
+                break
+            self.process_samples(samples, time_stamp=time.perf_counter())
+
+    # ─── Analysis ─────────────────────────────────────────────────────────
+    def process_samples(self, samples: ArrayFloat, time_stamp: Optional[float] = None) -> Optional[BeatEstimate]:
+        """
+        Feeds samples into the tracker. time_stamp is the time of the last sample. If it is not given,
+        a clock based on the sample count is used, which is useful for offline analysis.
+        Returns a new estimate, if one was calculated.
+        """
+        self._samples = np.concatenate((self._samples, samples))
+        n_hops = len(self._samples) // self.hop_size
+        hop_duration = self.hop_size / self.source.sample_rate
+        for i in range(n_hops):
+            hop = self._samples[i * self.hop_size : (i + 1) * self.hop_size]
+            self._envelope[self._envelope_index] = self.onset_detector.process_hop(hop)
+            self._envelope_index = (self._envelope_index + 1) % self.history_length
+            self._n_hops += 1
+        self._samples = self._samples[n_hops * self.hop_size :]
+        if time_stamp is None:
+            self._last_hop_time = self._n_hops * hop_duration
+        else:
+            self._last_hop_time = time_stamp - len(self._samples) / self.source.sample_rate
+
+        if self._n_hops < self.history_length // 2:
+            return None
+        if (self._n_hops - self._last_update_hop) < self.update_interval * self.envelope_rate:
+            return None
+        self._last_update_hop = self._n_hops
+        return self.update_estimate()
+
+    def get_envelope(self) -> ArrayFloat:
+        """returns the onset envelope in chronological order"""
+        envelope = np.roll(self._envelope, -self._envelope_index)
+        return envelope[-min(self._n_hops, self.history_length) :]
+
+    def update_estimate(self) -> Optional[BeatEstimate]:
+        envelope = self.get_envelope()
+        bpm, confidence = estimate_tempo(envelope, self.envelope_rate, self.min_bpm, self.max_bpm)
+        if confidence < self.min_confidence:
+            return None
+        phase = estimate_beat_phase(envelope, self.envelope_rate, bpm)
+        # the flux of an onset peaks in the hop where the onset reaches the center of the window
+        beat_time_stamp = self._last_hop_time - (phase + 0.5) / self.envelope_rate
+        self.estimate = BeatEstimate(bpm=bpm, beat_time_stamp=beat_time_stamp, confidence=confidence)
+        if self.root is not None:
+            self.root.eventhandler.add_to_modification_queue(
+                dict(action="set_beat_tracking", bpm=bpm, beat_time_stamp=beat_time_stamp)
+            )
+        return self.estimate
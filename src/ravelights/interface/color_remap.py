@@ -1,8 +1,8 @@
 from enum import auto
-from typing import Callable
+from typing import Callable, Optional
 
 import numpy as np
-from ravelights.core.custom_typing import ArrayFloat
+from ravelights.core.custom_typing import ArrayFloat, ArrayUInt8
 from ravelights.core.utils import StrEnum
 
 ColorMapping = Callable[[ArrayFloat], ArrayFloat]
@@ -34,6 +34,7 @@ xp, fp = zip(*LUM_DATA_WS2815)
 def ws2815_color_mapping(in_matrix: ArrayFloat) -> ArrayFloat:
     # print("ws2815_color_mapping()", in_matrix.shape)
     # shape is (144, 9, 3)
+    # note: returns the led signal [0, 255], not [0, 1]
     return np.interp(in_matrix, fp, xp)
 
 
@@ -46,3 +47,21 @@ ColorProfilesFunctions: dict[str, ColorMapping] = {
     ColorProfiles.LINEAR.value: linear_color_mapping,
     ColorProfiles.WS2815.value: ws2815_color_mapping,
 }
+
+
+# ─── Lookup Tables ────────────────────────────────────────────────────────────
+# the output conversion of PixelMatrix maps brightness [0, 1] to the led signal [0, 255] with one lookup per value
+
+LUT_SIZE = 4096
+
+
+def get_color_profile_lut(color_mapping: ColorMapping) -> ArrayUInt8:
+    brightness = np.linspace(0.0, 1.0, LUT_SIZE)
+    return np.round(np.clip(color_mapping(brightness), 0, 255)).astype(np.uint8)
+
+
+# None: linear profiles are converted by multiplication, which is faster than a lookup
+ColorProfilesLuts: dict[str, Optional[ArrayUInt8]] = {
+    ColorProfiles.LINEAR.value: None,
+    ColorProfiles.WS2815.value: get_color_profile_lut(ws2815_color_mapping),
+}
@@ -3,14 +3,13 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 from loguru import logger
-from ravelights.core.custom_typing import ArrayFloat, ArrayUInt8, LightIdentifier, Transmitter
+from ravelights.core.custom_typing import ArrayUInt8, LightIdentifier, Transmitter
 from ravelights.interface.artnet.artnet_transmitter import ArtnetTransmitter
 from ravelights.interface.artnet.artnet_udp_transmitter import ArtnetUdpTransmitter
-from ravelights.interface.discovery import discovery_service
-from ravelights.interface.rest_client import RestClient
 
 if TYPE_CHECKING:
     from ravelights import RaveLightsApp
+    from ravelights.core.shared_frames import SharedFrameRing
 
 
 class DataRouter(ABC):
@@ -20,7 +19,7 @@ class DataRouter(ABC):
         self.devices = self.root.devices
 
     @abstractmethod
-    def transmit_matrix(self, matrices_processed_int: list[ArrayFloat], matrices_int: list[ArrayUInt8]):
+    def transmit_matrix(self, matrices_processed_int: list[ArrayUInt8], matrices_int: list[ArrayUInt8]):
         ...
 
 
@@ -32,16 +31,31 @@ class DataRouterTransmitter(DataRouter):
         self._ip_address: str | None = None
 
     def _on_discovery_update(self, hostname: str, new_ip_address: str | None):
+        """called from the discovery thread, the output config is sent by the discovery supervisor"""
         if new_ip_address != self._ip_address:
-            if new_ip_address is not None:
-                rest_client = RestClient(ip_address=new_ip_address)
-                rest_client.set_output_config(self.leds_per_output)
-                logger.info(f"Set output config for {hostname} ({new_ip_address}) to {self.leds_per_output}")
+            self._ip_address = new_ip_address
 
             if isinstance(self.transmitter, ArtnetUdpTransmitter):
                 self.transmitter.update_ip_address(new_ip_address)
 
-            self._ip_address = new_ip_address
+            if new_ip_address is not None:
+                self.root.discovery_supervisor.submit(
+                    job=lambda: self._send_output_config(hostname, new_ip_address),
+                    description=f"set output config for {hostname} ({new_ip_address})",
+                )
+
+    def _send_output_config(self, hostname: str, ip_address: str) -> bool:
+        if ip_address != self._ip_address:
+            # pixeldriver has disappeared or changed its address in the meantime
+            return True
+
+        from ravelights.interface.rest_client import RestClient
+
+        rest_client = RestClient(ip_address=ip_address)
+        if not rest_client.set_output_config(self.leds_per_output):
+            return False
+        logger.info(f"Set output config for {hostname} ({ip_address}) to {self.leds_per_output}")
+        return True
 
     def apply_transmitter_receipt(
         self,
@@ -55,6 +69,8 @@ class DataRouterTransmitter(DataRouter):
         # one out matrix per datarouter / transmitter
         self.out_matrix = np.zeros((self.n, 3), dtype=np.uint8)
 
+        from ravelights.interface.discovery import discovery_service
+
         discovery_service.register_callback(hostname, self._on_discovery_update)
         logger.info(f"Initialized transmitter for device {hostname}. Waiting for IP address to be discovered...")
 
@@ -71,7 +87,7 @@ class DataRouterTransmitter(DataRouter):
         n_total = sum(leds_per_output)
         return leds_per_output, out_lights, n_total
 
-    def transmit_matrix(self, matrices_processed_int: list[ArrayFloat], matrices_int: list[ArrayUInt8]):
+    def transmit_matrix(self, matrices_processed_int: list[ArrayUInt8], matrices_int: list[ArrayUInt8]):
         index = 0
         for out_light in self.out_lights:
             matrix_view = matrices_processed_int[out_light["device"]][:, out_light["light"], :]
@@ -86,7 +102,7 @@ class DataRouterTransmitter(DataRouter):
 class DataRouterWebsocket(DataRouter):
     """sends matrices_int at full brightness to websocket"""
 
-    def transmit_matrix(self, matrices_processed_int: list[ArrayFloat], matrices_int: list[ArrayUInt8]):
+    def transmit_matrix(self, matrices_processed_int: list[ArrayUInt8], matrices_int: list[ArrayUInt8]):
         if hasattr(self.root, "rest_api"):
             if self.root.rest_api.websocket_num_clients > 0:
                 matrix_int = matrices_int[0]
@@ -95,12 +111,23 @@ class DataRouterWebsocket(DataRouter):
                 # turn into rgba
                 matrix_int_padded = np.pad(matrix_int, pad_width=((0, 0), (0, 1)), constant_values=255)
                 data = matrix_int_padded.flatten().tobytes()
-                self.root.rest_api.socketio.send(data)
+                self.root.rest_api.send_websocket(data)
 
 
 class DataRouterVisualizer(DataRouter):
     """sends matrices_int at full brightness to pygame visualizer"""
 
-    def transmit_matrix(self, matrices_processed_int: list[ArrayFloat], matrices_int: list[ArrayUInt8]):
+    def transmit_matrix(self, matrices_processed_int: list[ArrayUInt8], matrices_int: list[ArrayUInt8]):
         if hasattr(self.root, "visualizer"):
             self.root.visualizer.render(matrices_int)
+
+
+class DataRouterSharedMemory(DataRouter):
+    """publishes all matrices to a shared memory ring buffer, which is read by the output process"""
+
+    def __init__(self, root: "RaveLightsApp", frames: "SharedFrameRing"):
+        super().__init__(root=root)
+        self.frames = frames
+
+    def transmit_matrix(self, matrices_processed_int: list[ArrayUInt8], matrices_int: list[ArrayUInt8]):
+        self.frames.write(matrices_processed_int, matrices_int)
@@ -0,0 +1,114 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from loguru import logger
+from ravelights.interface.discovery import connectivity_check, discovery_service
+
+# returns True when the job is done, False if it should be retried later
+DiscoveryJob = Callable[[], bool]
+
+
+@dataclass
+class PendingJob:
+    job: DiscoveryJob
+    description: str
+    next_try: float = 0.0
+    attempts: int = 0
+
+
+class DiscoverySupervisor:
+    """
+    Runs everything that depends on the network in a background thread, such that rendering starts right away:
+    waits for network connectivity, (re)starts the discovery of pixeldrivers and runs jobs that are submitted by
+    discovery callbacks, such as sending the output config to a pixeldriver. Failed jobs are retried with backoff.
+    Register all discovery callbacks before start().
+    """
+
+    def __init__(self, poll_interval: float = 5.0, min_backoff: float = 1.0, max_backoff: float = 30.0):
+        self.poll_interval = poll_interval
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.is_discovery_running = False
+        self._submitted: queue.SimpleQueue[PendingJob] = queue.SimpleQueue()
+        self._pending: list[PendingJob] = []
+        self._thread: Optional[threading.Thread] = None
+        self._running = threading.Event()
+        self._wakeup = threading.Event()
+
+    # ─── Thread ───────────────────────────────────────────────────────────
+    def start(self) -> None:
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, name="discovery_supervisor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running.clear()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        if self.is_discovery_running:
+            discovery_service.stop()
+            self.is_discovery_running = False
+
+    def _run(self) -> None:
+        logger.info("Waiting until connected to network...")
+        last_connectivity_check = -self.poll_interval
+        while self._running.is_set():
+            now = time.monotonic()
+            if now - last_connectivity_check >= self.poll_interval:
+                self.check_connectivity()
+                last_connectivity_check = now
+            self.run_jobs()
+            self._wakeup.wait(timeout=self.get_timeout())
+            self._wakeup.clear()
+
+    def get_timeout(self) -> float:
+        """time until the next connectivity check or job retry is due"""
+        if not self._pending:
+            return self.poll_interval
+        next_try = min(pending.next_try for pending in self._pending)
+        return min(self.poll_interval, max(0.0, next_try - time.monotonic()))
+
+    # ─── Connectivity ─────────────────────────────────────────────────────
+    def check_connectivity(self) -> None:
+        is_connected = connectivity_check.is_connected_to_network()
+        if is_connected and not self.is_discovery_running:
+            logger.info("Successfully connected to network")
+            try:
+                discovery_service.start()
+            except RuntimeError as e:
+                logger.warning(f"Could not start discovery service: {e}")
+                return
+            self.is_discovery_running = True
+        elif not is_connected and self.is_discovery_running:
+            logger.warning("Lost network connection, discovery paused until connected again")
+            discovery_service.stop()
+            self.is_discovery_running = False
+
+    # ─── Jobs ─────────────────────────────────────────────────────────────
+    def submit(self, job: DiscoveryJob, description: str) -> None:
+        """thread safe, can be called from discovery callbacks"""
+        self._submitted.put(PendingJob(job=job, description=description))
+        self._wakeup.set()
+
+    def run_jobs(self) -> None:
+        while not self._submitted.empty():
+            self._pending.append(self._submitted.get())
+
+        now = time.monotonic()
+        for pending in [pending for pending in self._pending if pending.next_try <= now]:
+            pending.attempts += 1
+            try:
+                is_done = pending.job()
+            except Exception:
+                logger.exception(f"Job failed: {pending.description}")
+                is_done = False
+            if is_done:
+                self._pending.remove(pending)
+                continue
+            backoff = min(self.max_backoff, self.min_backoff * 2 ** (pending.attempts - 1))
+            pending.next_try = now + backoff
+            logger.warning(f"Retrying in {backoff:.1f} s: {pending.description}")
@@ -0,0 +1,108 @@
+import dataclasses
+import importlib.resources
+import json
+from enum import auto
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Protocol
+
+from loguru import logger
+from ravelights.core.utils import StrEnum
+
+if TYPE_CHECKING:
+    from ravelights.core.ravelights_app import RaveLightsApp
+    from ravelights.interface.sse_broker import SseBroker
+
+
+class InterfaceBackend(StrEnum):
+    """server that provides /rest/*, /sse, the websocket and the static webui files"""
+
+    FLASK = auto()  # flask with the werkzeug server, one thread per client
+    ASGI = auto()  # asyncio server (uvicorn), all clients are served by one event loop thread
+
+
+class Interface(Protocol):
+    sse_broker: "SseBroker"
+    websocket_num_clients: int
+
+    def send_websocket(self, data: bytes) -> None:
+        ...
+
+
+def create_interface(
+    root: "RaveLightsApp", backend: InterfaceBackend | str, port: int, serve_webui: bool
+) -> Interface:
+    """the backends are imported here, such that only the dependencies of the selected backend are loaded"""
+    match InterfaceBackend(backend):
+        case InterfaceBackend.FLASK:
+            from ravelights.interface.rest_api import RestAPI
+
+            return RestAPI(root=root, port=port, serve_webui=serve_webui)
+        case InterfaceBackend.ASGI:
+            from ravelights.interface.asgi_api import AsgiAPI
+
+            return AsgiAPI(root=root, port=port, serve_webui=serve_webui)
+        case _:
+            raise ValueError(f"unknown interface backend {backend}")
+
+
+def get_quasar_ui_dir() -> Path:
+    """get quasar (ravelights_ui) dir"""
+    path_manager = importlib.resources.path("ravelights_ui", "index.html")
+    with path_manager as path:
+        if path.is_file():
+            return path.parent
+        else:
+            logger.warning("quasar ui files could not be found")
+            logger.warning("trying to find the ui at path:")
+            logger.warning(path)
+            raise FileNotFoundError
+
+
+# ─── Serialization ────────────────────────────────────────────────────────────
+# same output as the json provider and marshal_with of the flask backend
+
+
+def _json_default(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "tolist"):  # numpy arrays and scalars
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any) -> str:
+    return json.dumps(obj, default=_json_default, sort_keys=True)
+
+
+def get_settings_data(root: "RaveLightsApp") -> dict[str, Any]:
+    data = dataclasses.asdict(root.settings)
+    data["colors"] = root.settings.color_engine.get_colors_rgb_target()
+    return data
+
+
+def _as_str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def get_devices_data(root: "RaveLightsApp") -> list[dict[str, Any]]:
+    return [
+        {
+            "device_id": int(device.device_id),
+            "n_leds": int(device.n_leds),
+            "n_lights": int(device.n_lights),
+            "is_prim": bool(device.is_prim),
+            "device_manual_timeline_level": int(device.device_manual_timeline_level),
+            "device_triggerskip": int(device.device_triggerskip),
+            "device_frameskip": int(device.device_frameskip),
+            "device_brightness": float(device.device_brightness),
+        }
+        for device in root.devices
+    ]
+
+
+def get_effect_queues_data(root: "RaveLightsApp") -> list[list[dict[str, Optional[str]]]]:
+    keys = ["name", "mode", "draw_mode", "limit_frames", "loop_length", "trigger"]
+    return [
+        [{key: _as_str(getattr(effect_wrapper, key, None)) for key in keys} for effect_wrapper in effect_queue]
+        for effect_queue in root.effecthandler.effect_queues
+    ]
@@ -1,17 +1,14 @@
-import importlib.resources
 import threading
-from dataclasses import asdict
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from flask import Flask, Response, jsonify, make_response, request, send_from_directory
+from flask import Flask, Response, request, send_from_directory
 from flask_restful import Api, Resource, fields, marshal_with  # type: ignore
 from flask_socketio import SocketIO, emit  # type: ignore
 from loguru import logger
 from ravelights.core.event_handler import EventHandler
-from ravelights.core.meta_handler import MetaHandler
-from ravelights.core.pattern_scheduler import PatternScheduler
-from ravelights.core.settings import Settings
+from ravelights.core.state_snapshots import MIN_GZIP_SIZE, SerializedSnapshot, StateSnapshots
+from ravelights.interface.interface_backend import get_quasar_ui_dir
+from ravelights.interface.sse_broker import SseBroker
 
 if TYPE_CHECKING:
     from ravelights.core.device import Device
@@ -28,8 +25,8 @@ class RestAPI:
         self.root = root
         self.port = port
 
-        self.sse_event: str = ""
-        self.sse_unblock_event = threading.Event()
+        self.sse_broker = SseBroker(window=1 / self.root.settings.fps)
+        self.sse_broker.start()
 
         self.websocket_num_clients: int = 0
 
@@ -42,7 +39,7 @@ class RestAPI:
         # ─── Static Files ─────────────────────────────────────────────
 
         if serve_webui:
-            self.quasar_dir = self.get_quasar_ui_dir()
+            self.quasar_dir = get_quasar_ui_dir()
 
             # serve index at root
             @self.flask_app.route("/")
@@ -58,12 +55,7 @@ class RestAPI:
 
         @self.flask_app.route("/sse")
         def stream():
-            def event_stream():
-                while True:
-                    self.block_once()
-                    yield f"data: {self.sse_event}\n\n"
-
-            return Response(event_stream(), 200, content_type="text/event-stream")
+            return Response(self.sse_broker.stream(), 200, content_type="text/event-stream")
 
         # ─── REST ─────────────────────────────────────────────────────
         self.setup_resource_routing()
@@ -84,23 +76,6 @@ class RestAPI:
 
         self.start_threaded()
 
-    def block_once(self):
-        """this could be any function that blocks until data is ready"""
-        self.sse_unblock_event.wait()
-        self.sse_unblock_event.clear()
-
-    def get_quasar_ui_dir(self) -> Path:
-        """get quasar (ravelights_ui) dir"""
-        path_manager = importlib.resources.path("ravelights_ui", "index.html")
-        with path_manager as path:
-            if path.is_file():
-                return path.parent
-            else:
-                logger.warning("quasar ui files could not be found")
-                logger.warning("trying to find the ui at path:")
-                logger.warning(path)
-                raise FileNotFoundError
-
     def setup_resource_routing(self):
         self._api = Api(self.flask_app)
         self._api.add_resource(SettingsAPIResource, "/rest/settings", resource_class_args=(self.root,))
@@ -109,6 +84,9 @@ class RestAPI:
         self._api.add_resource(MetaAPIResource, "/rest/meta", resource_class_args=(self.root,))
         self._api.add_resource(EffectAPIResource, "/rest/effect", resource_class_args=(self.root,))
 
+    def send_websocket(self, data: bytes) -> None:
+        self.socketio.send(data)
+
     def start_threaded(self, debug: bool = False):
         logger.info("Starting REST API thread...")
         threading.Thread(
@@ -124,18 +102,29 @@ class RestAPI:
         ).start()
 
 
+def make_snapshot_response(snapshot: SerializedSnapshot) -> Response:
+    """Sends a cached snapshot. Answers with 304 if the client already has the current version (If-None-Match)."""
+    if snapshot.etag in request.if_none_match:
+        response = Response(status=304)
+    elif len(snapshot.body) >= MIN_GZIP_SIZE and "gzip" in request.accept_encodings:
+        response = Response(snapshot.body_gzip, status=200, mimetype="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = Response(snapshot.body, status=200, mimetype="application/json")
+    response.set_etag(snapshot.etag)
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
 class SettingsAPIResource(Resource):
     def __init__(self, root: "RaveLightsApp"):
         super().__init__()
         self.eventhandler = root.eventhandler
-        self.settings: Settings = root.settings
-        self.patternscheduler: PatternScheduler = root.patternscheduler
+        self.snapshots: StateSnapshots = root.snapshots
 
     def get(self):
-        data = asdict(self.settings)
-        data["colors"] = self.settings.color_engine.get_colors_rgb_target()
-        # ic(data)
-        return make_response(jsonify(data), 200)
+        return make_snapshot_response(self.snapshots.get("settings"))
 
     def put(self):
         receive_data: dict[str, Any] = request.get_json()
@@ -148,11 +137,10 @@ class SettingsAPIResource(Resource):
 class TriggersAPIResource(Resource):
     def __init__(self, root: "RaveLightsApp"):
         super().__init__()
-        self.settings: Settings = root.settings
+        self.snapshots: StateSnapshots = root.snapshots
 
     def get(self):
-        data = self.settings.triggers
-        return make_response(jsonify(data), 200)
+        return make_snapshot_response(self.snapshots.get("triggers"))
 
 
 resource_fields_devices = {
@@ -180,13 +168,10 @@ class DevicesAPIResource(Resource):
 class MetaAPIResource(Resource):
     def __init__(self, root: "RaveLightsApp"):
         super().__init__()
-        self.metahandler: MetaHandler = root.metahandler
-        self.data = None
+        self.snapshots: StateSnapshots = root.snapshots
 
     def get(self):
-        if self.data is None:
-            self.data = jsonify(self.metahandler.api_content)
-        return make_response(self.data, 200)
+        return make_snapshot_response(self.snapshots.get("meta"))
 
 
 resource_fields_effect = {
@@ -202,7 +187,6 @@ resource_fields_effect = {
 class EffectAPIResource(Resource):
     def __init__(self, root: "RaveLightsApp"):
         super().__init__()
-        self.settings: Settings = root.settings
         self.effecthandler = root.effecthandler
         self.eventhandler: EventHandler = root.eventhandler
 
@@ -0,0 +1,158 @@
+import asyncio
+import queue
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Iterator, Optional, TypeVar, overload
+
+from loguru import logger
+
+
+class SseSubscriber(ABC):
+    """receiver of the topics of the SseBroker. dropped counts the topics that were dropped for a slow client"""
+
+    dropped: int
+
+    @abstractmethod
+    def put(self, topic: str) -> None:
+        """called by the dispatcher thread, must not block"""
+        ...
+
+
+Subscriber = TypeVar("Subscriber", bound=SseSubscriber)
+
+
+class SseClient(SseSubscriber):
+    """one connected /sse client, the queue holds topics that have not been sent yet"""
+
+    def __init__(self, max_queue_size: int):
+        self.queue: queue.Queue[str] = queue.Queue(maxsize=max_queue_size)
+        self.dropped: int = 0
+
+    def put(self, topic: str) -> None:
+        """if the client is too slow, the oldest topic is dropped"""
+        while True:
+            try:
+                self.queue.put_nowait(topic)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout: float) -> Optional[str]:
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class AsyncSseClient(SseSubscriber):
+    """client of an asyncio server, topics are handed over to the event loop of the server"""
+
+    def __init__(self, max_queue_size: int, loop: asyncio.AbstractEventLoop):
+        self.async_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue_size)
+        self.loop = loop
+        self.dropped: int = 0
+
+    def put(self, topic: str) -> None:
+        self.loop.call_soon_threadsafe(self._put_nowait, topic)
+
+    def _put_nowait(self, topic: str) -> None:
+        if self.async_queue.full():
+            self.async_queue.get_nowait()
+            self.dropped += 1
+        self.async_queue.put_nowait(topic)
+
+
+class SseBroker:
+    """
+    Fans out server sent events to all /sse clients.
+    publish() is called by the render thread and only appends the topic to a deque, it never takes a lock or wakes
+    clients. A dispatcher thread collects the published topics once per window, sends each topic once per window
+    (coalescing), and puts them into a bounded queue per client.
+    """
+
+    def __init__(self, window: float = 0.05, max_queue_size: int = 32, keepalive_interval: float = 15.0):
+        self.window = window
+        self.max_queue_size = max_queue_size
+        self.keepalive_interval = keepalive_interval
+        self._published: deque[str] = deque()
+        self._clients: set[SseSubscriber] = set()
+        self._clients_lock = threading.Lock()  # only taken by the dispatcher and the client threads
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def publish(self, topic: str) -> None:
+        self._published.append(topic)
+
+    # ─── Clients ──────────────────────────────────────────────────────────
+    @overload
+    def subscribe(self) -> SseClient:
+        ...
+
+    @overload
+    def subscribe(self, client: Subscriber) -> Subscriber:
+        ...
+
+    def subscribe(self, client: Optional[SseSubscriber] = None) -> SseSubscriber:
+        """without client, a SseClient with a blocking queue is created"""
+        if client is None:
+            client = SseClient(max_queue_size=self.max_queue_size)
+        with self._clients_lock:
+            self._clients.add(client)
+        return client
+
+    def unsubscribe(self, client: SseSubscriber) -> None:
+        with self._clients_lock:
+            self._clients.discard(client)
+
+    @property
+    def num_clients(self) -> int:
+        return len(self._clients)
+
+    def stream(self) -> Iterator[str]:
+        """formatted event stream for one client, sends a comment as keepalive to detect closed connections"""
+        client = self.subscribe()
+        try:
+            while True:
+                topic = client.get(timeout=self.keepalive_interval)
+                if topic is None:
+                    yield ": keepalive\n\n"
+                else:
+                    yield f"data: {topic}\n\n"
+        finally:
+            self.unsubscribe(client)
+
+    # ─── Dispatcher ───────────────────────────────────────────────────────
+    def start(self) -> None:
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="sse_broker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(timeout=self.window):
+            self.dispatch()
+
+    def dispatch(self) -> list[str]:
+        """sends every topic that was published since the last call once to each client"""
+        topics: dict[str, None] = dict()
+        while self._published:
+            topics[self._published.popleft()] = None
+        if not topics:
+            return []
+
+        with self._clients_lock:
+            clients = list(self._clients)
+        for client in clients:
+            for topic in topics:
+                client.put(topic)
+        logger.trace(f"dispatched {list(topics)} to {len(clients)} sse clients")
+        return list(topics)
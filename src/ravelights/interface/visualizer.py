@@ -1,13 +1,15 @@
-from typing import TYPE_CHECKING
+import math
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 import pygame
 from ravelights.configs.visualizer_configurations import configurations
+from ravelights.core.custom_typing import ArrayUInt8
 from ravelights.core.device import Device
 from ravelights.core.device_shared import DeviceLightConfig
 from ravelights.core.event_handler import EventHandler
 from ravelights.core.settings import Settings
-from ravelights.core.time_handler import BeatStatePattern, TimeHandler
+from ravelights.core.time_handler import TimeHandler
 
 if TYPE_CHECKING:
     from ravelights.core.ravelights_app import RaveLightsApp
@@ -18,10 +20,50 @@ SCREENHEIGHT = 800
 EDGE_HEIGHT = 5
 CELLWIDTH = 10
 GUISCALE = 1.5
+# areas of the beat indicators and the stats, which are cleared on each frame
+GUI_RECTS = [(0, 0, SCREENWIDTH, 80), (0, SCREENHEIGHT - 60, SCREENWIDTH, 60)]
+MAX_CACHED_TEXTS = 512
+
+CoordinateMap = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def get_light_coordinates(n_leds: int, x: float, y: float, rot: float, scale: float) -> CoordinateMap:
+    """
+    screen coordinates (x, y) of the pixels that are covered by a light and the led that is shown at each of them.
+    The geometry is the same as drawing the light with a width of CELLWIDTH, rotating it counterclockwise by rot
+    degrees and scaling it by scale * GUISCALE with pygame.transform.rotozoom(), centered at the relative position
+    (x, y) of the screen
+    """
+    zoom = scale * GUISCALE
+    width, height = CELLWIDTH * zoom, n_leds * zoom
+    cos, sin = math.cos(math.radians(rot)), math.sin(math.radians(rot))
+    half_w = 0.5 * (abs(width * cos) + abs(height * sin))
+    half_h = 0.5 * (abs(width * sin) + abs(height * cos))
+    # the bounding box is placed on whole pixels, like a blit of the rotated surface
+    left, top = int(SCREENWIDTH * x - half_w), int(SCREENHEIGHT * y - half_h)
+
+    # centers of all pixels of the bounding box, relative to the center of the light
+    xs = np.arange(max(0, left), min(SCREENWIDTH, left + math.ceil(2 * half_w)))
+    ys = np.arange(max(0, top), min(SCREENHEIGHT, top + math.ceil(2 * half_h)))
+    pixels_x, pixels_y = np.meshgrid(xs, ys, indexing="ij")
+    dx, dy = pixels_x + 0.5 - (left + half_w), pixels_y + 0.5 - (top + half_h)
+
+    # rotate back, such that u runs across and v along the light
+    u = dx * cos - dy * sin + 0.5 * width
+    v = dx * sin + dy * cos + 0.5 * height
+    inside = (u >= 0.0) & (u < width) & (v >= 0.0) & (v < height)
+    leds = np.minimum((v[inside] / zoom).astype(np.intp), n_leds - 1)
+    return pixels_x[inside], pixels_y[inside], leds
 
 
 class Visualizer:
-    def __init__(self, root: "RaveLightsApp"):
+    """
+    Draws the lights of all devices into one window. The screen coordinates of all leds are computed once, such that
+    each frame is a single array write into the screen surface per device. With preview_fps, the frames are drawn
+    at a reduced rate in the slack time of the render loop, see IdleTaskScheduler.
+    """
+
+    def __init__(self, root: "RaveLightsApp", preview_fps: Optional[float] = None):
         self.root = root
         self.settings: Settings = self.root.settings
         self.devices: list[Device] = self.root.devices
@@ -33,7 +75,16 @@ class Visualizer:
         self.surface = pygame.display.set_mode((SCREENWIDTH, SCREENHEIGHT))
         self.surface.fill(C_BLACK)
         self.timehandler.bpm_sync()
-        self.create_surfaces()
+        self.create_coordinate_maps()
+        self.fonts: dict[tuple[str, int], pygame.font.Font] = dict()
+        self.text_surfaces: dict[tuple[str, str, int], pygame.Surface] = dict()
+
+        self.preview_fps = preview_fps
+        self.matrices_int: Optional[list[ArrayUInt8]] = None
+        self.time_last_preview: float = 0.0
+        if self.preview_fps is not None:
+            # drawn at least once per second, such that the window stays responsive without slack time
+            self.timehandler.idle_tasks.register("visualizer", self.draw_preview, max_delay_frames=self.settings.fps)
 
     def get_visualizer_config(self):
         device_config_string = str(self.settings.device_config)
@@ -69,51 +120,54 @@ class Visualizer:
             if event.type == pygame.QUIT:
                 exit()
 
-    def create_surfaces(self) -> None:
-        self.surfaces_small: list[list[pygame.Surface]] = []
-        self.surfaces_big: list[list[pygame.Surface]] = []
-        for device in self.devices:
-            n_leds = device.pixelmatrix.n_leds
-            n_lights = device.pixelmatrix.n_lights
-            s_list_small: list[pygame.Surface] = []
-            s_list_big: list[pygame.Surface] = []
-            surface_size_small = (1, n_leds)
-            surface_size_big = (10, n_leds)
-            for _ in range(n_lights):
-                s_list_small.append(pygame.Surface(surface_size_small))
-                s_list_big.append(pygame.Surface(surface_size_big))
-            self.surfaces_small.append(s_list_small)
-            self.surfaces_big.append(s_list_big)
-
-    def render(self, matrices_int):
-        self.surface.fill(C_BLACK)
-        for device_id, matrix_int in enumerate(matrices_int):
-            device = self.root.devices[device_id]
-            # matrix_int = device.pixelmatrix.get_matrix_int()
-            for light_id in range(device.pixelmatrix.n_lights):
-                matrix_int_view = matrix_int[:, light_id, :]
-
-                # RENDER AND SCALE
-                surf_small = self.surfaces_small[device_id][light_id]
-                surf_big = self.surfaces_big[device_id][light_id]
-                array = np.expand_dims(matrix_int_view, 0)
-                pygame.surfarray.blit_array(surf_small, array)  # type: ignore
-                pygame.transform.scale(surf_small, surf_big.get_size(), surf_big)
-
-                # GET POSITIONS FROM CONFIG
-                x_pos_rel = self.visualizer_config[device_id][light_id]["x"]
-                y_pos_rel = self.visualizer_config[device_id][light_id]["y"]
-                rot = self.visualizer_config[device_id][light_id]["rot"]
-                scale = self.visualizer_config[device_id][light_id]["scale"]
-
-                # ROTATE AND PLACE
-                new_surface = pygame.transform.rotozoom(surf_big, rot, scale * GUISCALE)
-                x_shift, y_shift = new_surface.get_size()
-                x_pos = int(SCREENWIDTH * x_pos_rel - x_shift * 0.5)
-                y_pos = int(SCREENHEIGHT * y_pos_rel - y_shift * 0.5)
-                self.surface.blit(new_surface, (x_pos, y_pos))
+    def create_coordinate_maps(self) -> None:
+        """screen coordinates of all lights of each device and the index of the shown led in the flattened matrix"""
+        self.coordinate_maps: list[CoordinateMap] = []
+        self.update_rects: list[pygame.Rect] = [pygame.Rect(rect) for rect in GUI_RECTS]
+        for device_id, device in enumerate(self.devices):
+            n_leds, n_lights = device.pixelmatrix.n_leds, device.pixelmatrix.n_lights
+            coordinate_maps: list[CoordinateMap] = []
+            for light_id in range(n_lights):
+                pixels_x, pixels_y, leds = get_light_coordinates(n_leds, **self.visualizer_config[device_id][light_id])
+                coordinate_maps.append((pixels_x, pixels_y, leds * n_lights + light_id))
+                if len(pixels_x) > 0:
+                    left, top = int(pixels_x.min()), int(pixels_y.min())
+                    size = (int(pixels_x.max()) - left + 1, int(pixels_y.max()) - top + 1)
+                    self.update_rects.append(pygame.Rect((left, top), size))
+            self.coordinate_maps.append(
+                (
+                    np.concatenate([pixels_x for pixels_x, _, _ in coordinate_maps]),
+                    np.concatenate([pixels_y for _, pixels_y, _ in coordinate_maps]),
+                    np.concatenate([indices for _, _, indices in coordinate_maps]),
+                )
+            )
+
+    def render(self, matrices_int: list[ArrayUInt8]) -> None:
+        """draws the frame right away. with preview_fps, the frame is drawn later by draw_preview()"""
+        if self.preview_fps is None:
+            self.draw(matrices_int)
+        else:
+            self.matrices_int = matrices_int
+
+    def draw_preview(self, deadline: float) -> None:
+        if self.matrices_int is None or self.preview_fps is None:
+            return
+        now = self.timehandler.get_current_time()
+        if now - self.time_last_preview < 1 / self.preview_fps:
+            return
+        self.time_last_preview = now
+        self.draw(self.matrices_int)
+
+    def draw(self, matrices_int: list[ArrayUInt8]) -> None:
+        for rect in GUI_RECTS:
+            self.surface.fill(C_BLACK, rect)
+        # the lights always cover the same pixels, so they are written over the last frame
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        for matrix_int, (pixels_x, pixels_y, indices) in zip(matrices_int, self.coordinate_maps):
+            pixels[pixels_x, pixels_y] = matrix_int.reshape(-1, 3)[indices]
+        del pixels  # unlocks the surface
         self.draw_GUI()
-        pygame.display.update()
+        pygame.display.update(self.update_rects)
         self.send_inputs_to_eventhandler()
 
     def draw_GUI(self):
@@ -133,7 +187,7 @@ class Visualizer:
 
     def _draw_beat_state(self):
         """Draws blue rectangle on frames with beat."""
-        if BeatStatePattern(loop_length=1).is_match(self.timehandler.beat_state):
+        if self.timehandler.beat_state.is_beat:
             color = (0, 255, 255)
             square_w = 50
             square_h = 60
@@ -212,11 +266,21 @@ class Visualizer:
         font_name: str = pygame.font.match_font("consolas"),
         position: str = "topleft",
     ):
-        font = pygame.font.Font(font_name, size)
-        text_surface = font.render(text, True, (255, 255, 255))
+        text_surface = self.get_text_surface(text, font_name, size)
         text_rect = text_surface.get_rect()
         if position == "topleft":
             text_rect.topleft = (x, y)
         if position == "topright":
             text_rect.topright = (x, y)
         self.surface.blit(text_surface, text_rect)
+
+    def get_text_surface(self, text: str, font_name: str, size: int) -> pygame.Surface:
+        """rendered texts are cached, most of them do not change from frame to frame"""
+        key = (text, font_name, size)
+        if key not in self.text_surfaces:
+            if len(self.text_surfaces) >= MAX_CACHED_TEXTS:
+                self.text_surfaces.clear()
+            if (font_name, size) not in self.fonts:
+                self.fonts[(font_name, size)] = pygame.font.Font(font_name, size)
+            self.text_surfaces[key] = self.fonts[(font_name, size)].render(text, True, (255, 255, 255))
+        return self.text_surfaces[key]
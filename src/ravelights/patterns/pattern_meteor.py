@@ -112,7 +112,7 @@ class PatternMeteor(Pattern):
         # -> 1 | 1 | 0.5
         #    40% | 40 % | 20 %
         # n_beats * 1/2.5 + self.beat_progress / 2.5
-        if BeatStatePattern(loop_length=1).is_match(self.timehandler.beat_state):
+        if self.timehandler.beat_state.is_beat:
             self.n_beats += 1
         self.pos = int((self.n_leds - self.width) * (self.n_beats + self.timehandler.beat_progress) / self.travel_time)
 
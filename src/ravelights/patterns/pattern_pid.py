@@ -1,10 +1,8 @@
-import random
-
 import numpy as np
 from ravelights.core.color_handler import Color
 from ravelights.core.custom_typing import ArrayFloat
 from ravelights.core.generator_super import Pattern
-from ravelights.core.pid import PIDController
+from ravelights.core.pid import PIDBank
 from ravelights.core.time_handler import BeatStatePattern
 from ravelights.core.utils import lerp
 
@@ -14,7 +12,8 @@ class PatternPID(Pattern):
 
     def init(self):
         self.width = 20
-        self.pids = [PIDController(kp=0.5, kd=0.1, dt=self.timehandler.frame_time) for _ in range(self.n_lights)]
+        self.pids = PIDBank(n=self.n_lights, kp=0.5, kd=0.1, dt=self.timehandler.frame_time)
+        self.led_index = np.arange(self.n_leds)[:, None]
 
     @property
     def possible_triggers(self) -> list[BeatStatePattern]:
@@ -30,24 +29,21 @@ class PatternPID(Pattern):
         ...
 
     def on_trigger(self):
-        for pid in self.pids:
-            pid.target = random.randrange(0, self.n_leds)
+        self.pids.target[:] = np.random.randint(0, self.n_leds, self.n_lights)
 
     def perform_pid_steps(self):
-        for pid in self.pids:
-            # dynamic kd
-            pid.kp = lerp(self.settings.global_energy, 0.1, 1.0)
-            pid.kd = lerp(self.settings.global_energy, 0.05, 0.15)
-            pid.perform_pid_step()
+        # dynamic kd
+        self.pids.set_gains(
+            kp=lerp(self.settings.global_energy, 0.1, 1.0),
+            kd=lerp(self.settings.global_energy, 0.05, 0.15),
+        )
+        self.pids.perform_pid_step()
 
     def render(self, colors: list[Color]) -> ArrayFloat:
         self.perform_pid_steps()
-        matrix = self.get_float_matrix_2d_mono()
-        for index in range(self.n_lights):
-            pos = int(self.pids[index].value)
-            start = np.clip(pos - self.width // 2, 0, self.n_leds - 1)
-            end = np.clip(pos + self.width // 2, 0, self.n_leds)
-
-            matrix[start:end, index] = 1
+        positions = self.pids.value.astype(int)
+        start = np.clip(positions - self.width // 2, 0, self.n_leds - 1)
+        end = np.clip(positions + self.width // 2, 0, self.n_leds)
+        matrix = ((self.led_index >= start) & (self.led_index < end)).astype(float)
         matrix_rgb = self.colorize_matrix(matrix, color=colors[0])
         return matrix_rgb
@@ -4,7 +4,7 @@ import numpy as np
 from ravelights.core.color_handler import Color
 from ravelights.core.custom_typing import ArrayFloat
 from ravelights.core.generator_super import Pattern
-from ravelights.core.pid import PIDController
+from ravelights.core.pid import PIDBank
 from ravelights.core.time_handler import BeatStatePattern
 from ravelights.core.utils import lerp
 
@@ -19,7 +19,7 @@ class PatternPidSplash(Pattern):
         td = 0.5 * dt
         ti = min(8 * dt, tp)
         kp = 0.5 * tp / (td)
-        self.pid = PIDController(kp=kp, kd=td, ki=ti, dt=dt)
+        self.pid = PIDBank(n=1, kp=kp, kd=td, ki=ti, dt=dt)
         self.counter_frames = 0
 
     @property
@@ -41,10 +41,10 @@ class PatternPidSplash(Pattern):
         end_pos = self.n_leds - start_pos
         error = end_pos - start_pos
         start_vel = error * 0.075
-        self.pid._x = start_pos
-        self.pid._dx = start_vel
-        self.pid.target = end_pos
-        self.pid._previous_error = (error) * 1.5
+        self.pid._x[:] = start_pos
+        self.pid._dx[:] = start_vel
+        self.pid.target[:] = end_pos
+        self.pid._previous_error[:] = (error) * 1.5
 
     def render(self, colors: list[Color]) -> ArrayFloat:
         if self.counter_frames == 0:
@@ -55,14 +55,13 @@ class PatternPidSplash(Pattern):
             intensity = 1.0 - self.timehandler.beat_progress
         self.counter_frames += 1
         # dynamic kd
-        self.pid.kp = lerp(self.settings.global_energy, 0.1, 1.0)
-        self.pid.kd = lerp(self.settings.global_energy, 0.05, 0.15)
-        self.pid.perform_pid_step()
-        self.pid.perform_pid_step()
-        self.pid.perform_pid_step()
-        self.pid.perform_pid_step()
-        self.pid.perform_pid_step()
-        pos = int(self.pid.value)
+        self.pid.set_gains(
+            kp=lerp(self.settings.global_energy, 0.1, 1.0),
+            kd=lerp(self.settings.global_energy, 0.05, 0.15),
+        )
+        for _ in range(5):
+            self.pid.perform_pid_step()
+        pos = int(self.pid.value[0])
         start = np.clip(pos - self.width // 2, 0, self.n_leds - 1)
         end = np.clip(pos + self.width // 2, 0, self.n_leds - 1)
 
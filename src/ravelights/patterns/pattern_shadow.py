@@ -1,15 +1,55 @@
-import math
 import random
 
 import numpy as np
 from ravelights.core.color_handler import Color
 from ravelights.core.custom_typing import ArrayFloat
 from ravelights.core.generator_super import Pattern
-from ravelights.core.pid import PIDController
+from ravelights.core.pid import PIDBank
 from ravelights.core.time_handler import BeatStatePattern
 from ravelights.core.utils import lerp
 
 
+class ShadowProjector:
+    """
+    Projects the shadows of a row of gutter poles onto the lights. The light sources are located at
+    distance dist_light behind the gutter, the screen (the leds) is located at distance dist_screen in front of the
+    gutter, which has the thickness dist_gutter. All geometry that does not depend on the positions of the light
+    sources is precomputed, render() projects all light sources and poles at once.
+    """
+
+    def __init__(self, n_leds: int, grid_n: int, dist_light: float, dist_gutter: float, dist_screen: float):
+        self.n_leds = n_leds
+        gutter = np.linspace(0, n_leds - 1, grid_n)
+        self.pole_a = gutter[:-1]
+        self.pole_b = gutter[1:]
+        self.middle = (self.pole_a + self.pole_b) / 2
+        # tan(atan(x)) = x, the projection of each pole edge is linear in its distance to the light source.
+        # the factor depends on whether the light ray passes the near or the far edge of the gutter first
+        self.factor_near = (dist_screen + dist_gutter) / dist_light
+        self.factor_far = dist_screen / (dist_light + dist_gutter)
+
+    def render(self, positions: ArrayFloat) -> ArrayFloat:
+        """positions: shape (n_sources,), returns brightness in shape (n_leds, n_sources)"""
+        pos = positions[:, None]
+        delta_a = self.pole_a - pos
+        delta_b = self.pole_b - pos
+        projection_a = self.pole_a + delta_a * np.where(delta_a > 0, self.factor_near, self.factor_far)
+        projection_b = self.pole_b + delta_b * np.where(delta_b > 0, self.factor_far, self.factor_near)
+        start = np.rint(np.maximum(projection_a, 0.0)).astype(int)
+        end = np.minimum(np.rint(projection_b).astype(int) + 1, self.n_leds)
+        # a light source exactly at a pole middle would be infinitely bright, limit it to stay finite in cumsum
+        intensity = 1 / (np.maximum(np.abs(pos - self.middle), 1e-6) * 0.1)
+        valid = (end > 1) & (start < end)
+
+        # difference array: add intensity at start, subtract it at end, then integrate along the leds
+        n_sources = len(positions)
+        source_index = np.broadcast_to(np.arange(n_sources)[:, None], start.shape)
+        diff = np.zeros((self.n_leds + 1, n_sources))
+        np.add.at(diff, (start[valid], source_index[valid]), intensity[valid])
+        np.subtract.at(diff, (end[valid], source_index[valid]), intensity[valid])
+        return np.cumsum(diff[:-1], axis=0)
+
+
 class PatternShadow(Pattern):
     """pattern name: p_shadow"""
 
@@ -17,94 +57,61 @@ class PatternShadow(Pattern):
         self.p_add_dimmer = 0.5
         self.p_add_thinner = 0.5
 
-        self.pids = [PIDController(kp=0.5, kd=0.1, dt=self.timehandler.frame_time) for _ in range(self.n_lights)]
-        for pid in self.pids:
-            pid.load_parameter_preset("slow")
+        self.pids = PIDBank(n=self.n_lights, kp=0.5, kd=0.1, dt=self.timehandler.frame_time)
+        self.pids.load_parameter_preset("slow")
         self.width = 2
-        # self.pos = 0
         self.vel = 1
         self.dist_light = 0.7
         self.dist_gutter = 0.3
         self.dist_screen = 1.5
         self.grid_n = 30
-        self.gutter = np.linspace(0, self.n_leds - 1, self.grid_n)
+        self.projector = ShadowProjector(
+            n_leds=self.n_leds,
+            grid_n=self.grid_n,
+            dist_light=self.dist_light,
+            dist_gutter=self.dist_gutter,
+            dist_screen=self.dist_screen,
+        )
         self.max_dist = 50
 
         # ─── New ──────────────────────────────────────────────────────
 
         self.possible_triggers = [BeatStatePattern(loop_length=4)]
-        self.pos: list[float | int] = [0] * self.n_lights
-        self.speeds: list[float | int] = [0] * self.n_lights
+        self.pos: ArrayFloat = np.zeros(self.n_lights)
+        self.speeds: ArrayFloat = np.zeros(self.n_lights)
         self.bounds: int = 50
         self.on_trigger()
 
     def alternate(self):
         self.mode = random.choice([0, 1])
-        self.speeds = [random.uniform(-10, 10) for _ in range(self.n_lights)]
+        self.speeds = np.random.uniform(-10, 10, self.n_lights)
 
     def reset(self):
         ...
 
     def on_trigger(self):
-        for pid in self.pids:
-            pid.target = random.randrange(0, self.n_leds)
+        self.pids.target[:] = np.random.randint(0, self.n_leds, self.n_lights)
 
     def perform_pid_steps(self):
-        for pid in self.pids:
-            # dynamic kd
-            pid.kp = lerp(self.settings.global_energy, 0.1, 1.0)
-            pid.kd = lerp(self.settings.global_energy, 0.05, 0.15)
-            pid.perform_pid_step()
-
-    def render_shadow(self, pos: int | float):
-        matrix = np.zeros((self.n_leds,))
-
-        for index in range(self.grid_n - 1):
-            poleA = self.gutter[index]
-            poleB = self.gutter[index + 1]
-            middle = (poleB + poleA) / 2
-            dist: int | float = abs(pos - middle)
-
-            if pos < poleA:
-                alpha = math.atan((poleA - pos) / self.dist_light)
-                projection_A = poleA + math.tan(alpha) * (self.dist_screen + self.dist_gutter)
-            else:
-                alpha = math.atan((poleA - pos) / (self.dist_light + self.dist_gutter))
-                projection_A = poleA + math.tan(alpha) * self.dist_screen
-            projection_A = max(0, projection_A)
-
-            if pos < poleB:
-                beta = math.atan((poleB - pos) / (self.dist_light + self.dist_gutter))
-                projection_B = poleB + math.tan(beta) * self.dist_screen
-            else:
-                beta = math.atan((poleB - pos) / (self.dist_light))
-                projection_B = poleB + math.tan(beta) * (self.dist_screen + self.dist_gutter)
-
-            pax_int = int(round(projection_A))
-            pbx_int = int(round(projection_B))
-
-            if pbx_int > 0:
-                matrix[pax_int : pbx_int + 1] += 1 / (dist * 0.1)
-        return matrix
+        # dynamic kd
+        self.pids.set_gains(
+            kp=lerp(self.settings.global_energy, 0.1, 1.0),
+            kd=lerp(self.settings.global_energy, 0.05, 0.15),
+        )
+        self.pids.perform_pid_step()
 
     def render(self, colors: list[Color]) -> ArrayFloat:
         self.perform_pid_steps()
-        matrix = self.get_float_matrix_2d_mono()
-        for index in range(self.n_lights):
-            if self.mode == 0:
-                speed = self.speeds[index]
-            else:  # self.mode == 1
-                speed = self.pids[index].value * 0.1
-
-            self.pos[index] += speed
-            if self.pos[index] < -self.bounds:
-                self.pos[index] = self.pos[index] + self.n_leds + 2 * self.bounds
-            if self.pos[index] > self.n_leds + self.bounds:
-                self.pos[index] = self.pos[index] - self.n_leds - 2 * self.bounds
-
-            pos = int(round(self.pos[index]))
-            matrix[:, index] = self.render_shadow(pos)
+        if self.mode == 0:
+            speeds = self.speeds
+        else:  # self.mode == 1
+            speeds = self.pids.value * 0.1
+
+        self.pos += speeds
+        self.pos[self.pos < -self.bounds] += self.n_leds + 2 * self.bounds
+        self.pos[self.pos > self.n_leds + self.bounds] -= self.n_leds + 2 * self.bounds
 
+        matrix = self.projector.render(np.rint(self.pos))
         matrix = np.fmin(1.0, matrix)
         matrix_rgb = self.colorize_matrix(matrix, color=colors[0])
         return matrix_rgb
@@ -1,20 +1,17 @@
-import math
-
 import numpy as np
 from ravelights.core.color_handler import Color
 from ravelights.core.custom_typing import ArrayFloat
 from ravelights.core.generator_super import Pattern
+from ravelights.patterns.pattern_shadow import ShadowProjector
 
 
 class PatternShadowBig(Pattern):
-    """pattern name: p_shadow"""
+    """pattern name: p_shadow_big"""
 
     def init(self):
         self.p_add_dimmer = 0.0
         self.p_add_thinner = 0.0
 
-        self.width = 2
-
         self.pos = 0
         self.vel = 1
 
@@ -23,7 +20,16 @@ class PatternShadowBig(Pattern):
         self.dist_screen = 2
 
         self.grid_n = 20
-        self.gutter = np.linspace(0, self.n_leds - 1, self.grid_n)
+        self.projector = ShadowProjector(
+            n_leds=self.n_leds,
+            grid_n=self.grid_n,
+            dist_light=self.dist_light,
+            dist_gutter=self.dist_gutter,
+            dist_screen=self.dist_screen,
+        )
+        gutter = np.linspace(0, self.n_leds - 1, self.grid_n)
+        self.poles = np.zeros(self.n_leds)
+        self.poles[np.rint(gutter).astype(int)] = 0.2
 
         self.max_dist = 100
 
@@ -41,42 +47,8 @@ class PatternShadowBig(Pattern):
         if self.pos > self.n_leds + self.max_dist:
             self.pos = -self.max_dist
 
-        matrix = self.get_float_matrix_rgb()
-
-        for index in range(self.grid_n - 1):
-            poleA = self.gutter[index]
-            poleB = self.gutter[index + 1]
-            middle = (poleB + poleA) / 2
-            dist = abs(self.pos - middle)
-
-            if self.pos < poleA:
-                alpha = math.atan((poleA - self.pos) / self.dist_light)
-                projection_A = poleA + math.tan(alpha) * (self.dist_screen + self.dist_gutter)
-            else:
-                alpha = math.atan((poleA - self.pos) / (self.dist_light + self.dist_gutter))
-                projection_A = poleA + math.tan(alpha) * self.dist_screen
-            projection_A = max(0, projection_A)
-
-            if self.pos < poleB:
-                beta = math.atan((poleB - self.pos) / (self.dist_light + self.dist_gutter))
-                projection_B = poleB + math.tan(beta) * self.dist_screen
-            else:
-                beta = math.atan((poleB - self.pos) / (self.dist_light))
-                projection_B = poleB + math.tan(beta) * (self.dist_screen + self.dist_gutter)
-
-            pax_int = int(round(projection_A))
-            pbx_int = int(round(projection_B))
-            # green:
-            if pbx_int > 0:
-                matrix[pax_int : pbx_int + 1, 0, 1] += 1 / (dist * 0.1)
-            # blue:
-            matrix[int(round(poleA)), 1, 2] += 0.2
-            matrix[int(round(poleB)), 1, 2] += 0.2
-            # red, x:
-            matrix[self.pos : self.pos + self.width, 2, 0] = 1.0
-
-        matrix = np.fmin(1.0, matrix)
-        return matrix
-        # matrix_rgb = self.colorize_matrix(matrix, color=colors[0])
-        # matrix[start:end, :] = 1
-        # return matrix_rgb
+        # one light source for the whole device, the shadow is the same on all lights
+        shadow = np.fmin(1.0, self.projector.render(np.array([self.pos], dtype=float))[:, 0])
+        matrix_shadow = self.colorize_matrix(np.repeat(shadow[:, None], self.n_lights, axis=1), color=colors[0])
+        matrix_poles = self.colorize_matrix(np.repeat(self.poles[:, None], self.n_lights, axis=1), color=colors[1])
+        return np.fmin(1.0, matrix_shadow + matrix_poles)
@@ -14,7 +14,10 @@ class ThinnerEquidistant(Thinner):
             BeatStatePattern(beats=[0, 1], quarters="A", loop_length=4),
             BeatStatePattern(beats=[0, 2], quarters="A", loop_length=4),
         ]
-        self.mask = self.get_float_matrix_1d_mono(fill_value=1)
+        self.skip_led = np.arange(10)
+        self.brightness_fraction = 1.0 / (1 + self.skip_led)
+        self.mask = self.get_float_matrix_mask(fill_value=1)
+        self.out_matrix = self.get_float_matrix_rgb()
 
     def alternate(self):
         ...
@@ -25,16 +28,14 @@ class ThinnerEquidistant(Thinner):
     def on_trigger(self):
         if self.settings.global_thinning_ratio >= 1.0:
             return
-        self.mask[:] = 0
-
-        skip_led = list(range(10))
-        brightness_fraction = [1.0 / (1 + x) for x in skip_led]
+        mask_flat = self.mask.reshape(-1)
+        mask_flat[:] = 0
 
         bright_target = self.settings.global_thinning_ratio
         bright_target = 0.1
-        skip_selection = np.argmin([abs(bright - bright_target) for bright in brightness_fraction])
-        self.mask[:: skip_led[skip_selection]] = 1
+        skip_selection = np.argmin(np.abs(self.brightness_fraction - bright_target))
+        mask_flat[:: self.skip_led[skip_selection]] = 1
 
     def render(self, in_matrix: Array, colors: list[Color]) -> Array:
-        matrix = self.apply_mask(in_matrix=in_matrix, mask=self.mask.reshape(self.n_leds, -1))
+        matrix = self.apply_mask(in_matrix=in_matrix, mask=self.mask, out=self.out_matrix)
         return matrix
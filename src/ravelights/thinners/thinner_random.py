@@ -16,7 +16,8 @@ class ThinnerRandom(Thinner):
             BeatStatePattern(beats=[0, 1], quarters="A", loop_length=4),
             BeatStatePattern(beats=[0, 2], quarters="A", loop_length=4),
         ]
-        self.mask = self.get_float_matrix_1d_mono(fill_value=1)
+        self.mask = self.get_float_matrix_mask(fill_value=1)
+        self.out_matrix = self.get_float_matrix_rgb()
 
     def alternate(self):
         self.trigger = random.choice(self.possible_triggers)
@@ -28,10 +29,8 @@ class ThinnerRandom(Thinner):
         self.mask[:] = 1
         if self.settings.global_thinning_ratio >= 1.0:
             return
-        shape = self.mask.shape
-        random = np.random.random(size=shape)
-        self.mask = np.where(random < self.settings.global_thinning_ratio, 1, 0)
+        self.mask[np.random.random(size=self.mask.shape) >= self.settings.global_thinning_ratio] = 0
 
     def render(self, in_matrix: Array, colors: list[Color]):
-        matrix = self.apply_mask(in_matrix=in_matrix, mask=self.mask.reshape(self.n_leds, -1))
+        matrix = self.apply_mask(in_matrix=in_matrix, mask=self.mask, out=self.out_matrix)
         return matrix
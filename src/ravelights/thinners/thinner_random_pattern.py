@@ -1,5 +1,4 @@
-import random
-
+import numpy as np
 from ravelights.core.color_handler import Color
 from ravelights.core.custom_typing import Array
 from ravelights.core.generator_super import Thinner
@@ -15,7 +14,12 @@ class ThinnerRandomPattern(Thinner):
             BeatStatePattern(beats=[0, 1], quarters="A", loop_length=4),
             BeatStatePattern(beats=[0, 2], quarters="A", loop_length=4),
         ]
-        self.mask = self.get_float_matrix_1d_mono(fill_value=1)
+        self.pattern_length = 3
+        self.period = self.pattern_length * 10
+        # position of each pixel within the repeating pattern
+        self.pattern_index = np.arange(self.n) % self.period
+        self.mask = self.get_float_matrix_mask(fill_value=1)
+        self.out_matrix = self.get_float_matrix_rgb()
 
     def alternate(self):
         ...
@@ -25,15 +29,14 @@ class ThinnerRandomPattern(Thinner):
 
     def on_trigger(self):
         self.mask[:] = 1
-        pattern_length = 3
         if self.settings.global_thinning_ratio >= 1.0:
             return
-        n = pattern_length * 10 - int(pattern_length * self.settings.global_thinning_ratio)
-        assert 0 < n < pattern_length * 10
-        items = random.choices(range(pattern_length * 10), k=n)
-        for i in items:
-            self.mask[i :: pattern_length * 10] = 0
+        n = self.period - int(self.pattern_length * self.settings.global_thinning_ratio)
+        assert 0 < n < self.period
+        is_removed = np.zeros(self.period, dtype=bool)
+        is_removed[np.random.randint(self.period, size=n)] = True
+        self.mask.reshape(-1)[is_removed[self.pattern_index]] = 0
 
     def render(self, in_matrix: Array, colors: list[Color]):
-        matrix = self.apply_mask(in_matrix=in_matrix, mask=self.mask.reshape(self.n_leds, -1))
+        matrix = self.apply_mask(in_matrix=in_matrix, mask=self.mask, out=self.out_matrix)
         return matrix
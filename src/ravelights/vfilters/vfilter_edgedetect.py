@@ -2,6 +2,7 @@ import numpy as np
 from ravelights.core.color_handler import Color
 from ravelights.core.custom_typing import ArrayFloat
 from ravelights.core.generator_super import Vfilter
+from ravelights.core.shift_buffer import PaddedShiftBuffer
 
 
 class VfilterEdgedetect(Vfilter):
@@ -13,7 +14,8 @@ class VfilterEdgedetect(Vfilter):
             self.n_exp = 1
         if self.version == 2:
             self.n_exp = 2
-        self.expansion_matrix = np.zeros((self.n_leds, self.n_lights, 1 + (2 * self.n_exp)))
+        self.bw_buffer = PaddedShiftBuffer(shape=(self.n_leds, self.n_lights), max_shift=1)
+        self.diff_buffer = PaddedShiftBuffer(shape=(self.n_leds, self.n_lights), max_shift=max(1, self.n_exp))
         self.version = 1
 
     def alternate(self):
@@ -46,9 +48,8 @@ class VfilterEdgedetect(Vfilter):
         color = color / non_zero_divisor[..., None]
 
         # find edge
-        roll = np.roll(bw_matrix_mono, shift=1, axis=0)
-        roll[0] = 0  # does this work?
-        diff = np.abs(bw_matrix_mono - roll)
+        self.bw_buffer.load(bw_matrix_mono)
+        diff = np.abs(bw_matrix_mono - self.bw_buffer.shifted(1))
 
         if self.version == 0:
             # return self.colorize_matrix(diff, color)
@@ -56,18 +57,12 @@ class VfilterEdgedetect(Vfilter):
             # return diff[..., None] * color.reshape((self.n_leds, self.n_lights, 1))
             return diff[..., None] * color
 
-        # expand
-        self.expansion_matrix[..., 0] = diff
+        # expand: maximum of diff shifted by -n_exp ... n_exp, accumulated in place
+        self.diff_buffer.load(diff)
+        bw_out = diff
         for i in range(self.n_exp):
-            roll = np.roll(diff, shift=i + 1, axis=0)  # 1 2 3
-            roll[0] = 0
-            self.expansion_matrix[..., 2 * i + 1] = roll  # 1, 3, 5
-
-            roll = np.roll(diff, shift=-i - 1, axis=0)  # -1 -2 -3
-            roll[-1] = 0
-            self.expansion_matrix[..., 2 * i + 2] = roll  # 2, 4, 6
-
-        bw_out = np.max(self.expansion_matrix, axis=-1)
+            np.maximum(bw_out, self.diff_buffer.shifted(i + 1), out=bw_out)
+            np.maximum(bw_out, self.diff_buffer.shifted(-i - 1), out=bw_out)
 
         color = np.array(colors[0])[None, None, :]
         # return bw_out[..., None] * color.reshape((self.n_leds, self.n_lights, 3))
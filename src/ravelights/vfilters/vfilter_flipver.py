@@ -5,6 +5,8 @@ from ravelights.core.generator_super import Vfilter
 
 
 class VfilterFlipVer(Vfilter):
+    stateless = True
+
     def init(self):
         ...
 
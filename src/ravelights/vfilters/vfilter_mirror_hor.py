@@ -4,6 +4,8 @@ from ravelights.core.generator_super import Vfilter
 
 
 class VfilterMirrorHor(Vfilter):
+    stateless = True
+
     def init(self):
         ...
 
@@ -4,6 +4,7 @@ import numpy as np
 from ravelights.core.color_handler import Color
 from ravelights.core.custom_typing import ArrayFloat
 from ravelights.core.generator_super import Vfilter
+from ravelights.core.shift_buffer import CircularShiftBuffer
 
 
 class VfilterRgbShift(Vfilter):
@@ -11,6 +12,7 @@ class VfilterRgbShift(Vfilter):
         self.limit = 30
         self.order = [0, 1, 2]
         self.mode = 0
+        self.shift_buffer = CircularShiftBuffer(shape=(self.n_leds, self.n_lights))
 
     def alternate(self):
         if self.mode == 0:
@@ -37,13 +39,8 @@ class VfilterRgbShift(Vfilter):
             return in_matrix
         self.shift += self.shift_speed
         rolls = [0, self.shift, -self.shift]
-        in_matrix_bw = self.bw_matrix(in_matrix)
-        out_matrix_rgb = np.concatenate(
-            [
-                np.roll(in_matrix_bw, shift=rolls[self.order[0]], axis=0)[..., None],
-                np.roll(in_matrix_bw, shift=rolls[self.order[1]], axis=0)[..., None],
-                np.roll(in_matrix_bw, shift=rolls[self.order[2]], axis=0)[..., None],
-            ],
-            axis=-1,
-        )
+        self.shift_buffer.load(self.bw_matrix(in_matrix))
+        out_matrix_rgb = np.empty_like(in_matrix)
+        for channel in range(3):
+            out_matrix_rgb[..., channel] = self.shift_buffer.shifted(rolls[self.order[channel]])
         return out_matrix_rgb
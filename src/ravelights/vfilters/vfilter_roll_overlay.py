@@ -2,11 +2,13 @@ import numpy as np
 from ravelights.core.color_handler import Color
 from ravelights.core.custom_typing import ArrayFloat
 from ravelights.core.generator_super import Vfilter
+from ravelights.core.shift_buffer import CircularShiftBuffer
 
 
 class VfilterRollOverlay(Vfilter):
     def init(self):
         self.roll_speed = 1
+        self.shift_buffer = CircularShiftBuffer(shape=(self.n_leds, self.n_lights, 3))
 
     def alternate(self):
         ...
@@ -19,9 +21,10 @@ class VfilterRollOverlay(Vfilter):
 
     def render(self, in_matrix: ArrayFloat, colors: list[Color]) -> ArrayFloat:
         self.roll_amount += self.roll_speed
+        self.shift_buffer.load(in_matrix)
         out_matrix = in_matrix.copy()
-        out_matrix += np.roll(in_matrix, shift=self.roll_amount, axis=0)
-        out_matrix += np.roll(in_matrix, shift=-self.roll_amount, axis=0)
+        out_matrix += self.shift_buffer.shifted(self.roll_amount)
+        out_matrix += self.shift_buffer.shifted(-self.roll_amount)
 
         # normalization
         if np.max(out_matrix) > 1.0:
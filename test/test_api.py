@@ -49,3 +49,13 @@ def test_flask_endpoints_rest_effect(client):
     assert response.status_code == 200
     response_dict = json.loads(response.data)
     assert isinstance(response_dict[0], list)
+
+
+def test_flask_endpoints_rest_meta_etag(client):
+    response = client.get("/rest/meta", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    etag = response.headers["ETag"]
+    response = client.get("/rest/meta", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
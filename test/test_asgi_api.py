@@ -0,0 +1,47 @@
+import socket
+import time
+
+import pytest
+import requests
+from ravelights import RaveLightsApp
+
+pytest.importorskip("uvicorn")
+
+
+@pytest.fixture(scope="module")
+def asgi_app():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    app = RaveLightsApp(run=False, serve_webui=False, interface_backend="asgi", webui_port=port)
+    for _ in range(50):
+        if app.rest_api.loop is not None:
+            break
+        time.sleep(0.1)
+    yield app, f"http://127.0.0.1:{port}"
+    app.rest_api.server.should_exit = True
+
+
+def test_asgi_endpoints_rest(asgi_app):
+    _, base_url = asgi_app
+    for endpoint, key in [("settings", "bpm_base"), ("triggers", "dimmer"), ("meta", "available_generators")]:
+        response = requests.get(f"{base_url}/rest/{endpoint}")
+        assert response.status_code == 200
+        assert key in response.json()
+
+    response = requests.get(f"{base_url}/rest/devices")
+    assert "n_leds" in response.json()[0]
+
+    etag = requests.get(f"{base_url}/rest/meta").headers["ETag"]
+    response = requests.get(f"{base_url}/rest/meta", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_asgi_sse_receives_published_topic(asgi_app):
+    app, base_url = asgi_app
+    with requests.get(f"{base_url}/sse", stream=True, timeout=5) as response:
+        assert response.headers["content-type"] == "text/event-stream"
+        while app.rest_api.sse_broker.num_clients == 0:
+            time.sleep(0.01)
+        app.refresh_ui(sse_event="settings")
+        assert next(response.iter_lines()) == b"data: settings"
@@ -0,0 +1,39 @@
+import wave
+
+import numpy as np
+from ravelights.interface.audio.audio_source import WavFileAudioSource
+from ravelights.interface.audio.beat_tracker import BeatTracker
+
+SAMPLE_RATE = 22050
+
+
+def create_click_track(path, bpm: float, duration: float, first_beat: float) -> None:
+    samples = np.random.default_rng(0).normal(0, 0.01, int(SAMPLE_RATE * duration))
+    click = np.sin(2 * np.pi * 1000 * np.arange(400) / SAMPLE_RATE) * np.exp(-np.arange(400) / 80)
+    for beat_time in np.arange(first_beat, duration - 0.1, 60 / bpm):
+        index = int(beat_time * SAMPLE_RATE)
+        samples[index : index + len(click)] += click
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(1)
+        file.setsampwidth(2)
+        file.setframerate(SAMPLE_RATE)
+        file.writeframes((np.clip(samples, -1, 1) * 32767).astype("<i2").tobytes())
+
+
+def test_beat_tracker_click_track(tmp_path):
+    bpm, first_beat = 128.0, 0.3
+    path = tmp_path / "click.wav"
+    create_click_track(path, bpm=bpm, duration=10.0, first_beat=first_beat)
+
+    source = WavFileAudioSource(str(path), realtime=False)
+    beat_tracker = BeatTracker(root=None, source=source)
+    while (samples := source.read(2048)) is not None:
+        beat_tracker.process_samples(samples)
+    source.close()
+
+    estimate = beat_tracker.estimate
+    assert estimate is not None
+    assert abs(estimate.bpm - bpm) < 2.0
+    beat_time = 60 / bpm
+    phase_error = ((estimate.beat_time_stamp - first_beat) / beat_time + 0.5) % 1 - 0.5
+    assert abs(phase_error * beat_time) < 0.05
@@ -1,7 +1,7 @@
 import random
 
 from ravelights import RaveLightsApp
-from ravelights.core.time_handler import BeatStatePattern
+from ravelights.core.time_handler import BeatState, BeatStatePattern
 
 app = RaveLightsApp(run=False)
 timehandler = app.timehandler
@@ -34,3 +34,30 @@ def test_beat_matchings():
 
     assert beat_counter == BEAT_TARGET
     assert trigger_counter == TRIGGER_TARGET
+
+
+def test_trigger_mask_matches_beat_arrays():
+    queue_length = app.settings.queue_length
+    patterns = [
+        BeatStatePattern(),
+        BeatStatePattern(beats=[0, 3], quarters="AC", loop_length=8),
+        BeatStatePattern(beats=[0, 1], quarters="ABCD", loop_length=2),
+        BeatStatePattern(beats=[5], quarters="D", loop_length=16),
+    ]
+    for pattern in patterns:
+        for n_quarters_long in range(queue_length):
+            beat_state = BeatState(app, is_quarter=True, n_quarters_long=n_quarters_long)
+            current_beat, current_quarter = divmod(n_quarters_long % (pattern.loop_length * 4), 4)
+            expected = pattern.beats_array[current_beat] and pattern.quarters_array[current_quarter]
+            assert pattern.is_triggered(beat_state) == expected
+
+
+def test_trigger_cache_counts_once_per_frame():
+    pattern = BeatStatePattern(loop_length=1)
+    beat_state = BeatState(app, is_quarter=True, n_quarters_long=0)
+    for _ in range(5):
+        assert pattern.is_match(beat_state)
+    assert pattern.trigger_counter == 0
+
+    pattern.update_from_dict(dict(quarters="B"))
+    assert not pattern.is_match(beat_state)
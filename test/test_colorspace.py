@@ -0,0 +1,96 @@
+import colorsys
+
+import numpy as np
+from ravelights.core.color_handler import Color, ColorHandler
+from ravelights.core.colorspace import (
+    HUE_WHEEL_SIZE,
+    ColorTransform,
+    hls_to_rgb,
+    hsv_to_rgb,
+    hue_to_rgb,
+    rgb_to_hls,
+    rgb_to_hsv,
+)
+from ravelights.core.ravelights_app import RaveLightsApp
+
+
+def test_conversions_match_colorsys():
+    rgb = np.random.random(size=(200, 3))
+    rgb[:4] = [[0.0, 0.0, 0.0], [1.0, 1.0, 1.0], [0.5, 0.5, 0.5], [0.0, 1.0, 1.0]]
+
+    hsv = np.array([colorsys.rgb_to_hsv(*color) for color in rgb])
+    assert np.allclose(rgb_to_hsv(rgb), hsv)
+    assert np.allclose(hsv_to_rgb(hsv), rgb)
+
+    hls = np.array([colorsys.rgb_to_hls(*color) for color in rgb])
+    assert np.allclose(rgb_to_hls(rgb), hls)
+    assert np.allclose(hls_to_rgb(hls.reshape(20, 10, 3)), rgb.reshape(20, 10, 3))
+
+
+def test_hue_wheel():
+    hues = np.random.random(size=(50, 4))
+    expected = np.array([colorsys.hls_to_rgb(hue, 0.5, 1.0) for hue in hues.flat]).reshape(50, 4, 3)
+    assert np.abs(hue_to_rgb(hues) - expected).max() < 0.005
+    assert np.array_equal(hue_to_rgb(1.0 / 3.0), [0.0, 1.0, 0.0])
+    assert np.array_equal(hue_to_rgb(-0.5), hue_to_rgb(0.5))
+    assert np.allclose(ColorHandler.get_color_from_hue(0.3), colorsys.hls_to_rgb(0.3, 0.5, 1.0), atol=0.005)
+
+
+def test_hue_wheel_error():
+    hues = np.linspace(-1.0, 2.0, 30001)
+    expected = np.array([colorsys.hls_to_rgb(hue % 1.0, 0.5, 1.0) for hue in hues])
+    # the nearest of HUE_WHEEL_SIZE hues is off by at most half a step, the channels change by 6 per unit of hue
+    max_error = 6 * 0.5 / HUE_WHEEL_SIZE + 1e-9
+    assert np.abs(hue_to_rgb(hues) - expected).max() <= max_error
+    colors = np.array([ColorHandler.get_color_from_hue(hue) for hue in hues])
+    assert np.abs(colors - expected).max() <= max_error
+    exact_colors = np.array([ColorHandler.get_color_from_hue(hue, exact=True) for hue in hues])
+    assert np.allclose(exact_colors, expected)
+
+
+def test_color_transform():
+    rgb = np.random.random(size=(50, 4, 3))
+    transform = ColorTransform(hue_shift=1.25, saturation=0.5, gamma=2.0, channel_mix=np.eye(3)[[2, 0, 1]])
+    expected = []
+    for color in rgb.reshape(-1, 3):
+        hue, saturation, value = colorsys.rgb_to_hsv(*color)
+        red, green, blue = np.power(colorsys.hsv_to_rgb((hue + 0.25) % 1, saturation * 0.5, value), 2.0)
+        expected.append([blue, red, green])
+    assert np.allclose(transform.apply(rgb), np.reshape(expected, rgb.shape))
+
+    out = np.zeros_like(rgb)
+    assert ColorTransform().apply(rgb, out=out) is out
+    assert np.array_equal(out, rgb)
+
+
+def test_color_overrides():
+    app = RaveLightsApp(run=False, interface_backend=None)
+    color_engine = app.settings.color_engine
+    pid_colors = [color_engine.get_color_rgb(color_key) for color_key in "ABC"]
+
+    color_engine.set_color_override("A", Color(0.0, 0.0, 1.0))
+    color_engine.set_color_override("C", Color(1.0, 1.0, 0.0))
+    assert [color_engine.get_color_rgb(color_key) for color_key in "ABC"] == [(0, 0, 1), pid_colors[1], (1, 1, 0)]
+
+    color_engine.clear_color_overrides("A")
+    assert color_engine.get_color_rgb("A") == pid_colors[0]
+
+    color_engine.before()
+    assert color_engine.get_color_rgb("C") != (1, 1, 0)
+
+
+def test_colors_are_resolved_once_per_frame():
+    app = RaveLightsApp(run=False, interface_backend=None)
+    color_engine = app.settings.color_engine
+    color_engine.set_color_with_rule(Color(0.0, 1.0, 0.0), color_key="A")
+
+    color_engine.before()
+    colors = color_engine.get_colors_rgb(timeline_level=1)
+    assert color_engine.get_colors_rgb(timeline_level=1) is colors
+    color_engine.set_color_override("A", Color(1.0, 1.0, 1.0))
+    assert color_engine.get_colors_rgb(timeline_level=1) is not colors
+
+    for _ in range(200):
+        color_engine.before()
+    assert np.allclose(color_engine.get_color_rgb("A"), (0.0, 1.0, 0.0), atol=0.01)
+    assert color_engine.get_colors_rgb_target()["A"] == (0.0, 1.0, 0.0)
@@ -0,0 +1,40 @@
+from ravelights.core.command_queue import CommandQueue
+
+
+def test_commands_are_applied_in_order_and_coalesced():
+    queue = CommandQueue()
+    queue.push(dict(action="set_generator", gen_name="p_rain"))
+    for value in [0.1, 0.2, 0.3]:
+        queue.push(dict(action="set_settings", global_brightness=value))
+    queue.push(dict(action="set_settings", global_energy=0.5))
+    queue.push(dict(action="set_sync"))
+    queue.push(dict(action="set_sync"))
+
+    applied: list[dict] = []
+    queue.apply(applied.append)
+
+    assert applied == [
+        dict(action="set_generator", gen_name="p_rain"),
+        dict(action="set_settings", global_brightness=0.3),
+        dict(action="set_settings", global_energy=0.5),
+        dict(action="set_sync"),
+        dict(action="set_sync"),
+    ]
+    assert queue.metrics.coalesced == 2
+    assert len(queue) == 0
+
+
+def test_apply_time_is_limited_and_capacity_is_bounded():
+    queue = CommandQueue(capacity=10, max_apply_time=0.0)
+    for i in range(20):
+        queue.push(dict(action="set_sync", index=i))
+    assert queue.metrics.dropped == 10
+
+    applied: list[dict] = []
+    queue.apply(applied.append)
+    assert len(applied) == 1
+    assert len(queue) == 9
+
+    queue.max_apply_time = 1.0
+    queue.apply(applied.append)
+    assert [command["index"] for command in applied] == list(range(10))
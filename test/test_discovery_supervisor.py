@@ -0,0 +1,28 @@
+from ravelights.interface.discovery.discovery_supervisor import DiscoverySupervisor
+
+
+def test_failed_jobs_are_retried_until_done():
+    supervisor = DiscoverySupervisor(min_backoff=0.0)
+    results = [False, False, True]
+    calls: list[int] = []
+
+    def job() -> bool:
+        calls.append(1)
+        return results[len(calls) - 1]
+
+    supervisor.submit(job=job, description="test job")
+    for _ in range(5):
+        supervisor.run_jobs()
+
+    assert len(calls) == 3
+    assert supervisor._pending == []
+
+
+def test_failed_jobs_back_off():
+    supervisor = DiscoverySupervisor(min_backoff=10.0)
+    supervisor.submit(job=lambda: False, description="test job")
+    supervisor.run_jobs()
+    supervisor.run_jobs()
+
+    assert supervisor._pending[0].attempts == 1
+    assert 0.0 < supervisor.get_timeout() <= 5.0
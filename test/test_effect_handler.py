@@ -0,0 +1,61 @@
+import random
+
+import numpy as np
+import pytest
+from ravelights.core.generator_super import Generator
+from ravelights.core.ravelights_app import RaveLightsApp
+
+EFFECT_KWARGS = dict(
+    mode="frames",
+    multi=1,
+    limit_frames="inf",
+    limit_quarters="inf",
+    limit_loopquarters=16,
+    loop_length_beats=1,
+    limit_quarters_loop="inf",
+    quarters_pattern=["0A"],
+)
+
+
+def render_effect_queue(app: RaveLightsApp, matrix, colors, device_id: int):
+    """effects rendered by walking the effective effect queue, as before the render plan"""
+    in_matrix = matrix.copy()
+    for effect_wrapper in app.effecthandler.effective_effect_queue:
+        out_matrix = effect_wrapper.render(in_matrix=matrix, colors=colors, device_id=device_id)
+        if effect_wrapper.draw_mode == "overlay":
+            matrix = Generator.merge_matrices(matrix, out_matrix)
+        elif effect_wrapper.draw_mode == "normal":
+            matrix = out_matrix
+    if app.settings.global_effect_draw_mode == "overlay":
+        matrix = Generator.merge_matrices(in_matrix, matrix)
+    return matrix
+
+
+@pytest.mark.parametrize("global_effect_draw_mode", ["normal", "overlay"])
+def test_render_plan_is_equivalent_to_effect_queue(global_effect_draw_mode: str):
+    app = RaveLightsApp(run=False, interface_backend=None)
+    app.settings.global_effect_draw_mode = global_effect_draw_mode
+    effects = [
+        ("e_flicker", "normal", ["L1", 0]),
+        ("ev_mirror_ver", "overlay", ["L1", 0]),
+        ("e_color_strobe", "normal", ["L1", 0]),
+        ("ev_flip_ver", "normal", ["L2", 1]),  # inactive in the first frame
+        ("ev_bw", "overlay", ["L1", 0]),
+    ]
+    for effect_name, draw_mode, frames_pattern in effects:
+        app.settings.effect_draw_mode = draw_mode
+        app.effecthandler.load_effect(effect_name, timeline_level=0, frames_pattern=frames_pattern, **EFFECT_KWARGS)
+
+    rendermodule = app.devices[0].rendermodule
+    colors = app.settings.color_engine.get_colors_rgb(timeline_level=1)
+    for _ in range(4):
+        app.effecthandler.run_before()
+        assert len(app.effecthandler.render_plan) < len(app.effecthandler.effective_effect_queue)
+        matrix = np.random.random(size=(100, 2, 3))
+
+        random.seed(0)
+        expected = render_effect_queue(app, matrix * 0.5, colors=colors, device_id=0)
+        random.seed(0)
+        out_matrix, gain = rendermodule.render_effects(matrix, gain=0.5, colors=colors)
+        assert np.allclose(out_matrix * gain, expected)
+        app.effecthandler.run_after()
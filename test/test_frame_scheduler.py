@@ -0,0 +1,66 @@
+from ravelights.core.frame_scheduler import FrameDropPolicies, FrameScheduler
+
+
+class FakeClock:
+    """clock that advances a little on every read and oversleeps by a fixed amount"""
+
+    def __init__(self, oversleep: float = 0.002):
+        self.now = 0.0
+        self.oversleep = oversleep
+
+    def get_current_time(self) -> float:
+        self.now += 0.00001
+        return self.now
+
+    def sleep(self, duration: float) -> None:
+        self.now += duration + self.oversleep
+
+
+def test_deadlines_do_not_drift():
+    clock = FakeClock()
+    scheduler = FrameScheduler(get_current_time=clock.get_current_time, sleep=clock.sleep)
+    frame_time = 1 / 100
+    scheduler.wait_for_next_frame(frame_time)
+    start = clock.now
+    for _ in range(100):
+        clock.now += 0.003  # render time
+        scheduler.wait_for_next_frame(frame_time)
+    assert abs(clock.now - start - 100 * frame_time) < 0.001
+    assert scheduler.delayed_frame_counter == 0
+    assert scheduler.jitter_histogram.max < 0.001
+
+
+def test_skip_policy_drops_missed_frames():
+    clock = FakeClock(oversleep=0.0)
+    scheduler = FrameScheduler(
+        policy=FrameDropPolicies.SKIP.value, get_current_time=clock.get_current_time, sleep=clock.sleep
+    )
+    frame_time = 1 / 20
+    scheduler.wait_for_next_frame(frame_time)
+    clock.now += 3.5 * frame_time  # very long render time
+    assert scheduler.wait_for_next_frame(frame_time) == 0.0
+    assert scheduler.delayed_frame_counter == 1
+    assert scheduler.dropped_frame_counter == 2
+
+    # next frame is back on the original grid
+    scheduler.wait_for_next_frame(frame_time)
+    assert scheduler.delayed_frame_counter == 1
+
+
+def test_busy_wait_is_capped():
+    clock = FakeClock(oversleep=0.005)
+    busy_wait_times: list[float] = []
+
+    def sleep(duration: float) -> None:
+        # time that is left for the busy wait after the coarse sleep, without oversleep
+        busy_wait_times.append(scheduler._deadline - clock.now - duration)
+        clock.sleep(duration)
+
+    scheduler = FrameScheduler(get_current_time=clock.get_current_time, sleep=sleep, spin_time=0.0005)
+    frame_time = 1 / 20
+    for _ in range(20):
+        clock.now += 0.01  # render time
+        scheduler.wait_for_next_frame(frame_time)
+    assert scheduler.oversleep_estimate > 0.004
+    # the coarse sleep leaves at most max_oversleep_margin + spin_time for the busy wait
+    assert max(busy_wait_times) < scheduler.max_oversleep_margin + scheduler.spin_time + 0.0001
@@ -0,0 +1,48 @@
+from ravelights.core.idle_tasks import IdleTaskScheduler
+from ravelights.core.ravelights_app import RaveLightsApp
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def get_current_time(self) -> float:
+        return self.now
+
+
+def test_tasks_run_within_deadline():
+    clock = FakeClock()
+    scheduler = IdleTaskScheduler(get_current_time=clock.get_current_time)
+
+    def work(duration: float):
+        def callback(deadline: float):
+            clock.now += duration
+
+        return callback
+
+    scheduler.register("slow", work(0.004))
+    scheduler.register("fast", work(0.0001))
+    scheduler.register("once", work(0.0001), repeat=False)
+    scheduler.register("overdue", work(0.0001), max_delay_frames=2)
+    assert scheduler.run(deadline=1.0) == ["slow", "fast", "once", "overdue"]
+    assert [task.name for task in scheduler.tasks] == ["slow", "fast", "overdue"]
+
+    # the measured run time of slow does not fit anymore, the others are run in the remaining slack
+    assert scheduler.run(deadline=clock.now + 0.001) == ["fast", "overdue"]
+    assert scheduler.run(deadline=clock.now) == []
+    assert scheduler.run(deadline=clock.now) == []
+    assert scheduler.run(deadline=clock.now) == ["overdue"]
+
+
+def test_stale_snapshots_are_built_in_idle_time():
+    app = RaveLightsApp(run=False, interface_backend=None)
+    section = app.snapshots.sections["settings"]
+    app.timehandler.idle_tasks.run(deadline=float("inf"))
+    assert not section.is_stale  # never requested
+
+    snapshot = section.get()
+    section.invalidate()
+    assert section.is_stale
+    app.timehandler.idle_tasks.run(deadline=float("inf"))
+    assert not section.is_stale
+    assert section.get() is not snapshot
@@ -0,0 +1,7 @@
+from ravelights.devtools.import_time import find_deferred_modules, measure_import_time
+
+
+def test_import_does_not_load_interface_and_generators():
+    report = measure_import_time("ravelights")
+    assert report.total_ms > 0
+    assert find_deferred_modules(report.loaded_modules) == []
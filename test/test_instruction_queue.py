@@ -0,0 +1,64 @@
+from typing import cast
+
+from ravelights.core.device_shared import DeviceLightConfig
+from ravelights.core.instruction import Instruction, InstructionDevice
+from ravelights.core.instruction_queue import InstructionTable
+from ravelights.core.ravelights_app import RaveLightsApp
+from ravelights.core.time_handler import BeatState
+
+
+def test_instruction_table():
+    a, b, c = Instruction(), Instruction(), Instruction()
+    table = InstructionTable([[a], [], [b, c], []])
+    assert table.at_quarter == ((a,), (), (b, c), ())
+    assert table.till_quarter == ((a,), (a,), (a, b, c), (a, b, c))
+
+
+def test_timeline_tables_are_shared_and_reused():
+    device_config = [DeviceLightConfig(n_lights=2, n_leds=50), DeviceLightConfig(n_lights=3, n_leds=40)]
+    app = RaveLightsApp(run=False, interface_backend=None, device_config=device_config)
+    scheduler = app.patternscheduler
+    timeline = scheduler.blueprint_timelines[1]  # level 1 at quarter 16 * x, level 2 at quarter 16 * x + 12
+
+    scheduler.load_timeline(timeline)
+    device_table, _ = scheduler.get_instruction_tables(timeline)
+    assert [cast(InstructionDevice, ins).level for ins in device_table.at_quarter[0]] == [1]
+    assert [cast(InstructionDevice, ins).level for ins in device_table.at_quarter[12]] == [2]
+
+    scheduler.load_timeline(scheduler.blueprint_timelines[2])
+    scheduler.load_timeline(timeline)
+    assert scheduler.get_instruction_tables(timeline)[0] is device_table
+    for device in app.devices:
+        assert device.instructionhandler.instruction_queue.get_instructions() == device_table.till_quarter[0]
+
+
+def test_placements_follow_the_loaded_timeline():
+    app = RaveLightsApp(run=False, interface_backend=None)
+    scheduler = app.patternscheduler
+    timeline_a, timeline_b = scheduler.blueprint_timelines[1], scheduler.blueprint_timelines[2]
+
+    def get_placements(timeline) -> list[tuple[int, list[int]]]:
+        return [(blueprint.args["level"], blueprint.args["timings"]) for blueprint in timeline["placements"]]
+
+    for timeline in [timeline_a, timeline_b, timeline_a]:
+        scheduler.load_timeline(timeline)
+        placements = [(placement.level, placement.timings) for placement in scheduler.timeline_placements]
+        assert placements == get_placements(timeline)
+    assert get_placements(timeline_a) != get_placements(timeline_b)
+    assert timeline_a["meta"]["name"] in scheduler.compiled_timelines  # the second load of a was a cache hit
+
+
+def test_upcoming_generators_are_prewarmed():
+    device_config = [DeviceLightConfig(n_lights=2, n_leds=50), DeviceLightConfig(n_lights=3, n_leds=40)]
+    app = RaveLightsApp(run=False, interface_backend=None, device_config=device_config)
+    scheduler, timehandler = app.patternscheduler, app.timehandler
+    scheduler.load_timeline(scheduler.blueprint_timelines[1])
+    timehandler.beat_state_cache = BeatState(app, n_quarters_long=10)
+    timehandler.time_0_cache = timehandler.time_0
+    assert scheduler.get_upcoming_levels() == {2}
+
+    app.settings.selected["pattern"][2] = "p_swiper"
+    scheduler.prewarm_generators(deadline=timehandler.get_current_time())
+    assert not any(device.rendermodule.generators_dict.is_created("p_swiper") for device in app.devices)
+    scheduler.prewarm_generators(deadline=float("inf"))
+    assert all(device.rendermodule.generators_dict.is_created("p_swiper") for device in app.devices)
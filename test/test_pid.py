@@ -0,0 +1,20 @@
+import numpy as np
+from ravelights.core.pid import PIDBank, PIDController, PIDSpeeds
+
+
+def test_pid_bank_matches_pid_controller():
+    start_values = [0.0, 10.0, 50.0]
+    targets = [100.0, 0.0, 50.0]
+    controllers = [PIDController(start_val=val, kp=0.5, kd=0.1) for val in start_values]
+    bank = PIDBank(n=3, start_val=np.array(start_values), kp=0.5, kd=0.1)
+    for controller, target in zip(controllers, targets):
+        controller.load_parameter_preset(PIDSpeeds.MEDIUM.value)
+        controller.target = target
+    bank.load_parameter_preset(PIDSpeeds.MEDIUM.value)
+    bank.target[:] = targets
+
+    for _ in range(100):
+        for controller in controllers:
+            controller.perform_pid_step()
+        bank.perform_pid_step()
+        assert np.allclose(bank.value, [controller.value for controller in controllers])
@@ -0,0 +1,24 @@
+import numpy as np
+from ravelights.core.pixel_matrix import PixelMatrix
+from ravelights.interface.color_remap import ColorProfiles, ColorProfilesLuts, ws2815_color_mapping
+
+
+def test_gain_and_brightness_are_applied_in_one_conversion():
+    pixelmatrix = PixelMatrix(n_leds=50, n_lights=4, is_prim=True)
+    matrix = np.random.random(size=(50, 4, 3))
+    pixelmatrix.set_matrix_float(matrix, gain=0.5)
+
+    expected = (matrix * 0.5 * 0.8 * 255).astype(np.uint8)
+    assert np.abs(pixelmatrix.get_matrix_int(brightness=0.8).astype(int) - expected).max() <= 1
+    assert np.allclose(pixelmatrix.get_matrix_float(), matrix * 0.5)
+
+
+def test_color_profile_lut():
+    pixelmatrix = PixelMatrix(n_leds=50, n_lights=4, is_prim=True)
+    matrix = np.random.random(size=(50, 4, 3))
+    pixelmatrix.set_matrix_float(matrix, gain=0.5)
+
+    lut = ColorProfilesLuts[ColorProfiles.WS2815]
+    assert lut is not None
+    expected = ws2815_color_mapping(matrix * 0.5)
+    assert np.abs(pixelmatrix.get_matrix_int(lut=lut) - expected).max() <= 2
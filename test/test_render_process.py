@@ -0,0 +1,88 @@
+import json
+import queue
+import time
+
+import numpy as np
+from ravelights import DeviceLightConfig
+from ravelights.core.ravelights_app import RaveLightsApp
+from ravelights.core.render_process import RaveLightsMultiProcessApp, StatePublisher
+from ravelights.core.shared_frames import SharedFrameRing
+
+
+def test_shared_frame_ring_round_trip():
+    shapes = [(4, 2, 3), (3, 1, 3)]
+    ring = SharedFrameRing.create(shapes=shapes, n_slots=3)
+    reader = SharedFrameRing.attach(ring.name, shapes=shapes, n_slots=3)
+    assert reader.read() == (0, None)
+
+    for value in range(1, 5):
+        matrices_processed_int = [np.full(shape, value, dtype=np.uint8) for shape in shapes]
+        matrices_int = [np.full(shape, 2 * value, dtype=np.uint8) for shape in shapes]
+        ring.write(matrices_processed_int, matrices_int)
+
+    sequence, frames = reader.wait_for_frame(last_sequence=0, timeout=0.0)
+    assert sequence == 4 and frames is not None
+    assert all(np.all(matrix == 4) for matrix in frames[0])
+    assert all(np.all(matrix == 8) for matrix in frames[1])
+    assert reader.is_valid(3) and not reader.is_valid(2)
+    assert reader.wait_for_frame(last_sequence=4, timeout=0.0) == (4, None)
+    reader.close()
+    ring.close()
+
+
+def test_frames_overwritten_by_the_writer_are_not_copied():
+    shapes = [(4, 2, 3)]
+    ring = SharedFrameRing.create(shapes=shapes, n_slots=3)
+    reader = SharedFrameRing.attach(ring.name, shapes=shapes, n_slots=3)
+    out = reader.create_frame_buffer()
+
+    ring.write([np.full(shapes[0], 1, dtype=np.uint8)], [np.full(shapes[0], 2, dtype=np.uint8)])
+    sequence, _ = reader.read()
+    assert reader.copy_frame(sequence, out=out)
+    assert np.all(out[0][0] == 1) and np.all(out[1][0] == 2)
+
+    # the writer laps the reader, the slot of the frame may be written while it is copied
+    for value in range(3, 5):
+        ring.write([np.full(shapes[0], value, dtype=np.uint8)], [np.full(shapes[0], value, dtype=np.uint8)])
+    assert not reader.copy_frame(sequence, out=out)
+    reader.close()
+    ring.close()
+
+
+def test_state_publisher_survives_errors(monkeypatch):
+    app = RaveLightsApp(run=False, interface_backend=None)
+    state_queue: queue.Queue[tuple] = queue.Queue()
+    state_publisher = StatePublisher(root=app, state_queue=state_queue)  # type: ignore[arg-type]
+
+    def get_devices_data(root):
+        raise RuntimeError("dictionary changed size during iteration")
+
+    monkeypatch.setattr("ravelights.interface.interface_backend.get_devices_data", get_devices_data)
+    state_publisher.forward("settings")
+    monkeypatch.undo()
+    state_publisher.forward("settings")
+    messages = [state_queue.get_nowait() for _ in range(state_queue.qsize())]
+    assert ("sse", "settings") in messages and messages[0][0] == "snapshot"
+
+
+def test_multiprocess_app_forwards_commands_and_frames():
+    app = RaveLightsMultiProcessApp(
+        interface_backend=None, device_config=[DeviceLightConfig(n_lights=2, n_leds=10)], run=False
+    )
+    try:
+        assert app.devices[0].n_leds == 10
+        app.eventhandler.add_to_modification_queue(dict(action="set_settings", global_brightness=0.5))
+        for _ in range(100):
+            if json.loads(app.snapshots.get("settings").body)["global_brightness"] == 0.5:
+                break
+            time.sleep(0.05)
+        assert json.loads(app.snapshots.get("settings").body)["global_brightness"] == 0.5
+
+        sequence, frames = app.frames.wait_for_frame(last_sequence=0, timeout=5.0)
+        assert sequence > 0 and frames is not None
+        assert frames[0][0].shape == (10, 2, 3)
+        assert app.transmit_frame(sequence) and app.torn_frame_counter == 0
+        assert app.frame_buffer[0][0].shape == (10, 2, 3)
+    finally:
+        app.stop()
+    assert not app.render_process.is_alive()
@@ -1,6 +1,8 @@
 import random
 
+import numpy as np
 from loguru import logger
+from ravelights.core.device_shared import DeviceLightConfig
 from ravelights.core.ravelights_app import RaveLightsApp
 from ravelights.core.time_handler import BeatStatePattern
 
@@ -33,7 +35,7 @@ def test_all_patterns():
     # get all generator names
     gen_names = []
     gen_types = []
-    for i, (key, lis) in enumerate(app.metahandler.api_content["available_generators"].items()):
+    for i, (key, lis) in enumerate(app.metahandler["available_generators"].items()):
         if i == 4:
             break
         for dictionary in lis:
@@ -56,3 +58,28 @@ def test_all_patterns():
         app.render_frame()
     logger.info(f"tested {counter_frame} frames")
     logger.info(f"tested {counter_generators} generators")
+
+
+def test_generators_are_created_lazily():
+    app = RaveLightsApp(run=False, device_config=[DeviceLightConfig(n_lights=2, n_leds=50) for _ in range(2)])
+    generators_dicts = [device.rendermodule.generators_dict for device in app.devices]
+    assert "p_debug_gradient" in generators_dicts[0]
+    assert not generators_dicts[0].is_created("p_debug_gradient")
+    assert generators_dicts[0]["p_debug_gradient"] is not generators_dicts[1]["p_debug_gradient"]
+    assert generators_dicts[0]["v_none"] is generators_dicts[1]["v_none"]
+
+
+def test_masks_broadcast_over_color_channels():
+    app = RaveLightsApp(run=False, device_config=[DeviceLightConfig(n_lights=3, n_leds=40)])
+    app.settings.global_thinning_ratio = 0.5
+    generators_dict = app.devices[0].rendermodule.generators_dict
+    in_matrix = np.random.random(size=(40, 3, 3))
+    for name in ["t_equidistant", "t_random", "t_random_pattern", "d_random_remove"]:
+        generator = generators_dict[name]
+        generator.on_trigger()
+        out_matrix = generator.render(in_matrix.copy(), colors=[])
+        mask = generator.mask
+        assert mask.shape == (40, 3, 1)
+        assert 0 < np.count_nonzero(mask) < mask.size
+        intensity = getattr(generator, "intensity", 1.0)
+        assert np.allclose(out_matrix, intensity * in_matrix * np.repeat(mask, 3, axis=2))
@@ -0,0 +1,23 @@
+import numpy as np
+from ravelights.core.shift_buffer import CircularShiftBuffer, PaddedShiftBuffer
+
+
+def test_circular_shift_buffer_matches_roll():
+    matrix = np.random.rand(20, 3, 3)
+    buffer = CircularShiftBuffer(shape=matrix.shape)
+    buffer.load(matrix)
+    for shift in (-45, -20, -1, 0, 1, 7, 19, 20, 33):
+        assert np.array_equal(buffer.shifted(shift), np.roll(matrix, shift=shift, axis=0))
+
+
+def test_padded_shift_buffer_fills_zeros():
+    matrix = np.random.rand(20, 3)
+    buffer = PaddedShiftBuffer(shape=matrix.shape, max_shift=3)
+    buffer.load(matrix)
+    for shift in range(-3, 4):
+        expected = np.roll(matrix, shift=shift, axis=0)
+        if shift > 0:
+            expected[:shift] = 0
+        elif shift < 0:
+            expected[shift:] = 0
+        assert np.array_equal(buffer.shifted(shift), expected)
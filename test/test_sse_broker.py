@@ -0,0 +1,47 @@
+import asyncio
+
+from ravelights.interface.sse_broker import AsyncSseClient, SseBroker
+
+
+def test_topics_are_coalesced_per_window_and_sent_to_all_clients():
+    broker = SseBroker(max_queue_size=4)
+    clients = [broker.subscribe(), broker.subscribe()]
+    for topic in ["color", "settings", "color", "color"]:
+        broker.publish(topic)
+
+    assert broker.dispatch() == ["color", "settings"]
+    for client in clients:
+        assert client.get(timeout=0.0) == "color"
+        assert client.get(timeout=0.0) == "settings"
+        assert client.get(timeout=0.0) is None
+
+
+def test_slow_clients_drop_oldest_topics():
+    broker = SseBroker(max_queue_size=2)
+    client = broker.subscribe()
+    for topic in ["a", "b", "c"]:
+        broker.publish(topic)
+        broker.dispatch()
+
+    assert client.dropped == 1
+    assert [client.get(timeout=0.0), client.get(timeout=0.0)] == ["b", "c"]
+
+
+def test_stream_unsubscribes_on_close():
+    broker = SseBroker(keepalive_interval=0.0)
+    stream = broker.stream()
+    assert next(stream) == ": keepalive\n\n"
+    assert broker.num_clients == 1
+    stream.close()
+    assert broker.num_clients == 0
+
+
+def test_async_clients_receive_topics_in_the_event_loop():
+    async def receive() -> list[str]:
+        broker = SseBroker()
+        client = broker.subscribe(AsyncSseClient(max_queue_size=4, loop=asyncio.get_running_loop()))
+        broker.publish("color")
+        broker.dispatch()
+        return [await asyncio.wait_for(client.async_queue.get(), timeout=1.0)]
+
+    assert asyncio.run(receive()) == ["color"]
@@ -0,0 +1,38 @@
+from collections import Counter
+
+from ravelights.core.ravelights_app import RaveLightsApp
+from ravelights.core.template_objects import GeneratorIndex
+
+
+def get_generator(name: str, keywords: list[str], weight: float) -> dict:
+    return {"generator_name": name, "generator_keywords": keywords, "generator_weight": weight}
+
+
+def test_generator_index():
+    available_generators = {
+        "pattern": [
+            get_generator("p_a", ["strobe", "techno"], 1.0),
+            get_generator("p_b", ["strobe"], 3.0),
+            get_generator("p_c", ["strobe", "techno"], 0.0),
+            get_generator("p_d", ["ambient"], 1.0),
+        ]
+    }
+    index = GeneratorIndex(available_generators)  # type: ignore
+    assert index.get_names_and_cum_weights("pattern", ["strobe"]) == (["p_a", "p_b"], [1.0, 4.0])
+
+    # music style is dropped if no generator matches, then the keywords
+    assert index.get_random_generator("pattern", ["strobe"], music_style="techno") == "p_a"
+    assert index.get_random_generator("pattern", ["ambient"], music_style="techno") == "p_d"
+    names = Counter(index.get_random_generator("pattern", ["unknown"], music_style="techno") for _ in range(600))
+    assert set(names) == {"p_a", "p_b", "p_d"}
+    assert names["p_b"] > names["p_a"]
+
+
+def test_generator_index_is_rebuilt_with_available_generators():
+    app = RaveLightsApp(run=False, interface_backend=None)
+    generator_index = app.metahandler.generator_index
+    assert app.metahandler.generator_index is generator_index
+
+    app.metahandler["available_generators"] = {"pattern": [get_generator("p_only", [], 1.0)]}
+    assert app.metahandler.generator_index is not generator_index
+    assert app.metahandler.generator_index.get_random_generator("pattern", [], music_style="techno") == "p_only"
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("pygame")
+
+from ravelights.interface.visualizer import (  # noqa: E402
+    CELLWIDTH,
+    GUISCALE,
+    SCREENHEIGHT,
+    SCREENWIDTH,
+    get_light_coordinates,
+)
+
+N_LEDS = 144
+
+
+def get_extent(pixels: np.ndarray) -> int:
+    return int(pixels.max() - pixels.min() + 1)
+
+
+def test_unrotated_light():
+    pixels_x, pixels_y, leds = get_light_coordinates(N_LEDS, x=0.5, y=0.5, rot=0.0, scale=1.0)
+    width, height = int(CELLWIDTH * GUISCALE), int(N_LEDS * GUISCALE)
+    assert len(pixels_x) == width * height
+    assert (get_extent(pixels_x), get_extent(pixels_y)) == (width, height)
+
+    # leds run from top to bottom, the led of each row is taken at the center of the row
+    order = np.argsort(pixels_y, kind="stable")
+    assert leds[order][0] == 0 and leds[order][-1] == N_LEDS - 1
+    assert np.all(np.diff(leds[order]) >= 0)
+    assert np.array_equal(leds, ((pixels_y - pixels_y.min() + 0.5) / GUISCALE).astype(int))
+
+
+def test_rotated_light_swaps_extents():
+    pixels_x, pixels_y, leds = get_light_coordinates(N_LEDS, x=0.5, y=0.5, rot=90.0, scale=1.0)
+    width, height = int(CELLWIDTH * GUISCALE), int(N_LEDS * GUISCALE)
+    assert abs(get_extent(pixels_x) - height) <= 1
+    assert abs(get_extent(pixels_y) - width) <= 1
+
+    # rotated counterclockwise, the first led is on the left
+    assert leds[np.argmin(pixels_x)] == 0
+    assert leds[np.argmax(pixels_x)] == N_LEDS - 1
+
+
+def test_light_is_clipped_to_screen():
+    full_x, _, _ = get_light_coordinates(N_LEDS, x=0.5, y=0.5, rot=30.0, scale=1.0)
+    for x, y in [(0.0, 0.0), (1.0, 1.0), (0.0, 1.0)]:
+        pixels_x, pixels_y, leds = get_light_coordinates(N_LEDS, x=x, y=y, rot=30.0, scale=1.0)
+        assert 0 < len(pixels_x) < len(full_x)
+        assert pixels_x.min() >= 0 and pixels_x.max() < SCREENWIDTH
+        assert pixels_y.min() >= 0 and pixels_y.max() < SCREENHEIGHT
+        assert leds.min() >= 0 and leds.max() < N_LEDS